@@ -0,0 +1,13 @@
+import pygame
+from Logic.controls import Controls
+
+def read_controls(keys=None) -> Controls:
+    """WASD state from pygame.key.get_pressed() (or the `keys` given) as Controls."""
+    if keys is None:
+        keys = pygame.key.get_pressed()
+    return Controls(
+        up=bool(keys[pygame.K_w]),
+        down=bool(keys[pygame.K_s]),
+        left=bool(keys[pygame.K_a]),
+        right=bool(keys[pygame.K_d]),
+    )
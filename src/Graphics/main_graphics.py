@@ -1,6 +1,7 @@
 from .main_menu import Main_Menu
 from .developer_options import DeveloperOptions
 from .map_renderer import MapRenderer
+from .sprites import Sprites
 import pygame
 from Graphics.main_menu import SIZE_X,SIZE_Y
 
@@ -34,6 +35,8 @@ class MainGraphics:
         self.door_open_img = pygame.transform.scale(
             pygame.image.load("assets/Door_open.png").convert_alpha(), (40, 40)
         )
+        # player and guard sprites, shared by every character
+        self.sprites = Sprites()
 
     def draw_pre_game(self):
         """Display menu and allow player to configure settings."""
@@ -49,7 +52,8 @@ class MainGraphics:
         tile_size,
         player,
         enemies,
-        overlay=True
+        overlay=True,
+        level=None
     ):
         rows, cols = grid_size
         pixel_one_x, pixel_one_y = tile_size
@@ -67,7 +71,9 @@ class MainGraphics:
             enemies=enemies,
             player=player,
             screen=self.screen,
-            overlay=overlay
+            overlay=overlay,
+            level=level,
+            sprites=self.sprites
         )
         self.map_renderer.draw_map()
 
@@ -1,5 +1,8 @@
 import pygame
 from Graphics.main_menu import SIZE_X,SIZE_Y
+from Logic.grid import Grid
+from Logic.fixed_timestep import lerp_position
+from Graphics.sprites import Sprites
 
 class MapRenderer:
     """
@@ -9,7 +12,7 @@ class MapRenderer:
     def __init__(
         self,
         border_tuples,
-        matrix: list[list[int]],
+        matrix: Grid,
         grid_size: tuple[int, int],
         tile_size: tuple[float, float],
         crate_img: pygame.Surface,
@@ -20,7 +23,9 @@ class MapRenderer:
         enemies: list,
         player,  # player instance
         screen,  # external screen
-        overlay: bool = True
+        overlay: bool = True,
+        level=None,  # Logic.level_layers.LevelLayers
+        sprites: Sprites = None  # loaded here if not given
     ):
         self.screen = screen
         self.border_tuples = border_tuples
@@ -35,18 +40,28 @@ class MapRenderer:
         self.enemies = enemies
         self.player = player
         self.overlay = overlay
+        self.level = level
+        self.sprites = sprites if sprites is not None else Sprites()
 
     def toggle_overlay(self):
         self.overlay = not self.overlay
 
-    def draw_map(self):
-        """Draw the full map: tiles, overlay, then player and enemies."""
+    def draw_map(self, alpha: float = 1.0):
+        """
+        Draw the full map: tiles, overlay, then player and enemies.
+        alpha (0..1) interpolates the sprites between the last two sim steps.
+        """
         self.screen.fill((0, 0, 0))
 
         # Walls & hidden rooms
+        solid = self.level.solid if self.level is not None else None
         for r, c, x, y, w, h in self.border_tuples:
             val = self.matrix[r][c]
-            if val == 0:
+            if solid is not None:
+                is_wall = solid[r * self.GRID_COLS + c]
+            else:
+                is_wall = val == 0
+            if is_wall:
                 img = self.crate_img
             elif val == 3:
                 img = self.hidden_img
@@ -54,18 +69,9 @@ class MapRenderer:
                 continue
             self.screen.blit(pygame.transform.scale(img, (int(w), int(h))), (int(x), int(y)))
 
-        # Key & doors
-        for r in range(self.GRID_ROWS):
-            for c in range(self.GRID_COLS):
-                val = self.matrix[r][c]
-                if val == 4:
-                    img = self.key_img
-                elif val == 5:
-                    img = self.door_img
-                elif val == 6:
-                    img = self.door_open_img
-                else:
-                    continue
+        # Key & doors (a byte search over the grid instead of a per-tile loop)
+        for val, img in ((4, self.key_img), (5, self.door_img), (6, self.door_open_img)):
+            for c, r in self.matrix.find_all(val):
                 px = c * self.PIXEL_ONE_X
                 py = r * self.PIXEL_ONE_Y
                 self.screen.blit(img, (int(px), int(py)))
@@ -73,9 +79,13 @@ class MapRenderer:
         # Patrol overlay
         if self.overlay:
             colmap = {e.route_marker: e.route_color for e in self.enemies}
+            marks = self.level.overlay if self.level is not None else None
             for r in range(self.GRID_ROWS):
                 for c in range(self.GRID_COLS):
-                    mark = self.matrix[r][c]
+                    if marks is not None:
+                        mark = marks[r * self.GRID_COLS + c]
+                    else:
+                        mark = self.matrix[r][c]
                     if mark in colmap:
                         rect = pygame.Rect(
                             c * self.PIXEL_ONE_X,
@@ -87,23 +97,38 @@ class MapRenderer:
                         s.fill(colmap[mark])
                         self.screen.blit(s, rect.topleft)
 
+        # Guard vision cones, straight from the level's cone cache
+        if self.overlay and self.level is not None:
+            for en in self.enemies:
+                color = (255, 60, 60, 70) if en.state == "alert" else (255, 255, 160, 60)
+                for c, r in en.vision_cone():
+                    rect = pygame.Rect(
+                        c * self.PIXEL_ONE_X,
+                        r * self.PIXEL_ONE_Y,
+                        self.PIXEL_ONE_X,
+                        self.PIXEL_ONE_Y
+                    )
+                    s = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
+                    s.fill(color)
+                    self.screen.blit(s, rect.topleft)
+
         # Draw player & enemies on top
-        self._draw_player()
-        self._draw_enemies()
+        self._draw_player(alpha)
+        self._draw_enemies(alpha)
 
         # Update display
         pygame.display.flip()
 
-    def _draw_player(self):
+    def _draw_player(self, alpha=1.0):
         """Draws the player sprite at its current position."""
-        px, py = self.player.get_position()
+        px, py = lerp_position(self.player, alpha)
         # Draw at top-left to match collision
-        img = self.player.current_image
+        img = self.sprites.for_player(self.player)
         self.screen.blit(img, (px, py))
 
-    def _draw_enemies(self):
+    def _draw_enemies(self, alpha=1.0):
         for en in self.enemies:
-            ex, ey = en.get_position()
-            img = en.current_image
+            ex, ey = lerp_position(en, alpha)
+            img = self.sprites.for_enemy(en)
             w, h = img.get_width(), img.get_height()
             self.screen.blit(img, (ex - w/2, ey - h/2))
\ No newline at end of file
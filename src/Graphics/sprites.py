@@ -0,0 +1,25 @@
+import pygame
+
+DIRECTIONS = ('down', 'up', 'left', 'right')
+
+class Sprites:
+    """
+    Character sprites, loaded once and shared by every player and guard.
+    The logic objects only keep direction, current_frame and state; this
+    turns those into the surface to draw. Needs a display (convert_alpha).
+    """
+    def __init__(self, size=(40, 40)):
+        def load(name):
+            return pygame.transform.scale(
+                pygame.image.load(f"assets/{name}.png").convert_alpha(), size
+            )
+        self.player      = {d: [load(f"boy_{d}_{i}") for i in (1, 2)] for d in DIRECTIONS}
+        self.enemy       = {d: [load(f"enemy_{d}_{i}") for i in (1, 2)] for d in DIRECTIONS}
+        self.enemy_alert = {d: [load(f"enemy_{d}_alert_{i}") for i in (1, 2)] for d in DIRECTIONS}
+
+    def for_player(self, player) -> pygame.Surface:
+        return self.player[player.direction][player.current_frame]
+
+    def for_enemy(self, enemy) -> pygame.Surface:
+        sheet = self.enemy_alert if enemy.state == "alert" else self.enemy
+        return sheet[enemy.direction][enemy.current_frame]
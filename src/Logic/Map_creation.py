@@ -1,4 +1,6 @@
 import random
+from .grid import Grid
+
 T_WALL    = 0  # crate / wall
 T_FLOOR   = 1  # open floor
 T_PLAYER  = 2  # player start
@@ -7,41 +9,74 @@ T_KEY     = 4  # the key
 T_DOOR_C  = 5  # closed door
 T_DOOR_O  = 6  # opened door
 
+def is_walkable_tile(val: int) -> bool:
+    """
+    Guard walkability: floor (1), player start (2) and doors (5, 6).
+    Patrol markers (>= 7) live in LevelLayers.overlay now, but matrices
+    that still carry them count as walkable too.
+    """
+    return val == T_FLOOR or val == T_PLAYER or val >= T_DOOR_C
+
 class MapCreation:
     """
     Encapsulates maze generation logic: perfect DFS carve, optional loops, and hidden rooms.
+    All randomness comes from a private random.Random(seed), so one seed
+    always gives the same maze and generators can run side by side in
+    threads. seed=None draws a fresh one (see .seed).
     """
-    def __init__(self, difficulty: str, rows: int, cols: int, enemy_count: int):
+    def __init__(self, difficulty: str, rows: int, cols: int, enemy_count: int,
+                 seed: int | None = None):
         self.maze_difficulty = difficulty  # "easy" or "hard"
         self.BASE_ROWS = rows
         self.BASE_COLS = cols
         self.enemy_count = enemy_count
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        self.seed = seed
+        self.rng = random.Random(seed)
 
-    def create_maze_map(self) -> list[list[int]]:
+    def create_maze_map(self) -> Grid:
         """
-        Carve a perfect maze using recursive DFS on a grid of size BASE_ROWS x BASE_COLS.
-        Returns a 2D list with walls and floors.
+        Carve a perfect maze using DFS on a grid of size BASE_ROWS x BASE_COLS.
+        Returns a Grid with walls and floors.
+
+        The DFS runs on an explicit stack (an 80x80 maze is 6400 levels
+        deep, past the recursion limit and a worker thread's stack), but
+        visits cells exactly as the old recursive carve did: every cell
+        reshuffles the one shared `dirs` list, and a cell resumes its scan
+        at the same index in whatever order the list is in by then.
         """
         rows, cols = 2*self.BASE_ROWS + 1, 2*self.BASE_COLS + 1
-        maze = [[T_WALL for _ in range(cols)] for _ in range(rows)]
-        visited = [[False]*self.BASE_COLS for _ in range(self.BASE_ROWS)]
+        maze = Grid(rows, cols, fill=T_WALL)
+        visited = bytearray(self.BASE_ROWS * self.BASE_COLS)
         dirs = [(-1,0),(1,0),(0,-1),(0,1)]
+        shuffle = self.rng.shuffle
+        stack = []  # [r, c, next index into dirs]
 
-        def carve(r, c):
-            visited[r][c] = True
+        def enter(r, c):
+            visited[r*self.BASE_COLS + c] = 1
             maze[2*r+1][2*c+1] = T_FLOOR
-            random.shuffle(dirs)
-            for dr, dc in dirs:
-                nr, nc = r+dr, c+dc
-                if 0 <= nr < self.BASE_ROWS and 0 <= nc < self.BASE_COLS and not visited[nr][nc]:
-                    maze[2*r+1+dr][2*c+1+dc] = T_FLOOR
-                    carve(nr, nc)
+            shuffle(dirs)
+            stack.append([r, c, 0])
 
         # start carving from a random cell
-        carve(random.randrange(self.BASE_ROWS), random.randrange(self.BASE_COLS))
+        enter(self.rng.randrange(self.BASE_ROWS), self.rng.randrange(self.BASE_COLS))
+        while stack:
+            frame = stack[-1]
+            r, c, i = frame
+            if i == len(dirs):
+                stack.pop()
+                continue
+            frame[2] = i + 1
+            dr, dc = dirs[i]
+            nr, nc = r+dr, c+dc
+            if (0 <= nr < self.BASE_ROWS and 0 <= nc < self.BASE_COLS
+                    and not visited[nr*self.BASE_COLS + nc]):
+                maze[2*r+1+dr][2*c+1+dc] = T_FLOOR
+                enter(nr, nc)
         return maze
 
-    def add_loops_to_maze(self, maze: list[list[int]], p: float = 0.3) -> list[list[int]]:
+    def add_loops_to_maze(self, maze: Grid, p: float = 0.3) -> Grid:
         """
         In "easy" mode, randomly punch loops by turning some wall cells into floor
         where they connect two floor cells on opposite sides.
@@ -51,14 +86,14 @@ class MapCreation:
             for c in range(1, C-1):
                 if maze[r][c] == T_WALL:
                     # horizontal loop
-                    if maze[r][c-1] == T_FLOOR and maze[r][c+1] == T_FLOOR and random.random() < p:
+                    if maze[r][c-1] == T_FLOOR and maze[r][c+1] == T_FLOOR and self.rng.random() < p:
                         maze[r][c] = T_FLOOR
                     # vertical loop
-                    if maze[r-1][c] == T_FLOOR and maze[r+1][c] == T_FLOOR and random.random() < p:
+                    if maze[r-1][c] == T_FLOOR and maze[r+1][c] == T_FLOOR and self.rng.random() < p:
                         maze[r][c] = T_FLOOR
         return maze
 
-    def distribute_hidden_rooms(self, maze: list[list[int]], num_hidden_per_quadrant: int = 4) -> list[list[int]]:
+    def distribute_hidden_rooms(self, maze: Grid, num_hidden_per_quadrant: int = 4) -> Grid:
         """
         Place small "hidden rooms" (dead-end walls) in each quadrant. Marks them with T_HIDDEN.
         """
@@ -82,7 +117,7 @@ class MapCreation:
                         )
                         if cnt == 1:
                             candidates.append((r, c))
-            random.shuffle(candidates)
+            self.rng.shuffle(candidates)
             added = 0
             for r, c in candidates:
                 if added >= num_hidden_per_quadrant:
@@ -97,7 +132,7 @@ class MapCreation:
                 added += 1
         return maze
 
-    def generate_maze(self) -> list[list[int]]:
+    def generate_maze(self) -> Grid:
         """
         Full pipeline: carve, optionally add loops, then place hidden rooms.
         """
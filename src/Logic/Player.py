@@ -1,35 +1,13 @@
 # src/Logic/Player.py
 
-import pygame
-import time
 from .map_creation import T_FLOOR, T_KEY, T_HIDDEN, T_DOOR_C, T_DOOR_O, T_WALL
+from .controls import NO_INPUT
 
 class Player:
     def __init__(self, player_pos_x, player_pos_y, matrix, PIXEL_ONE_X, PIXEL_ONE_Y):
-        # Load & scale images for each direction (40×40)
-        self.images = {
-            'down': [
-                pygame.transform.scale(pygame.image.load("assets/boy_down_1.png").convert_alpha(), (40, 40)),
-                pygame.transform.scale(pygame.image.load("assets/boy_down_2.png").convert_alpha(), (40, 40)),
-            ],
-            'up': [
-                pygame.transform.scale(pygame.image.load("assets/boy_up_1.png").convert_alpha(), (40, 40)),
-                pygame.transform.scale(pygame.image.load("assets/boy_up_2.png").convert_alpha(), (40, 40)),
-            ],
-            'left': [
-                pygame.transform.scale(pygame.image.load("assets/boy_left_1.png").convert_alpha(), (40, 40)),
-                pygame.transform.scale(pygame.image.load("assets/boy_left_2.png").convert_alpha(), (40, 40)),
-            ],
-            'right': [
-                pygame.transform.scale(pygame.image.load("assets/boy_right_1.png").convert_alpha(), (40, 40)),
-                pygame.transform.scale(pygame.image.load("assets/boy_right_2.png").convert_alpha(), (40, 40)),
-            ],
-        }
-
         # Initial state
         self.direction = 'down'
-        self.current_frame = 0
-        self.current_image = self.images[self.direction][0]
+        self.current_frame = 0  # the renderer picks the sprite from direction and frame
 
         # World data
         self.matrix = matrix
@@ -39,6 +17,7 @@ class Player:
         # Position & movement
         self.pos_X = player_pos_x
         self.pos_Y = player_pos_y
+        self.prev_position = None  # position one sim step ago (render interpolation)
         self.speed = 2.5
 
         # Animation timing
@@ -52,19 +31,25 @@ class Player:
         self.game_over = False
         self.win = False
 
-    def move(self):
+        # called with (col, row) whenever move() rewrites a tile
+        self.on_tile_change = None
+
+        # level_layers.LevelLayers (set by LogicSetup); collisions read its bitmap
+        self.level = None
+
+    def move(self, controls=NO_INPUT):
+        """One step of movement for the held controls.Controls."""
         # Store previous for possible rollback
         prev_x, prev_y = self.pos_X, self.pos_Y
 
-        keys = pygame.key.get_pressed()
         dx = dy = 0
-        if keys[pygame.K_w]:
+        if controls.up:
             dy = -self.speed; self.direction = 'up'
-        if keys[pygame.K_s]:
+        if controls.down:
             dy =  self.speed; self.direction = 'down'
-        if keys[pygame.K_a]:
+        if controls.left:
             dx = -self.speed; self.direction = 'left'
-        if keys[pygame.K_d]:
+        if controls.right:
             dx =  self.speed; self.direction = 'right'
         if dx == 0 and dy == 0:
             return  # no movement
@@ -85,7 +70,7 @@ class Player:
 
         if tile == T_KEY:
             self.has_key = True
-            self.matrix[row][col] = T_FLOOR
+            self.set_tile(col, row, T_FLOOR)
 
         elif tile == T_HIDDEN:
             # keep hidden room intact
@@ -93,7 +78,7 @@ class Player:
 
         elif tile == T_DOOR_C:
             if self.has_key:
-                self.matrix[row][col] = T_DOOR_O
+                self.set_tile(col, row, T_DOOR_O)
             else:
                 # bump into closed door: rollback
                 self.pos_X, self.pos_Y = prev_x, prev_y
@@ -106,7 +91,12 @@ class Player:
         if self.frame_timer >= self.frames_per_step:
             self.frame_timer = 0
             self.current_frame = (self.current_frame + 1) % 2
-        self.current_image = self.images[self.direction][self.current_frame]
+
+    def set_tile(self, col, row, value):
+        """Rewrite one tile and let the level know its caches are stale."""
+        self.matrix[row][col] = value
+        if self.on_tile_change is not None:
+            self.on_tile_change((col, row))
 
     def check_collision(self, x, y):
         """
@@ -121,6 +111,10 @@ class Player:
         ]
         for cx, cy in corners:
             col, row = self.pixel_to_grid((cx, cy))
+            if self.level is not None:
+                if self.level.is_solid((col, row)):
+                    return True
+                continue
             # Out of bounds
             if not (0 <= row < len(self.matrix) and 0 <= col < len(self.matrix[0])):
                 return True
@@ -0,0 +1,98 @@
+# src/Logic/adjacency.py
+
+from array import array
+
+class Adjacency:
+    """
+    CSR-style neighbour table of the walkable cells, built once per level.
+
+    Cells are flat row-major indices (row * GRID_COLS + col). The walkable
+    neighbours of cell i are
+
+        targets[offsets[i] : offsets[i] + degree[i]]
+
+    in the usual order (col+1, col-1, row+1, row-1), so searches iterate
+    plain ints instead of building and bounds-checking tuples per step.
+
+    Each cell reserves a slot for every in-bounds neighbour that isn't
+    solid, because only those can ever become walkable (key pickup, doors).
+    That lets patch() rewrite a cell's row in place; if a change ever
+    needs more slots than reserved, the table is simply rebuilt.
+    """
+    def __init__(self, walkable, grid_rows: int, grid_cols: int, solid=None):
+        self.walkable  = walkable
+        self.solid     = solid
+        self.GRID_ROWS = grid_rows
+        self.GRID_COLS = grid_cols
+        self.builds    = 0
+        self.build()
+
+    def _around(self, i):
+        """In-bounds neighbour indices of i, in search order."""
+        C = self.GRID_COLS
+        r, c = divmod(i, C)
+        if c + 1 < C:
+            yield i + 1
+        if c > 0:
+            yield i - 1
+        if r + 1 < self.GRID_ROWS:
+            yield i + C
+        if r > 0:
+            yield i - C
+
+    def build(self):
+        self.builds += 1
+        n = self.GRID_ROWS * self.GRID_COLS
+        walkable, solid = self.walkable, self.solid
+        offsets = array('i', [0]) * (n + 1)
+        degree  = bytearray(n)
+        targets = array('i')
+        for i in range(n):
+            offsets[i] = len(targets)
+            if solid is not None and solid[i]:
+                continue
+            used = []
+            spare = 0
+            for j in self._around(i):
+                if walkable[i] and walkable[j]:
+                    used.append(j)
+                elif solid is None or not solid[j]:
+                    spare += 1
+            if solid is None:
+                spare = 0  # no solidity info: exact rows, patch() may rebuild
+            degree[i] = len(used)
+            targets.extend(used)
+            targets.extend([-1] * spare)
+        offsets[n] = len(targets)
+        self.offsets, self.degree, self.targets = offsets, degree, targets
+
+    def patch(self, cell):
+        """Walkability of `cell` changed: rewrite its row and its neighbours'."""
+        c, r = cell
+        i = r * self.GRID_COLS + c
+        for k in (i, *self._around(i)):
+            if not self._rewrite(k):
+                self.build()
+                return
+
+    def _rewrite(self, i) -> bool:
+        walkable = self.walkable
+        used = [j for j in self._around(i) if walkable[i] and walkable[j]]
+        start, end = self.offsets[i], self.offsets[i + 1]
+        if len(used) > end - start:
+            return False
+        self.targets[start:start + len(used)] = array('i', used)
+        self.degree[i] = len(used)
+        return True
+
+    def neighbors(self, i):
+        """Neighbour indices of cell index i, as an array slice."""
+        start = self.offsets[i]
+        return self.targets[start:start + self.degree[i]]
+
+    def cell_neighbors(self, cell):
+        """Walkable (col, row) neighbours of a walkable cell."""
+        C = self.GRID_COLS
+        for j in self.neighbors(cell[1] * C + cell[0]):
+            r, c = divmod(j, C)
+            yield (c, r)
@@ -0,0 +1,87 @@
+# src/Logic/ai_scheduler.py
+
+import heapq
+import time
+
+class AIScheduler:
+    """
+    Frame-budgeted queue of guard replans.
+
+    Guards call request(guard, priority) instead of replanning inline; the
+    lowest priority tuple goes first (Enemy uses (not alert, distance to
+    player), so alerted and nearby guards win). Once per frame run()
+    services requests by calling guard.replan() until `budget_ms` is used
+    up. Whatever is left waits for the next frame, and those guards keep
+    walking their previous plan meanwhile.
+
+    At least one request is serviced per frame so the queue always drains;
+    a frame whose work ran past the budget counts as an overrun.
+    """
+    def __init__(self, budget_ms: float = 2.0, clock=time.perf_counter):
+        self.budget_ms = budget_ms
+        self.clock     = clock
+        self.queue     = []   # heap of (priority, seq, guard)
+        self.pending   = {}   # id(guard) -> seq of its live heap entry
+        self.seq       = 0
+
+        # reporting
+        self.frames    = 0
+        self.serviced  = 0
+        self.deferred  = 0    # requests carried over, summed over frames
+        self.overruns  = 0
+        self.max_depth = 0
+        self.last_ms   = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self.pending)
+
+    def request(self, guard, priority=(0,)):
+        """Queue a replan for `guard`; a guard already waiting keeps its place."""
+        if id(guard) in self.pending:
+            return
+        self.seq += 1
+        self.pending[id(guard)] = self.seq
+        heapq.heappush(self.queue, (priority, self.seq, guard))
+        self.max_depth = max(self.max_depth, len(self.pending))
+
+    def cancel(self, guard):
+        """
+        Drop a queued request (e.g. the guard stopped chasing). Its heap
+        entry stays behind and is skipped when popped: only the entry whose
+        seq is in `pending` is live, so a later request starts afresh.
+        """
+        self.pending.pop(id(guard), None)
+
+    def run(self):
+        """Service queued replans until this frame's budget is spent."""
+        self.frames += 1
+        start = self.clock()
+        budget = self.budget_ms / 1000.0
+        done = 0
+        while self.queue:
+            if done and self.clock() - start >= budget:
+                break
+            _, seq, guard = heapq.heappop(self.queue)
+            if self.pending.get(id(guard)) != seq:
+                continue  # cancelled (maybe re-requested since)
+            del self.pending[id(guard)]
+            guard.replan()
+            done += 1
+        self.serviced += done
+        self.deferred += len(self.pending)
+        self.last_ms = (self.clock() - start) * 1000.0
+        if self.last_ms > self.budget_ms:
+            self.overruns += 1
+
+    def stats(self) -> dict:
+        return {
+            'queue_depth': self.queue_depth,
+            'max_depth':   self.max_depth,
+            'frames':      self.frames,
+            'serviced':    self.serviced,
+            'deferred':    self.deferred,
+            'overruns':    self.overruns,
+            'budget_ms':   self.budget_ms,
+            'last_ms':     self.last_ms,
+        }
@@ -0,0 +1,172 @@
+# src/Logic/autopilot.py
+
+import heapq
+from .controls import Controls, NO_INPUT
+from .map_creation import T_WALL, T_DOOR_C
+
+PLAYER_BOX = 30  # Player.check_collision tests corners x..x+29, y..y+29
+
+class Autopilot:
+    """
+    Bot player: plans start -> key -> door over LogicSetup.matrix and
+    steers Player with synthetic Controls, one call per sim step.
+
+    Routes are cheapest paths (Dijkstra) where every step costs 1, plus
+      - patrol_cost on each cell of a guard's compiled patrol lap, so it
+        prefers corridors no one patrols;
+      - danger_cost within danger_radius of where each guard is now and
+        where its lap takes it over the next `lookahead` cells, and on
+        the cells of its current vision cone.
+    Danger moves, so the route is replanned every `replan_every` steps,
+    and whenever the goal changes. Dangerous cells are expensive, not
+    forbidden: if the only way on is past a guard, it goes.
+
+    Usable as a batch_sim policy: Autopilot(logic, seed) then
+    autopilot(logic) -> Controls.
+    """
+    def __init__(self, logic, seed=None, replan_every: int = 15,
+                 patrol_cost: int = 3, danger_cost: int = 60,
+                 danger_radius: int = 2, lookahead: int = 6):
+        self.logic         = logic
+        self.replan_every  = replan_every
+        self.patrol_cost   = patrol_cost
+        self.danger_cost   = danger_cost
+        self.danger_radius = danger_radius
+        self.lookahead     = lookahead
+
+        self.path      = []     # cells still to walk, next one first
+        self.goal_cell = None
+        self.countdown = 0
+        self.plans     = 0      # profiling: routes planned
+
+        # static part of the cost: the guards' patrol laps
+        self.patrolled = set()
+        for en in logic.enemies:
+            self.patrolled.update(en.patrol_loop)
+
+    def goal(self):
+        """The key until we hold it, then the door (both (col, row))."""
+        logic = self.logic
+        return logic.door_pos if logic.player.has_key else logic.key_pos
+
+    def __call__(self, logic=None):
+        player = self.logic.player
+        # plan from the cell under the middle of the player box: the
+        # top-left corner can sit exactly on a tile edge
+        half = PLAYER_BOX / 2
+        cell = player.pixel_to_grid((player.pos_X + half, player.pos_Y + half))
+        goal = self.goal()
+        if goal != self.goal_cell or self.countdown <= 0 or not self.path:
+            self.goal_cell = goal
+            self.path = self.plan(cell, goal)
+            self.countdown = self.replan_every
+            if len(self.path) > 1 and self._lined_up(self.path[0], self.path[1]):
+                self.path.pop(0)  # already in the lane toward the next cell
+        self.countdown -= 1
+
+        # drop the cells we've already lined up on
+        while self.path and self._settled(self.path[0]):
+            self.path.pop(0)
+        if not self.path:
+            return NO_INPUT
+
+        target = self.path[0]
+        tx, ty = self.anchor(target)
+        dx, dy = tx - player.pos_X, ty - player.pos_Y
+        # near enough is fine, as long as the corner the game checks
+        # (key pickup, doors) is inside the cell
+        tol = player.speed / 2 if self._inside(target) else 0
+        return Controls(up=dy < -tol, down=dy > tol, left=dx < -tol, right=dx > tol)
+
+    def anchor(self, cell):
+        """Top-left player position that centres the player box in `cell`."""
+        logic = self.logic
+        c, r = cell
+        return (c * logic.PIXEL_ONE_X + (logic.PIXEL_ONE_X - PLAYER_BOX) / 2,
+                r * logic.PIXEL_ONE_Y + (logic.PIXEL_ONE_Y - PLAYER_BOX) / 2)
+
+    def _lined_up(self, cell, nxt):
+        """Is the player centred across the lane from `cell` to `nxt`?"""
+        player = self.logic.player
+        tx, ty = self.anchor(cell)
+        if nxt[1] == cell[1]:  # horizontal move: only the row has to match
+            return abs(ty - player.pos_Y) <= player.speed
+        return abs(tx - player.pos_X) <= player.speed
+
+    def _inside(self, cell):
+        player = self.logic.player
+        return player.pixel_to_grid(player.get_position()) == cell
+
+    def _settled(self, cell):
+        player = self.logic.player
+        tx, ty = self.anchor(cell)
+        return (abs(tx - player.pos_X) <= player.speed
+                and abs(ty - player.pos_Y) <= player.speed and self._inside(cell))
+
+    #region planning
+
+    def danger(self) -> dict:
+        """Extra cost per cell from where the guards are and are about to be."""
+        cost = {}
+        rad = self.danger_radius
+        for en in self.logic.enemies:
+            ahead = [en.pixel_to_grid(en.get_position())]
+            phase = en.patrol_phase()
+            if phase is not None:
+                loop = en.patrol_loop
+                k = phase[0]
+                for step in range(1, self.lookahead + 1):
+                    ahead.append(loop[(k + step) % (len(loop) - 1)])
+            reach = rad + 1 if en.state == "alert" else rad
+            for c0, r0 in ahead:
+                for dr in range(-reach, reach + 1):
+                    span = reach - abs(dr)
+                    for dc in range(-span, span + 1):
+                        cell = (c0 + dc, r0 + dr)
+                        cost[cell] = max(cost.get(cell, 0), self.danger_cost)
+            if en.level is not None:
+                for cell in en.vision_cone():
+                    cost[cell] = max(cost.get(cell, 0), self.danger_cost // 2)
+        return cost
+
+    def plan(self, start, goal):
+        """Cheapest 4-neighbour path start -> goal (both included), or []."""
+        self.plans += 1
+        logic = self.logic
+        matrix, R, C = logic.matrix, logic.GRID_ROWS, logic.GRID_COLS
+        danger = self.danger()
+        patrolled, patrol_cost = self.patrolled, self.patrol_cost
+
+        dist = {start: 0}
+        parent = {start: None}
+        heap = [(0, start)]
+        while heap:
+            d, cell = heapq.heappop(heap)
+            if cell == goal:
+                break
+            if d > dist[cell]:
+                continue
+            c, r = cell
+            for nb in ((c + 1, r), (c - 1, r), (c, r + 1), (c, r - 1)):
+                nc, nr = nb
+                if not (0 <= nc < C and 0 <= nr < R):
+                    continue
+                tile = matrix[nr][nc]
+                if tile == T_WALL or (tile == T_DOOR_C and nb != goal):
+                    continue
+                nd = d + 1 + danger.get(nb, 0) + (patrol_cost if nb in patrolled else 0)
+                if nd < dist.get(nb, float('inf')):
+                    dist[nb] = nd
+                    parent[nb] = cell
+                    heapq.heappush(heap, (nd, nb))
+        if goal not in parent:
+            return []
+        path = []
+        cell = goal
+        while cell is not None:
+            path.append(cell)
+            cell = parent[cell]
+        path.reverse()
+        return path  # starts with `start`: line up in it before moving on
+
+    #endregion
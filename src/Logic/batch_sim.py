@@ -0,0 +1,207 @@
+# src/Logic/batch_sim.py
+"""
+Headless batch simulator: plays many generated levels across a process
+pool and folds the per-game results into one summary.
+
+    python -m Logic.batch_sim --sizes 8 12 16 --enemies 2 4 --seeds 100
+
+Each game is described by a spec (difficulty, rows, cols, enemy_count,
+seed) and played by a named policy (see POLICIES) until the player wins,
+is caught, or max_ticks runs out. Results stream back as games finish;
+--jsonl writes each one out as it arrives.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .controls import Controls, NO_INPUT
+from .logic_setup import LogicSetup
+from .autopilot import Autopilot
+from .replay import frozen_clock
+
+MOVES = (
+    Controls(up=True), Controls(down=True),
+    Controls(left=True), Controls(right=True),
+)
+
+#region policies
+
+class IdlePolicy:
+    """Never moves: measures the guards alone."""
+    def __init__(self, logic, seed):
+        pass
+
+    def __call__(self, logic):
+        return NO_INPUT
+
+class RandomWalkPolicy:
+    """Holds a random direction for a random number of ticks, then picks again."""
+    def __init__(self, logic, seed, min_hold=5, max_hold=40):
+        self.rng = random.Random(seed)
+        self.min_hold, self.max_hold = min_hold, max_hold
+        self.controls, self.left = NO_INPUT, 0
+
+    def __call__(self, logic):
+        if self.left <= 0:
+            self.controls = self.rng.choice(MOVES)
+            self.left = self.rng.randint(self.min_hold, self.max_hold)
+        self.left -= 1
+        return self.controls
+
+# name -> factory(logic, seed) returning a callable(logic) -> Controls;
+# workers look policies up by name, so only the name has to be pickled
+POLICIES = {
+    'idle':   IdlePolicy,
+    'random': RandomWalkPolicy,
+    'autopilot': Autopilot,
+}
+
+#endregion
+
+#region one game
+
+def play_game(spec, policy: str = 'random', max_ticks: int = 20000) -> dict:
+    """Generate and play one level headless; returns its result row."""
+    difficulty, rows, cols, enemy_count, seed = spec
+    start = time.perf_counter()
+    # a clock that never advances (the one replays use): every replan is
+    # serviced, so a game plays the same however loaded the machine is
+    logic = LogicSetup(difficulty, rows, cols, enemy_count, clock=frozen_clock, seed=seed)
+    logic.generate_game()
+    gen_s = time.perf_counter() - start
+
+    driver = POLICIES[policy](logic, seed)
+    result = {'won': False, 'lost': False}
+    alert_ticks = 0
+    start = time.perf_counter()
+    while logic.ticks < max_ticks:
+        result = logic.step(driver(logic))
+        alert_ticks += sum(1 for en in logic.enemies if en.state == "alert")
+        if result['won'] or result['lost']:
+            break
+    sim_s = time.perf_counter() - start
+
+    pathfinder = logic.pathfinder
+    planners = [en.planner for en in logic.enemies if en.planner is not None]
+    return {
+        'difficulty':     difficulty,
+        'rows':           rows,
+        'cols':           cols,
+        'enemy_count':    enemy_count,
+        'seed':           seed,
+        'policy':         policy,
+        'won':            result['won'],
+        'captured':       result['lost'],
+        'timeout':        not (result['won'] or result['lost']),
+        'ticks':          logic.ticks,
+        'alert_ticks':    alert_ticks,
+        'searches':       getattr(pathfinder, 'searches', 0),
+        'nodes_expanded': getattr(pathfinder, 'nodes_expanded', 0),
+        'replans':        sum(p.replans for p in planners),
+        'flow_builds':    logic.flow_field.builds,
+        'gen_ms':         gen_s * 1000.0,
+        'sim_ms':         sim_s * 1000.0,
+    }
+
+#endregion
+
+#region batches
+
+def level_specs(difficulties, sizes, enemy_counts, seeds):
+    """Every (difficulty, rows, cols, enemy_count, seed) combination; square mazes."""
+    for difficulty, size, enemies, seed in itertools.product(
+            difficulties, sizes, enemy_counts, seeds):
+        yield (difficulty, size, size, enemies, seed)
+
+def run_batch(specs, policy: str = 'random', max_ticks: int = 20000, workers=None):
+    """
+    Play every spec, yielding result rows as games finish (not in spec
+    order). workers=1 plays them in this process, which is easier to
+    debug and profile; None uses one worker per core.
+    """
+    if workers == 1:
+        for spec in specs:
+            yield play_game(spec, policy, max_ticks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_game, spec, policy, max_ticks) for spec in specs]
+        for future in as_completed(futures):
+            yield future.result()
+
+class Summary:
+    """Running aggregate of result rows, overall and per difficulty."""
+    TOTALS = ('ticks', 'alert_ticks', 'searches', 'nodes_expanded',
+              'replans', 'flow_builds', 'gen_ms', 'sim_ms')
+
+    def __init__(self):
+        self.groups = {}
+
+    def add(self, row: dict):
+        for key in ('all', row['difficulty']):
+            group = self.groups.setdefault(key, dict.fromkeys(
+                ('games', 'won', 'captured', 'timeout') + self.TOTALS, 0))
+            group['games'] += 1
+            group['won'] += row['won']
+            group['captured'] += row['captured']
+            group['timeout'] += row['timeout']
+            for field in self.TOTALS:
+                group[field] += row[field]
+
+    def report(self) -> dict:
+        out = {}
+        for key, group in self.groups.items():
+            games = group['games']
+            out[key] = {
+                'games':          games,
+                'win_rate':       group['won'] / games,
+                'capture_rate':   group['captured'] / games,
+                'timeout_rate':   group['timeout'] / games,
+                'mean_ticks':     group['ticks'] / games,
+                'ticks_per_s':    group['ticks'] / (group['sim_ms'] / 1000.0 or 1e-9),
+                'mean_gen_ms':    group['gen_ms'] / games,
+                **{field: group[field] for field in
+                   ('alert_ticks', 'searches', 'nodes_expanded', 'replans', 'flow_builds')},
+            }
+        return out
+
+#endregion
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--difficulty', nargs='+', default=['easy', 'hard'])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[8, 12, 16])
+    parser.add_argument('--enemies', nargs='+', type=int, default=[2, 4])
+    parser.add_argument('--seeds', type=int, default=10, help='seeds 0..N-1 per combination')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='random')
+    parser.add_argument('--max-ticks', type=int, default=20000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--jsonl', help='stream every game result to this file')
+    args = parser.parse_args(argv)
+
+    specs = list(level_specs(args.difficulty, args.sizes, args.enemies, range(args.seeds)))
+    summary = Summary()
+    out = open(args.jsonl, 'w') if args.jsonl else None
+    start = time.perf_counter()
+    try:
+        for n, row in enumerate(run_batch(specs, args.policy, args.max_ticks, args.workers), 1):
+            summary.add(row)
+            if out:
+                out.write(json.dumps(row) + '\n')
+            print(f"\r{n}/{len(specs)} games", end='', file=sys.stderr)
+    finally:
+        if out:
+            out.close()
+    print(file=sys.stderr)
+    report = summary.report()
+    report['wall_s'] = time.perf_counter() - start
+    print(json.dumps(report, indent=2))
+    return report
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+# src/Logic/controls.py
+
+from collections import namedtuple
+
+# What the player is holding this sim step. The graphics layer builds it
+# from the keyboard (Graphics.input.read_controls); bots and replays can
+# build it directly, so the logic never needs pygame.
+Controls = namedtuple('Controls', ['up', 'down', 'left', 'right'],
+                      defaults=(False, False, False, False))
+
+NO_INPUT = Controls()
@@ -0,0 +1,188 @@
+# src/Logic/corridor_graph.py
+
+import heapq
+from .pathfinding import Pathfinder
+
+class CorridorGraph(Pathfinder):
+    """
+    Pathfinding on a compressed maze graph.
+
+    Generated mazes are mostly 1-wide corridors, so every walkable cell
+    with exactly two walkable neighbours is folded into a weighted edge
+    between the junctions / dead ends at its ends. Dijkstra then runs over
+    those few nodes, and the winning node sequence is expanded back into
+    cells from the stored corridor cell lists.
+
+    The graph is built once per level and rebuilt lazily after invalidate().
+    """
+    name = 'corridor'
+
+    def __init__(self, grid_rows: int, grid_cols: int, passable):
+        super().__init__(grid_rows, grid_cols, passable)
+        self.dirty = True
+        self.builds = 0
+
+    def invalidate(self, cell=None):
+        self.dirty = True
+
+    #region graph construction
+
+    def build(self):
+        """Find nodes, then walk every corridor leaving them once."""
+        self.dirty = False
+        self.builds += 1
+
+        self.node_of  = {}    # cell -> node id
+        self.nodes    = []    # node id -> cell
+        self.adj      = []    # node id -> [(other node, weight, edge id)]
+        self.edges    = []    # edge id -> (u, v, interior cells from u to v)
+        self.edge_of  = {}    # corridor cell -> (edge id, index in interior)
+
+        degree = {}
+        for r in range(self.GRID_ROWS):
+            for c in range(self.GRID_COLS):
+                if self.passable(c, r):
+                    degree[(c, r)] = sum(1 for _ in self.neighbors((c, r)))
+
+        for cell, deg in degree.items():
+            if deg != 2:
+                self._add_node(cell)
+        for node in range(len(self.nodes)):
+            self._walk_corridors(node)
+
+        # loops made only of corridor cells have no natural node: pin one
+        for cell in degree:
+            if cell not in self.node_of and cell not in self.edge_of:
+                self._walk_corridors(self._add_node(cell))
+
+    def _add_node(self, cell):
+        node = len(self.nodes)
+        self.node_of[cell] = node
+        self.nodes.append(cell)
+        self.adj.append([])
+        return node
+
+    def _walk_corridors(self, node):
+        origin = self.nodes[node]
+        for first in self.neighbors(origin):
+            if first in self.edge_of:
+                continue  # corridor already walked from its other end
+            if first in self.node_of:
+                # two nodes side by side: one edge without interior
+                other = self.node_of[first]
+                if other > node:
+                    continue  # added when walking from `other`
+                self._add_edge(node, other, [])
+                continue
+            interior, prev, cur = [], origin, first
+            while cur not in self.node_of:
+                interior.append(cur)
+                self.edge_of[cur] = None  # claimed; filled in by _add_edge
+                prev, cur = cur, next(nb for nb in self.neighbors(cur) if nb != prev)
+            self._add_edge(node, self.node_of[cur], interior)
+
+    def _add_edge(self, u, v, interior):
+        edge = len(self.edges)
+        self.edges.append((u, v, interior))
+        for i, cell in enumerate(interior):
+            self.edge_of[cell] = (edge, i)
+        weight = len(interior) + 1
+        self.adj[u].append((v, weight, edge))
+        if v != u:
+            self.adj[v].append((u, weight, edge))
+
+    #region queries
+
+    def _anchors(self, cell):
+        """
+        The graph nodes a cell hangs off, as [(node, steps, cells walked)].
+        A node is its own anchor; a corridor cell reaches both ends.
+        """
+        if cell in self.node_of:
+            return [(self.node_of[cell], 0, [])]
+        edge, i = self.edge_of[cell]
+        u, v, interior = self.edges[edge]
+        toward_u = interior[i-1::-1] if i else []
+        toward_v = interior[i+1:]
+        return [(u, i + 1, toward_u), (v, len(interior) - i, toward_v)]
+
+    def _search(self, start, goal):
+        if self.dirty:
+            self.build()
+
+        best, best_path = None, None
+
+        # both ends on the same corridor: walking straight along it may win
+        if start in self.edge_of and goal in self.edge_of:
+            (es, i), (eg, j) = self.edge_of[start], self.edge_of[goal]
+            if es == eg:
+                interior = self.edges[es][2]
+                step = 1 if j > i else -1
+                best = abs(j - i)
+                best_path = interior[i:j + step:step] if j + step >= 0 else interior[i::step]
+
+        # a self-loop corridor anchors twice to one node: keep the cheaper
+        sources, targets = {}, {}
+        for node, cost, cells in self._anchors(start):
+            if node not in sources or cost < sources[node][0]:
+                sources[node] = (cost, cells)
+        for node, cost, cells in self._anchors(goal):
+            if node not in targets or cost < targets[node][0]:
+                targets[node] = (cost, cells)
+
+        dist, came = {}, {}
+        heap = []
+        for node, (cost, cells) in sources.items():
+            dist[node] = cost
+            came[node] = None
+            heapq.heappush(heap, (cost, node))
+
+        reached = None
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            if best is not None and d >= best:
+                break
+            self.nodes_expanded += 1
+            if node in targets:
+                total = d + targets[node][0]
+                if best is None or total < best:
+                    best, reached = total, node
+            for other, weight, edge in self.adj[node]:
+                nd = d + weight
+                if nd < dist.get(other, nd + 1):
+                    dist[other] = nd
+                    came[other] = (node, edge)
+                    heapq.heappush(heap, (nd, other))
+
+        if reached is None:
+            return best_path or []
+        return self._expand(start, goal, sources, reached, came, targets)
+
+    def _expand(self, start, goal, sources, reached, came, targets):
+        """Turn the node chain ending at `reached` back into grid cells."""
+        chain = []
+        node = reached
+        while came[node] is not None:
+            prev, edge = came[node]
+            chain.append((prev, node, edge))
+            node = prev
+        chain.reverse()
+        first = node
+
+        path = [start]
+        path.extend(sources[first][1])
+        if path[-1] != self.nodes[first]:
+            path.append(self.nodes[first])
+
+        for u, v, edge in chain:
+            a, b, interior = self.edges[edge]
+            path.extend(interior if a == u else interior[::-1])
+            path.append(self.nodes[v])
+
+        tail = targets[reached][1]
+        path.extend(reversed(tail))
+        if path[-1] != goal:
+            path.append(goal)
+        return path
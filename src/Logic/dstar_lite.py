@@ -0,0 +1,167 @@
+# src/Logic/dstar_lite.py
+
+import heapq
+
+INF = float('inf')
+
+class DStarLite:
+    """
+    Incremental planner for one chasing guard (D* Lite, Koenig & Likhachev).
+
+    g / rhs hold each cell's distance to the goal (the player's cell). When
+    the player steps to another cell only the old and new goal cells are
+    re-evaluated, and when a tile changes only that cell and its neighbours
+    are; compute() then repairs just the part of the search that actually
+    changed instead of starting over. The guard's own moves are absorbed by
+    the key modifier km, so following the plan costs nothing.
+    """
+    def __init__(self, grid_rows: int, grid_cols: int, passable):
+        self.GRID_ROWS = grid_rows
+        self.GRID_COLS = grid_cols
+        self.passable  = passable
+
+        self.goal  = None
+        self.start = None
+        self.km    = 0
+        self.g     = {}
+        self.rhs   = {}
+        self.queue = []   # heap of (key, cell); stale entries skipped
+        self.open  = {}   # cell -> its current key in the queue
+
+        # profiling counters
+        self.expansions = 0
+        self.replans    = 0
+
+    #region helpers
+
+    def in_bounds(self, cell):
+        c, r = cell
+        return 0 <= c < self.GRID_COLS and 0 <= r < self.GRID_ROWS
+
+    def around(self, cell):
+        c, r = cell
+        for nb in ((c+1, r), (c-1, r), (c, r+1), (c, r-1)):
+            if self.in_bounds(nb):
+                yield nb
+
+    def neighbors(self, cell):
+        for nb in self.around(cell):
+            if self.passable(*nb):
+                yield nb
+
+    def h(self, a, b):
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def key(self, cell):
+        m = min(self.g.get(cell, INF), self.rhs.get(cell, INF))
+        return (m + self.h(self.start, cell) + self.km, m)
+
+    def update_vertex(self, cell):
+        if cell == self.goal:
+            self.rhs[cell] = 0 if self.passable(*cell) else INF
+        else:
+            if self.passable(*cell):
+                self.rhs[cell] = min((1 + self.g.get(nb, INF) for nb in self.neighbors(cell)),
+                                     default=INF)
+            else:
+                self.rhs[cell] = INF
+        if self.g.get(cell, INF) != self.rhs.get(cell, INF):
+            k = self.key(cell)
+            self.open[cell] = k
+            heapq.heappush(self.queue, (k, cell))
+        else:
+            self.open.pop(cell, None)
+
+    #region events
+
+    def set_goal(self, cell) -> bool:
+        """Point the plan at `cell`; returns True if the goal moved."""
+        if cell == self.goal:
+            return False
+        self.replans += 1
+        if self.goal is None or self.start is None:
+            self.goal  = cell
+            self.km    = 0
+            self.g, self.rhs = {}, {}
+            self.queue, self.open = [], {}
+            if self.start is not None:
+                self.update_vertex(cell)
+            return True
+        old, self.goal = self.goal, cell
+        self.update_vertex(old)
+        self.update_vertex(cell)
+        return True
+
+    def tile_changed(self, cell):
+        """A tile's walkability changed: re-evaluate it and its neighbours."""
+        if self.goal is None or self.start is None:
+            return
+        self.replans += 1
+        self.update_vertex(cell)
+        for nb in self.around(cell):
+            self.update_vertex(nb)
+
+    def move_start(self, cell):
+        """The guard moved; fold the heuristic shift into km."""
+        if self.start is None:
+            self.start = cell
+            if self.goal is not None:
+                self.update_vertex(self.goal)
+            return
+        if cell != self.start:
+            self.km += self.h(self.start, cell)
+            self.start = cell
+
+    #region planning
+
+    def compute(self):
+        start = self.start
+        while self.queue:
+            k_old, u = self.queue[0]
+            if self.open.get(u) != k_old:
+                heapq.heappop(self.queue)  # stale entry
+                continue
+            if k_old >= self.key(start) and self.rhs.get(start, INF) == self.g.get(start, INF):
+                break
+            heapq.heappop(self.queue)
+            self.expansions += 1
+            k_new = self.key(u)
+            if k_old < k_new:
+                self.open[u] = k_new
+                heapq.heappush(self.queue, (k_new, u))
+            elif self.g.get(u, INF) > self.rhs.get(u, INF):
+                self.g[u] = self.rhs[u]
+                del self.open[u]
+                for nb in self.around(u):
+                    self.update_vertex(nb)
+            else:
+                self.g[u] = INF
+                self.update_vertex(u)
+                for nb in self.around(u):
+                    self.update_vertex(nb)
+
+    def next_step(self, cell):
+        """
+        The neighbour of `cell` one step closer to the goal, `cell` itself
+        at the goal, or None if the goal can't be reached.
+        """
+        if self.goal is None or not self.passable(*cell):
+            return None
+        self.move_start(cell)
+        self.compute()
+        if self.g.get(cell, INF) == INF:
+            return None
+        if cell == self.goal:
+            return cell
+        return min(self.neighbors(cell), key=lambda nb: self.g.get(nb, INF))
+
+    def path(self, cell, limit=None):
+        """Follow next_step from `cell` to the goal (for tests / debugging)."""
+        out = [cell]
+        limit = limit or self.GRID_ROWS * self.GRID_COLS
+        while out[-1] != self.goal and len(out) <= limit:
+            step = self.next_step(out[-1])
+            if step is None:
+                return []
+            out.append(step)
+        return out
@@ -1,9 +1,12 @@
 # src/Logic/enemy.py
 
 import math
-import time
+from bisect import bisect_right
 from collections import deque
-import pygame
+from .map_creation import is_walkable_tile
+from .pathfinding import BFSPathfinder
+from .dstar_lite import DStarLite
+from .visibility import bresenham
 
 class Enemy:
     def __init__(
@@ -28,95 +31,34 @@ class Enemy:
 
         #state & movement
         self.position = position  # pixel coords (x, y)
+        self.prev_position = None  # position one sim step ago (render interpolation)
         self.patrol_speed = move_speed
         self.alert_speed = 2.6
+        # kept for callers; chase replanning is now event driven (see move_alert)
         self.update_interval = update_interval
-        self.last_update_time = time.time()
         self.matrix = matrix
 
-        #load normal enemy images
-        self.images = {
-            'down': [
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_down_1.png").convert_alpha(), (40, 40)
-                ),
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_down_2.png").convert_alpha(), (40, 40)
-                )
-            ],
-            'up': [
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_up_1.png").convert_alpha(), (40, 40)
-                ),
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_up_2.png").convert_alpha(), (40, 40)
-                )
-            ],
-            'left': [
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_left_1.png").convert_alpha(), (40, 40)
-                ),
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_left_2.png").convert_alpha(), (40, 40)
-                )
-            ],
-            'right': [
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_right_1.png").convert_alpha(), (40, 40)
-                ),
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_right_2.png").convert_alpha(), (40, 40)
-                )
-            ]
-        }
-
-        # load alert (chasing) images
-        self.alert_images = {
-            'down': [
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_down_alert_1.png").convert_alpha(), (40, 40)
-                ),
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_down_alert_2.png").convert_alpha(), (40, 40)
-                )
-            ],
-            'up': [
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_up_alert_1.png").convert_alpha(), (40, 40)
-                ),
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_up_alert_2.png").convert_alpha(), (40, 40)
-                )
-            ],
-            'left': [
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_left_alert_1.png").convert_alpha(), (40, 40)
-                ),
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_left_alert_2.png").convert_alpha(), (40, 40)
-                )
-            ],
-            'right': [
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_right_alert_1.png").convert_alpha(), (40, 40)
-                ),
-                pygame.transform.scale(
-                    pygame.image.load("assets/enemy_right_alert_2.png").convert_alpha(), (40, 40)
-                )
-            ]
-        }
-
         # animation
         self.frames_per_step = 10
         self.frame_timer = 0
         self.current_frame = 0
+        # the renderer picks the sprite from state, direction and current_frame
         self.direction = 'down'
-        self.current_image = self.images[self.direction][self.current_frame]
 
         #patrol and alert data
         self.complete_patrol_route = patrol_route  #list of (col,row)
         self.patrol_index = 0
-        self.path = []  #the BFS path in alert mode
+        self.patrol_steps = {}  #(waypoint index, cell) -> next cell
+        self.patrol_steps_route = None  #the route patrol_steps was compiled for
+        self.patrol_next = None  #cell whose centre we're walking to, until we reach it
+        self.patrol_loop = []  #every cell of one full lap, first == last
+        self.patrol_loop_legs = []  #segment k (loop[k] -> loop[k+1]) -> its leg index
+        self.patrol_loop_ticks = None  #(speed, tick prefix sums, moves per segment)
+        self.lod_lag = 0  #ticks skipped while far away (see LogicSetup.update)
+        self.path = []  #next cells to walk in alert mode
+        self.planner = None  #our own DStarLite, created on the first chase
+        self.chase_target = None  #player cell the current chase plan aims at
+        self.scheduler = None  #ai_scheduler.AIScheduler (set by LogicSetup); None = replan inline
 
         # AI state
         self.state = "patrol"  #or "alert"
@@ -126,6 +68,18 @@ class Enemy:
         self.route_marker = None
         self.route_color = None
 
+        # shared level data (set by LogicSetup)
+        self.level = None  #level_layers.LevelLayers; without it we read self.matrix
+        self.flow_field = None
+
+        # any pathfinding.Pathfinder; LogicSetup swaps in the level's engine
+        self.pathfinder = BFSPathfinder(
+            grid_rows, grid_cols, lambda c, r: self.is_walkable((c, r))
+        )
+
+        if patrol_route:
+            self.set_patrol_route(patrol_route)
+
     def update(self, player_pos):
         """
         Called each frame: decide whether to patrol or chase,
@@ -137,11 +91,11 @@ class Enemy:
 
         # if player is hidden, always patrol
         if self.matrix[player_cell[1]][player_cell[0]] == 3:
-            self.state = "patrol"
+            self.end_chase()
             self.move_patrol_area()
 
-        # if player is near, go alert
-        elif manhattan <= 2:
+        # if the player is right next to us or inside our vision cone, go alert
+        elif self.spots_player(player_cell, manhattan):
             if self.state != "alert":
                 self.state = "alert"
                 self.patrol_index_backup = self.patrol_index
@@ -149,7 +103,7 @@ class Enemy:
 
         # if chasing but player escaped far away, resume patrol
         elif self.state == "alert" and manhattan > 5:
-            self.state = "patrol"
+            self.end_chase()
             if self.patrol_index_backup is not None:
                 self.patrol_index = self.patrol_index_backup
             # if stuck, find nearest walkable
@@ -167,19 +121,41 @@ class Enemy:
             else:
                 self.move_patrol_area()
 
-        # mark overlay cell
-        col, row = self.pixel_to_grid(self.position)
-        if self.route_marker is not None:
-            self.matrix[row][col] = self.route_marker
+        # mark overlay cell (never the terrain: that would hide keys/doors)
+        if self.route_marker is not None and self.level is not None:
+            self.level.mark(self.pixel_to_grid(self.position), self.route_marker)
+
+    def vision_cone(self):
+        """Cells in front of us we can see (cached per cell and facing), or empty."""
+        if self.level is None:
+            return frozenset()
+        return self.level.vision.cone(self.pixel_to_grid(self.position), self.direction)
+
+    def spots_player(self, player_cell, manhattan):
+        """
+        With a level: the player is adjacent, or in our vision cone.
+        Without one (bare enemies in tests): the old 2-step Manhattan radius.
+        """
+        if self.level is None:
+            return manhattan <= 2
+        return manhattan <= 1 or player_cell in self.vision_cone()
 
     def can_see_player(self, player_pos):
         """
         Bresenham line-of-sight: if any wall (0) in between, return False.
+        With a level, nearby pairs are one bit test in its VisibilitySet.
         """
         start = self.pixel_to_grid(self.position)
         end = self.pixel_to_grid(player_pos)
+        if self.level is not None:
+            seen = self.level.visibility.visible(start, end)
+            if seen is not None:
+                return seen
         for c, r in self.line_of_sight(start[0], start[1], end[0], end[1]):
-            if self.matrix[r][c] == 0:
+            if self.level is not None:
+                if self.level.is_solid((c, r)):
+                    return False
+            elif self.matrix[r][c] == 0:
                 return False
         return True
 
@@ -187,32 +163,7 @@ class Enemy:
         """
         Bresenham's algorithm: yields all (col,row) between two cells.
         """
-        cells = []
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        x, y = x0, y0
-        sx = 1 if x1 > x0 else -1
-        sy = 1 if y1 > y0 else -1
-        if dx > dy:
-            err = dx / 2
-            while x != x1:
-                cells.append((x, y))
-                err -= dy
-                if err < 0:
-                    y += sy
-                    err += dx
-                x += sx
-        else:
-            err = dy / 2
-            while y != y1:
-                cells.append((x, y))
-                err -= dx
-                if err < 0:
-                    x += sx
-                    err += dy
-                y += sy
-        cells.append((x1, y1))
-        return cells
+        return bresenham(x0, y0, x1, y1)
 
     def go_to_point(self, target_pixel):
         """
@@ -241,37 +192,19 @@ class Enemy:
 
     def find_path_between(self, start, goal):
         """
-        BFS from start to goal on walkable cells.
+        Shortest path from start to goal on walkable cells.
         Returns list of cells from start to goal inclusive.
         """
-        if not self.is_walkable(start) or not self.is_walkable(goal):
-            return []
-        queue = deque([start])
-        came_from = {start: None}
-        visited = {start}
-        while queue:
-            cur = queue.popleft()
-            if cur == goal:
-                break
-            for nb in self.get_neighbors(cur):
-                if nb not in visited and self.is_walkable(nb):
-                    visited.add(nb)
-                    came_from[nb] = cur
-                    queue.append(nb)
-        if goal not in came_from:
-            return []
-        path = []
-        node = goal
-        while node is not None:
-            path.append(node)
-            node = came_from[node]
-        return list(reversed(path))
+        return self.pathfinder.find_path(start, goal)
 
     def find_nearest_walkable(self):
         """
-        BFS outward until a walkable cell is found.
+        BFS outward until a walkable cell is found. With a level this is
+        a lookup in its precomputed nearest-walkable map instead.
         """
         start = self.pixel_to_grid(self.position)
+        if self.level is not None:
+            return self.level.nearest.lookup(start)
         if self.is_walkable(start):
             return start
         queue = deque([start])
@@ -286,6 +219,170 @@ class Enemy:
                     queue.append(nb)
         return None
 
+    def set_patrol_route(self, route):
+        """
+        Assign a patrol route and compile it into a step table, so that
+        move_patrol_area is a dict lookup instead of a BFS per frame.
+
+        Leg i is the shortest path from waypoint i-1 to waypoint i; every
+        cell on it maps (i, cell) -> the next cell toward waypoint i.
+        """
+        self.complete_patrol_route = route
+        self.patrol_index = 0
+        self.patrol_steps = {}
+        self.patrol_steps_route = route
+        self.patrol_next = None
+        n = len(route)
+        legs = []
+        for i in range(n):
+            prev_cell, target_cell = route[i - 1], route[i]
+            if (abs(prev_cell[0] - target_cell[0]) + abs(prev_cell[1] - target_cell[1]) == 1
+                    and self.is_walkable(prev_cell) and self.is_walkable(target_cell)):
+                # generated routes are mostly single steps: no search needed
+                leg = [prev_cell, target_cell]
+            else:
+                leg = self.find_path_between(prev_cell, target_cell)
+            if len(leg) < 2:
+                # same cell twice, or unreachable: head straight for it
+                leg = [prev_cell, target_cell]
+            for a, b in zip(leg, leg[1:]):
+                self.patrol_steps[(i, a)] = b
+            self.patrol_steps[(i, target_cell)] = target_cell
+            legs.append(leg)
+        self._compile_patrol_loop(legs)
+
+    #region patrol fast-forward (simulation LOD)
+
+    def _compile_patrol_loop(self, legs):
+        """
+        Lay one lap out as segments between cell centres. A guard starting
+        at waypoint 0 walks legs 1, 2, ..., n-1 and then leg 0 back home.
+        """
+        self.patrol_loop, self.patrol_loop_legs = [], []
+        self._seg_from, self._seg_into = {}, {}
+        self.patrol_loop_ticks = None
+        if not legs:
+            return
+        order = list(range(1, len(legs))) + [0]
+        loop = [legs[order[0]][0]]
+        for i in order:
+            for cell in legs[i][1:]:
+                k = len(loop) - 1
+                self._seg_from.setdefault((i, loop[-1]), k)
+                self._seg_into.setdefault((i, cell), k)
+                self.patrol_loop_legs.append(i)
+                loop.append(cell)
+        self.patrol_loop = loop
+
+    def _loop_ticks(self):
+        """
+        Tick prefix sums for the current patrol_speed. move_patrol_area
+        covers a segment of length L in floor(L / speed) moves plus the tick
+        that snaps onto the next centre, so that is what a segment costs.
+        """
+        speed = self.patrol_speed
+        if self.patrol_loop_ticks is None or self.patrol_loop_ticks[0] != speed:
+            prefix, moves = [0], []
+            for a, b in zip(self.patrol_loop, self.patrol_loop[1:]):
+                m = int(self._segment_length(a, b) // speed)
+                moves.append(m)
+                prefix.append(prefix[-1] + m + 1)
+            self.patrol_loop_ticks = (speed, prefix, moves)
+        return self.patrol_loop_ticks
+
+    def _segment_length(self, a, b):
+        return math.hypot((b[0] - a[0]) * self.PIXEL_ONE_X, (b[1] - a[1]) * self.PIXEL_ONE_Y)
+
+    def patrol_phase(self):
+        """
+        Where we are on the lap as (segment, ticks into it), or None when
+        we're not patrolling our compiled route (then only update() works).
+        """
+        if (self.state != "patrol" or len(self.patrol_loop) < 2
+                or self.patrol_steps_route is not self.complete_patrol_route):
+            return None
+        i = self.patrol_index
+        if self.patrol_next is None:
+            # standing on a centre, about to leave it
+            cell = self.pixel_to_grid(self.position)
+            if self.position != self.grid_to_pixel(cell):
+                return None
+            k = self._seg_from.get((i, cell))
+            if k is not None:
+                return k, 0
+            # or on waypoint i itself, with the snap that advances past it due
+            k = self._seg_into.get((i, cell))
+            if k is None:
+                return None
+            return k, self._loop_ticks()[2][k]
+        k = self._seg_into.get((i, self.patrol_next))
+        if k is None:
+            return None
+        ax, ay = self.grid_to_pixel(self.patrol_loop[k])
+        bx, by = self.grid_to_pixel(self.patrol_next)
+        px, py = self.position
+        done = math.hypot(px - ax, py - ay)
+        # must be somewhere on the segment itself, not off to the side
+        if abs(done + math.hypot(bx - px, by - py) - math.hypot(bx - ax, by - ay)) > 1e-6:
+            return None
+        _, _, moves = self._loop_ticks()
+        return k, min(round(done / self.patrol_speed), moves[k])
+
+    def fast_forward(self, ticks: int) -> bool:
+        """
+        Jump `ticks` patrol ticks ahead in closed form: prefix sums of the
+        per-segment tick costs plus a binary search, instead of calling
+        move_patrol_area that many times. Returns False (and does nothing)
+        when we aren't on the compiled route.
+        """
+        phase = self.patrol_phase()
+        if phase is None:
+            return False
+        k, t = phase
+        _, prefix, moves = self._loop_ticks()
+        lap = prefix[-1]
+        now = (prefix[k] + t + ticks) % lap
+        k = bisect_right(prefix, now) - 1
+        t = now - prefix[k]
+
+        a, b = self.patrol_loop[k], self.patrol_loop[k + 1]
+        ax, ay = self.grid_to_pixel(a)
+        bx, by = self.grid_to_pixel(b)
+        seg = math.hypot(bx - ax, by - ay)
+        moved = min(t * self.patrol_speed, seg)
+        if seg:
+            self.position = (ax + (bx - ax) * moved / seg, ay + (by - ay) * moved / seg)
+        else:
+            self.position = (ax, ay)
+        # facing follows the last segment with length that the skipped
+        # ticks walked (zero-length ones, i.e. repeated waypoints, keep it,
+        # as in move_patrol_area); if there was none, it stays as it is
+        j, into, left = k, t, ticks
+        for _ in range(len(moves) + 1):
+            if left <= 0:
+                break
+            if into:
+                (fax, fay), (fbx, fby) = (self.grid_to_pixel(self.patrol_loop[j]),
+                                          self.grid_to_pixel(self.patrol_loop[j + 1]))
+                if (fax, fay) != (fbx, fby):
+                    self._face(fbx - fax, fby - fay)
+                    break
+            left -= into
+            j = (j - 1) % len(moves)
+            into = prefix[j + 1] - prefix[j]
+        self.patrol_index = self.patrol_loop_legs[k]
+        self.patrol_next = b if t else None
+
+        # the walk animation advances one timer step per tick too
+        steps = self.frame_timer + ticks
+        self.frame_timer = steps % self.frames_per_step
+        self.current_frame = (self.current_frame + steps // self.frames_per_step) % 2
+        if self.route_marker is not None and self.level is not None:
+            self.level.mark(self.pixel_to_grid(self.position), self.route_marker)
+        return True
+
+    #endregion
+
     def move_patrol_area(self):
         """
         Follow the precomputed patrol route in complete_patrol_route.
@@ -296,35 +393,55 @@ class Enemy:
             self.patrol_index = 0
         target_cell = self.complete_patrol_route[self.patrol_index]
         start_cell = self.pixel_to_grid(self.position)
-        path = self.find_path_between(start_cell, target_cell)
-        if len(path) >= 2:
-            next_cell = path[1]
-        else:
-            next_cell = target_cell
+
+        compiled = self.patrol_steps_route is self.complete_patrol_route
+        next_cell = self.patrol_next if compiled else None
+        if next_cell is None and compiled:
+            next_cell = self.patrol_steps.get((self.patrol_index, start_cell))
+        if next_cell is None:
+            # off the compiled route (e.g. pushed away while chasing): BFS back
+            path = self.find_path_between(start_cell, target_cell)
+            if len(path) >= 2:
+                next_cell = path[1]
+            else:
+                next_cell = target_cell
+        advance = next_cell == target_cell or not compiled
+
         next_px = self.grid_to_pixel(next_cell)
         dx = next_px[0] - self.position[0]
         dy = next_px[1] - self.position[1]
         dist = math.hypot(dx, dy)
         if dist < self.patrol_speed:
             self.position = next_px
-            self.patrol_index = (self.patrol_index + 1) % len(self.complete_patrol_route)
+            self.patrol_next = None
+            if advance:
+                self.patrol_index = (self.patrol_index + 1) % len(self.complete_patrol_route)
         else:
             self.position = (
                 self.position[0] + dx / dist * self.patrol_speed,
                 self.position[1] + dy / dist * self.patrol_speed
             )
+            # keep heading for this centre even once we're over the next
+            # tile, so the walk is centre to centre and never cuts corners
+            self.patrol_next = next_cell if compiled else None
         self.update_animation(dx, dy)
 
     def move_alert(self, player_pos):
         if not self.can_see_player(player_pos):
-            self.state = "patrol"
+            self.end_chase()
             self.move_patrol_area()
             return
 
-        now = time.time()
-        if not self.path or now - self.last_update_time >= self.update_interval:
-            self.find_path(player_pos)
-            self.last_update_time = now
+        player_cell = self.pixel_to_grid(player_pos)
+        self.chase_target = player_cell
+        if self.flow_field is not None and self.flow_field.root == player_cell:
+            # the shared field already points at the player: O(1) next step
+            stale = not self.path
+        else:
+            # our own incremental plan, repaired only when the player changes cell
+            stale = not self.path or self.planner is None or self.planner.goal != player_cell
+        if stale:
+            self.request_replan()
 
         if not self.path:
             return
@@ -350,65 +467,86 @@ class Enemy:
                         target_px[1] - self.position[1]) < self.alert_speed:
                 self.path.pop(0)
         else:
-            # bump into obstacle, force a replan next call
+            # bump into obstacle: drop the step, the plan itself is still valid
             self.path = []
 
         # 5) Update sprite direction/frame
         self.update_animation(dx, dy)
 
-    def find_path(self, player_pos):
+    def request_replan(self):
         """
-        BFS from current position to player's cell, store in self.path.
+        Replan now, or, with a scheduler, queue the replan (alerted and
+        nearer guards first) and keep walking the current path until then.
         """
-        start = self.pixel_to_grid(self.position)
-        goal = self.pixel_to_grid(player_pos)
-        self.path = []
-        if not self.is_walkable(start) or not self.is_walkable(goal):
+        if self.scheduler is None:
+            self.replan()
             return
-        queue = deque([start])
-        came_from = {start: None}
-        visited = {start}
-        while queue:
-            cur = queue.popleft()
-            if cur == goal:
-                break
-            for nb in self.get_neighbors(cur):
-                if nb not in visited and self.is_walkable(nb):
-                    visited.add(nb)
-                    came_from[nb] = cur
-                    queue.append(nb)
-        if goal not in came_from:
+        cell = self.pixel_to_grid(self.position)
+        target = self.chase_target
+        dist = abs(cell[0] - target[0]) + abs(cell[1] - target[1])
+        self.scheduler.request(self, (self.state != "alert", dist))
+
+    def end_chase(self):
+        """Back to patrolling; a replan still queued for the chase is dropped."""
+        if self.state == "alert":
+            self.patrol_next = None
+            if self.scheduler is not None:
+                self.scheduler.cancel(self)
+        self.state = "patrol"
+
+    def replan(self):
+        """Refresh self.path toward chase_target (called directly or by the scheduler)."""
+        if self.chase_target is None:
             return
-        # reconstruct
-        rev = []
-        node = goal
-        while node is not None:
-            rev.append(node)
-            node = came_from[node]
-        self.path = list(reversed(rev))
+        if self.flow_field is not None and self.flow_field.root == self.chase_target:
+            self.path = self.next_steps(self.flow_field.next_step)
+            return
+        if self.planner is None:
+            self.planner = DStarLite(self.GRID_ROWS, self.GRID_COLS, self.pathfinder.passable)
+        self.planner.set_goal(self.chase_target)
+        self.path = self.next_steps(self.planner.next_step)
 
-    def update_animation(self, dx, dy):
+    def next_steps(self, next_step):
         """
-        Set self.direction and pick the correct frame/image.
+        Ask `next_step` (flow field or planner) for the next cell toward
+        the player. If we're still off-centre in our own cell, centre on it first.
         """
-        # determine direction
+        cell = self.pixel_to_grid(self.position)
+        step = next_step(cell)
+        if step is None:
+            return []
+        cx, cy = self.grid_to_pixel(cell)
+        if step != cell and math.hypot(cx - self.position[0], cy - self.position[1]) >= self.alert_speed:
+            return [cell, step]
+        return [step]
+
+    def find_path(self, player_pos):
+        """
+        Shortest path from current position to player's cell, store in self.path.
+        """
+        start = self.pixel_to_grid(self.position)
+        goal = self.pixel_to_grid(player_pos)
+        self.path = self.pathfinder.find_path(start, goal)
+
+    def _face(self, dx, dy):
+        """Turn toward a move of (dx, dy); a zero-length one keeps the facing."""
         if abs(dx) > abs(dy):
             self.direction = 'right' if dx > 0 else 'left'
-        else:
+        elif dy:
             self.direction = 'down' if dy > 0 else 'up'
 
+    def update_animation(self, dx, dy):
+        """
+        Set self.direction and step the walk frame.
+        """
+        self._face(dx, dy)
+
         # advance frame timer
         self.frame_timer += 1
         if self.frame_timer >= self.frames_per_step:
             self.frame_timer = 0
             self.current_frame = (self.current_frame + 1) % 2
 
-        # pick correct image set
-        if self.state == "alert":
-            self.current_image = self.alert_images[self.direction][self.current_frame]
-        else:
-            self.current_image = self.images[self.direction][self.current_frame]
-
     def get_neighbors(self, cell):
         c, r = cell
         nbrs = [(c+1,r),(c-1,r),(c,r+1),(c,r-1)]
@@ -425,6 +563,8 @@ class Enemy:
 
         # compute grid cell
         col, row = self.pixel_to_grid((x, y))
+        if self.level is not None:
+            return self.level.is_solid((col, row))
         # out of bounds?
         if not self.in_bounds((col, row)):
             return True
@@ -433,13 +573,15 @@ class Enemy:
 
     def is_walkable(self, cell):
         """
-        Walkable if floor (1), player start (2), open door (>=5), or overlay markers (>=5).
+        Walkable if floor (1), player start (2) or a door (>=5).
+        Reads the level's walkability bitmap when we have one.
         """
+        if self.level is not None:
+            return self.level.is_walkable(cell)
         c, r = cell
         if not self.in_bounds(cell):
             return False
-        val = self.matrix[r][c]
-        return (val == 1 or val == 2 or val >= 5)
+        return is_walkable_tile(self.matrix[r][c])
 
     def in_bounds(self, cell):
         c, r = cell
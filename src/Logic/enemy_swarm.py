@@ -0,0 +1,165 @@
+# src/Logic/enemy_swarm.py
+
+import numpy as np
+
+# direction codes used in the arrays
+DIRECTIONS = ('up', 'down', 'left', 'right')
+_DIR_CODE = {name: i for i, name in enumerate(DIRECTIONS)}
+
+class EnemySwarm:
+    """
+    Struct-of-arrays driver for patrolling guards; needs NumPy.
+
+    Positions, speeds, lap segments, ticks into the segment and animation
+    counters of every guard live in flat arrays, and step() advances all
+    the guards it drives in one vectorized pass per tick, using the same
+    per-segment tick model as Enemy.fast_forward (so the result is exactly
+    what move_patrol_area would have done).
+
+    The Enemy objects stay the API: after each step the new state is
+    written back into them for the renderer, collision checks and tests.
+    The swarm only drives guards that are patrolling their compiled route
+    and are further than `near_cells` (Manhattan) from the player; step()
+    hands back the rest for a normal Enemy.update(), after which sync()
+    reads them back in.
+
+    Segment tables depend on each guard's patrol route and speed, so call
+    rebuild() after changing either.
+    """
+    def __init__(self, enemies, near_cells: int = 12):
+        self.enemies    = list(enemies)
+        self.near_cells = near_cells
+        self.rebuild()
+
+    def rebuild(self):
+        """(Re)build the segment tables and pick up every guard's state."""
+        ens = self.enemies
+        n = len(ens)
+        if n:
+            self.tile = np.array([ens[0].PIXEL_ONE_X, ens[0].PIXEL_ONE_Y], dtype=np.float64)
+        else:
+            self.tile = np.ones(2)
+
+        # one row per lap segment, all guards' laps back to back
+        a, b, b_cell, leg, nxt, prv, owner = [], [], [], [], [], [], []
+        self.base = np.zeros(n, dtype=np.int64)  # guard -> its first segment
+        for g, en in enumerate(ens):
+            self.base[g] = len(a)
+            loop = en.patrol_loop
+            k = len(loop) - 1
+            for s in range(k):
+                a.append(en.grid_to_pixel(loop[s]))
+                b.append(en.grid_to_pixel(loop[s + 1]))
+                b_cell.append(loop[s + 1])
+                leg.append(en.patrol_loop_legs[s])
+                nxt.append(len(a) if s + 1 < k else self.base[g])
+                prv.append(len(a) - 2 if s else self.base[g] + k - 1)
+                owner.append(g)
+        self.seg_a     = np.array(a, dtype=np.float64).reshape(-1, 2)
+        self.seg_b     = np.array(b, dtype=np.float64).reshape(-1, 2)
+        self.seg_cells = b_cell  # (col, row) tuples, handed out as patrol_next
+        self.seg_leg   = np.array(leg, dtype=np.int64)
+        self.seg_next  = np.array(nxt, dtype=np.int64)
+        self.seg_prev  = np.array(prv, dtype=np.int64)
+
+        delta = self.seg_b - self.seg_a
+        self.seg_len = np.hypot(delta[:, 0], delta[:, 1])
+        horizontal = np.abs(delta[:, 0]) > np.abs(delta[:, 1])
+        # -1 on zero-length segments (repeated waypoints): walking one
+        # keeps the facing, as in Enemy.update_animation
+        self.seg_dir = np.where(
+            self.seg_len == 0, -1,
+            np.where(
+                horizontal,
+                np.where(delta[:, 0] > 0, _DIR_CODE['right'], _DIR_CODE['left']),
+                np.where(delta[:, 1] > 0, _DIR_CODE['down'], _DIR_CODE['up']),
+            ),
+        ).astype(np.int8)
+
+        # per-guard state
+        self.speed   = np.array([en.patrol_speed for en in ens], dtype=np.float64)
+        self.fps     = np.array([en.frames_per_step for en in ens], dtype=np.int64)
+        # ticks a segment takes: floor(len / speed) moves + the snap
+        self.seg_moves = np.floor(
+            self.seg_len / self.speed[np.array(owner, dtype=np.int64)]
+        ).astype(np.int64) if owner else np.zeros(0, dtype=np.int64)
+
+        self.pos     = np.zeros((n, 2), dtype=np.float64)
+        self.seg     = np.zeros(n, dtype=np.int64)
+        self.tick    = np.zeros(n, dtype=np.int64)
+        self.timer   = np.zeros(n, dtype=np.int64)
+        self.frame   = np.zeros(n, dtype=np.int64)
+        self.active  = np.zeros(n, dtype=bool)  # on its lap, ours to drive
+        for g in range(n):
+            self.sync(g)
+
+    def sync(self, g):
+        """Read guard g back in after something else moved it."""
+        en = self.enemies[g]
+        self.pos[g] = en.position
+        self.timer[g] = en.frame_timer
+        self.frame[g] = en.current_frame
+        phase = en.patrol_phase()
+        self.active[g] = phase is not None
+        if phase is not None:
+            self.seg[g] = self.base[g] + phase[0]
+            self.tick[g] = phase[1]
+
+    def step(self, player_cell):
+        """
+        Advance every driven guard by one tick and write them back.
+        Returns the indices of the guards that still need Enemy.update().
+        """
+        cells = np.floor(self.pos / self.tile).astype(np.int64)
+        dist = np.abs(cells[:, 0] - player_cell[0]) + np.abs(cells[:, 1] - player_cell[1])
+        drive = self.active & (dist > self.near_cells)
+        idx = np.flatnonzero(drive)
+        if idx.size:
+            self._advance(idx)
+            self._write_back(idx)
+        return np.flatnonzero(~drive).tolist()
+
+    def _advance(self, idx):
+        seg = self.seg[idx]
+        tick = self.tick[idx] + 1
+        done = tick > self.seg_moves[seg]
+        seg = np.where(done, self.seg_next[seg], seg)
+        tick[done] = 0
+
+        length = self.seg_len[seg]
+        moved = np.minimum(tick * self.speed[idx], length)
+        frac = np.divide(moved, length, out=np.zeros_like(moved), where=length > 0)
+        a = self.seg_a[seg]
+        self.pos[idx] = a + (self.seg_b[seg] - a) * frac[:, None]
+        self.seg[idx] = seg
+        self.tick[idx] = tick
+
+        timer = self.timer[idx] + 1
+        flip = timer >= self.fps[idx]
+        timer[flip] = 0
+        self.timer[idx] = timer
+        self.frame[idx] = (self.frame[idx] + flip) % 2
+
+    def _write_back(self, idx):
+        seg, tick = self.seg[idx], self.tick[idx]
+        # facing follows the segment walked this tick (tick 0: the snap
+        # that finished the previous one)
+        dirs = self.seg_dir[np.where(tick == 0, self.seg_prev[seg], seg)].tolist()
+        nxt = np.where(tick > 0, seg, -1).tolist()
+        legs = self.seg_leg[seg].tolist()
+        pos = self.pos[idx].tolist()
+        timer = self.timer[idx].tolist()
+        frame = self.frame[idx].tolist()
+        cells = self.seg_cells
+        for j, g in enumerate(idx.tolist()):
+            en = self.enemies[g]
+            x, y = pos[j]
+            en.position = (x, y)
+            en.patrol_index = legs[j]
+            en.patrol_next = cells[nxt[j]] if nxt[j] >= 0 else None
+            if dirs[j] >= 0:
+                en.direction = DIRECTIONS[dirs[j]]
+            en.frame_timer = timer[j]
+            en.current_frame = frame[j]
+            if en.route_marker is not None and en.level is not None:
+                en.level.mark(en.pixel_to_grid(en.position), en.route_marker)
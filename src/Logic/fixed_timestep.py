@@ -0,0 +1,73 @@
+# src/Logic/fixed_timestep.py
+
+import time
+
+class FixedTimestep:
+    """
+    Fixed-timestep driver for the simulation.
+
+    Each rendered frame, advance() adds the real time that passed to an
+    accumulator and returns how many whole sim steps of 1/step_hz seconds
+    to run, so the game plays at the same speed however fast frames are
+    drawn and the same inputs always give the same run. What is left
+    over is exposed as `alpha` (0..1), how far the renderer should
+    interpolate from the previous sim state towards the current one.
+
+    At most `max_steps` are run per frame; time beyond that is dropped
+    (slow motion) rather than snowballing after a hitch or a pause.
+
+    With `steps_per_frame` set, the clock is ignored and every frame runs
+    exactly that many steps (fast-forward for tests and bots).
+    """
+    def __init__(self, step_hz: float = 60.0, clock=time.perf_counter,
+                 max_steps: int = 5, steps_per_frame: int | None = None):
+        self.dt              = 1.0 / step_hz
+        self.clock           = clock
+        self.max_steps       = max_steps
+        self.steps_per_frame = steps_per_frame
+        self.accumulator     = 0.0
+        self.alpha           = 0.0
+        self.steps           = 0  # sim steps taken so far
+        self.last            = None
+
+    def reset(self):
+        """Forget the time that passed (e.g. while paused)."""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.last = None
+
+    def advance(self) -> int:
+        """Sim steps to run before drawing this frame."""
+        if self.steps_per_frame is not None:
+            self.alpha = 1.0
+            self.steps += self.steps_per_frame
+            return self.steps_per_frame
+
+        now = self.clock()
+        if self.last is None:
+            self.last = now
+        self.accumulator += now - self.last
+        self.last = now
+
+        n = int(self.accumulator / self.dt)
+        if n > self.max_steps:
+            n = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= n * self.dt
+        self.alpha = self.accumulator / self.dt
+        self.steps += n
+        return n
+
+
+def lerp_position(entity, alpha: float):
+    """
+    Where to draw `entity` between its last two sim states. Entities
+    without a prev_position are drawn where they are.
+    """
+    x1, y1 = entity.get_position()
+    prev = getattr(entity, 'prev_position', None)
+    if prev is None or alpha >= 1.0:
+        return (x1, y1)
+    x0, y0 = prev
+    return (x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha)
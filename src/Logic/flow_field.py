@@ -0,0 +1,118 @@
+# src/Logic/flow_field.py
+
+from collections import deque
+from .map_creation import is_walkable_tile
+
+UNREACHED = -1
+
+class FlowField:
+    """
+    Level-wide BFS distance map rooted at the player's cell.
+
+    LogicSetup moves the root once per frame; the field is only rebuilt
+    (lazily, on the first query) when the root actually changed cell or the
+    tiles were invalidated. Every chasing guard then reads its next step
+    in O(1) instead of running its own BFS.
+    """
+    def __init__(self, matrix, grid_rows: int, grid_cols: int, walkable=None,
+                 adjacency=None):
+        self.matrix    = matrix
+        # flat row-major walkability bitmap (LevelLayers.walkable); without
+        # one, each rebuild classifies the matrix itself
+        self.walkable  = walkable
+        # optional adjacency.Adjacency over the same bitmap
+        self.adjacency = adjacency
+        self.GRID_ROWS = grid_rows
+        self.GRID_COLS = grid_cols
+
+        self.root  = None   # (col, row) the field points toward
+        self.dist  = [UNREACHED] * (grid_rows * grid_cols)
+        self.dirty = True
+
+        # how often the field was actually rebuilt
+        self.builds = 0
+
+    def set_root(self, cell):
+        """Point the field at `cell`; marks it dirty only on a cell change."""
+        if cell != self.root:
+            self.root  = cell
+            self.dirty = True
+
+    def invalidate(self):
+        """Tiles changed (key pickup, door opening): rebuild on next query."""
+        self.dirty = True
+
+    def rebuild(self):
+        """Full BFS outward from the root over guard-walkable cells."""
+        R, C = self.GRID_ROWS, self.GRID_COLS
+        dist = [UNREACHED] * (R * C)
+        self.dist  = dist
+        self.dirty = False
+        self.builds += 1
+
+        if self.root is None:
+            return
+        walk = self.walkable
+        if walk is None:
+            walk = bytearray(is_walkable_tile(v) for row in self.matrix for v in row)
+        c, r = self.root
+        if not (0 <= c < C and 0 <= r < R) or not walk[r * C + c]:
+            return
+
+        start = r * C + c
+        dist[start] = 0
+        q = deque([start])
+        adj = self.adjacency
+        if adj is not None:
+            offsets, degree, targets = adj.offsets, adj.degree, adj.targets
+            while q:
+                i = q.popleft()
+                d = dist[i] + 1
+                k = offsets[i]
+                for j in targets[k:k + degree[i]]:
+                    if dist[j] == UNREACHED:
+                        dist[j] = d; q.append(j)
+            return
+        while q:
+            i = q.popleft()
+            r, c = divmod(i, C)
+            d = dist[i] + 1
+            if c + 1 < C and dist[i+1] == UNREACHED and walk[i+1]:
+                dist[i+1] = d; q.append(i+1)
+            if c > 0 and dist[i-1] == UNREACHED and walk[i-1]:
+                dist[i-1] = d; q.append(i-1)
+            if r + 1 < R and dist[i+C] == UNREACHED and walk[i+C]:
+                dist[i+C] = d; q.append(i+C)
+            if r > 0 and dist[i-C] == UNREACHED and walk[i-C]:
+                dist[i-C] = d; q.append(i-C)
+
+    def distance(self, cell) -> int:
+        """Steps from `cell` to the root, or UNREACHED."""
+        if self.dirty:
+            self.rebuild()
+        c, r = cell
+        if not (0 <= c < self.GRID_COLS and 0 <= r < self.GRID_ROWS):
+            return UNREACHED
+        return self.dist[r * self.GRID_COLS + c]
+
+    def next_step(self, cell):
+        """
+        The neighbour of `cell` one step closer to the root, `cell` itself
+        if it is the root, or None if the root can't be reached from it.
+        """
+        d = self.distance(cell)
+        if d == UNREACHED:
+            return None
+        if d == 0:
+            return cell
+        c, r = cell
+        C, dist = self.GRID_COLS, self.dist
+        i = r * C + c
+        # same neighbour order as Enemy.get_neighbors
+        if c + 1 < C and dist[i+1] == d - 1:
+            return (c+1, r)
+        if c > 0 and dist[i-1] == d - 1:
+            return (c-1, r)
+        if r + 1 < self.GRID_ROWS and dist[i+C] == d - 1:
+            return (c, r+1)
+        return (c, r-1)
@@ -0,0 +1,146 @@
+# src/Logic/grid.py
+
+class Grid:
+    """
+    Tile matrix stored as one flat bytearray, one byte per tile, row-major.
+
+    Drop-in for the old list-of-lists: grid[row] is a writable memoryview
+    of that row, so grid[row][col] reads and writes like before, and
+    len(grid) / len(grid[0]) give rows / cols. Hot loops can skip the row
+    hop and index grid.data[row * grid.stride + col] directly.
+
+    A 500x500 level is 250 KB of tile data, where a list of lists costs
+    an 8-byte pointer per tile plus the row lists.
+    """
+    __slots__ = ('rows', 'cols', 'stride', 'data', '_view', '_rows')
+
+    def __init__(self, rows: int, cols: int, fill: int = 0, data=None):
+        self.rows   = rows
+        self.cols   = cols
+        self.stride = cols
+        if data is None:
+            data = bytearray([fill]) * (rows * cols)
+        elif len(data) != rows * cols:
+            raise ValueError(f"expected {rows * cols} bytes, got {len(data)}")
+        self.data  = data
+        self._view = memoryview(data)
+        self._rows = [self._view[r * cols:(r + 1) * cols] for r in range(rows)]
+
+    @classmethod
+    def from_rows(cls, rows) -> "Grid":
+        """Build from any sequence of equal-length rows (e.g. a list of lists)."""
+        rows = list(rows)
+        cols = len(rows[0]) if rows else 0
+        data = bytearray()
+        for row in rows:
+            if len(row) != cols:
+                raise ValueError("rows must all have the same length")
+            data.extend(row)
+        return cls(len(rows), cols, data=data)
+
+    #region list-of-lists compatibility
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        """grid[r] -> writable row view; grid[r0:r1] -> list of row views."""
+        return self._rows[row]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __eq__(self, other):
+        if isinstance(other, Grid):
+            return (self.rows, self.cols) == (other.rows, other.cols) and self.data == other.data
+        try:
+            return self.to_lists() == [list(row) for row in other]
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Grid({self.rows}x{self.cols})"
+
+    #endregion
+
+    #region accessors
+
+    def in_bounds(self, col: int, row: int) -> bool:
+        return 0 <= col < self.cols and 0 <= row < self.rows
+
+    def index(self, col: int, row: int) -> int:
+        return row * self.stride + col
+
+    def get(self, col: int, row: int, default=None):
+        """Tile at (col, row), or `default` outside the grid."""
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.data[row * self.stride + col]
+        return default
+
+    def set(self, col: int, row: int, value: int):
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            raise IndexError(f"({col}, {row}) outside {self.cols}x{self.rows} grid")
+        self.data[row * self.stride + col] = value
+
+    def row(self, row: int, col0: int = 0, col1=None) -> memoryview:
+        """Zero-copy view of one row (optionally cols col0..col1-1)."""
+        return self._rows[row][col0:col1]
+
+    def rows_block(self, row0: int, row1: int) -> memoryview:
+        """Zero-copy view of whole rows row0..row1-1, flat."""
+        return self._view[row0 * self.stride:row1 * self.stride]
+
+    def column(self, col: int, row0: int = 0, row1=None) -> bytes:
+        """Copy of one column (optionally rows row0..row1-1)."""
+        row1 = self.rows if row1 is None else row1
+        return bytes(self.data[row0 * self.stride + col:row1 * self.stride:self.stride])
+
+    def set_column(self, col: int, values, row0: int = 0):
+        end = (row0 + len(values)) * self.stride
+        self.data[row0 * self.stride + col:end:self.stride] = bytes(values)
+
+    def count(self, value: int) -> int:
+        return self.data.count(value)
+
+    def find(self, value: int, row0: int = 0, row1=None):
+        """(col, row) of the first `value` in rows row0..row1-1, or None."""
+        end = (self.rows if row1 is None else row1) * self.stride
+        i = self.data.find(value, row0 * self.stride, end)
+        if i == -1:
+            return None
+        r, c = divmod(i, self.stride)
+        return (c, r)
+
+    def find_all(self, value: int):
+        """Yield (col, row) of every tile equal to `value`, in row-major order."""
+        i = self.data.find(value)
+        while i != -1:
+            r, c = divmod(i, self.stride)
+            yield (c, r)
+            i = self.data.find(value, i + 1)
+
+    #endregion
+
+    #region conversions
+
+    def __reduce__(self):
+        # memoryviews don't pickle; rebuild them on the other side
+        return (Grid, (self.rows, self.cols, 0, bytearray(self.data)))
+
+    def copy(self) -> "Grid":
+        return Grid(self.rows, self.cols, data=bytearray(self.data))
+
+    def to_lists(self) -> list[list[int]]:
+        return [list(row) for row in self._rows]
+
+    def numpy(self):
+        """
+        Zero-copy (rows, cols) uint8 NumPy view; writes go straight into
+        the grid. Needs NumPy, which the game itself doesn't.
+        """
+        import numpy as np
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(self.rows, self.cols)
+
+    #endregion
@@ -0,0 +1,233 @@
+# src/Logic/hierarchical.py
+
+import heapq
+from collections import deque
+from .pathfinding import Pathfinder
+
+class HierarchicalPathfinder(Pathfinder):
+    """
+    HPA*-style pathfinding for very large grids.
+
+    The grid is cut into square clusters. Wherever a run of walkable cells
+    crosses the border between two clusters, the middle of the run becomes
+    an entrance: a pair of abstract nodes joined by a 1-step edge. Inside
+    each cluster every pair of abstract nodes is linked by its local
+    shortest path. A query hooks start and goal into their clusters,
+    searches the small abstract graph with A*, then splices the stored
+    local paths together.
+
+    Everything is precomputed when the engine is created (LogicSetup does
+    that in generate_game). A tile change only rebuilds the borders and
+    intra-cluster links of the cluster it is in and its four neighbours.
+    Paths are near-optimal, not guaranteed shortest.
+    """
+    name = 'hierarchical'
+
+    def __init__(self, grid_rows: int, grid_cols: int, passable, cluster_size: int = 10):
+        super().__init__(grid_rows, grid_cols, passable)
+        self.cluster_size = cluster_size
+        self.CLUSTER_ROWS = -(-grid_rows // cluster_size)
+        self.CLUSTER_COLS = -(-grid_cols // cluster_size)
+        self.build()
+
+    #region building
+
+    def build(self):
+        """Full precomputation: every border, then every cluster."""
+        self.edges         = {}  # node -> {other node: (cost, cells from node to other)}
+        self.node_refs     = {}  # node -> number of entrances using it
+        self.border_pairs  = {}  # (cluster, cluster) -> [(node, node)] entrances
+        self.cluster_nodes = {}  # cluster -> set of nodes inside it
+        for kr in range(self.CLUSTER_ROWS):
+            for kc in range(self.CLUSTER_COLS):
+                self.cluster_nodes[(kr, kc)] = set()
+        for kr in range(self.CLUSTER_ROWS):
+            for kc in range(self.CLUSTER_COLS):
+                if kc + 1 < self.CLUSTER_COLS:
+                    self._build_border((kr, kc), (kr, kc + 1))
+                if kr + 1 < self.CLUSTER_ROWS:
+                    self._build_border((kr, kc), (kr + 1, kc))
+        for cluster in self.cluster_nodes:
+            self._build_cluster_links(cluster)
+
+    def cluster_of(self, cell):
+        c, r = cell
+        return (r // self.cluster_size, c // self.cluster_size)
+
+    def cluster_bounds(self, cluster):
+        """(col0, row0, col1, row1), end-exclusive."""
+        kr, kc = cluster
+        k = self.cluster_size
+        return (kc * k, kr * k,
+                min((kc + 1) * k, self.GRID_COLS), min((kr + 1) * k, self.GRID_ROWS))
+
+    def _border_cells(self, a, b):
+        """Facing cell pairs along the border of clusters a (left/top) and b."""
+        c0, r0, c1, r1 = self.cluster_bounds(a)
+        if a[0] == b[0]:  # side by side: vertical border
+            return [((c1 - 1, r), (c1, r)) for r in range(r0, r1)]
+        return [((c, r1 - 1), (c, r1)) for c in range(c0, c1)]
+
+    def _build_border(self, a, b):
+        pairs, run = [], []
+        for x, y in self._border_cells(a, b) + [(None, None)]:
+            if x is not None and self.passable(*x) and self.passable(*y):
+                run.append((x, y))
+                continue
+            if run:
+                pairs.append(run[len(run) // 2])
+                run = []
+        self.border_pairs[(a, b)] = pairs
+        for x, y in pairs:
+            self._ref_node(x, a)
+            self._ref_node(y, b)
+            self.edges[x][y] = (1, [x, y])
+            self.edges[y][x] = (1, [y, x])
+
+    def _ref_node(self, cell, cluster):
+        if cell not in self.node_refs:
+            self.node_refs[cell] = 0
+            self.edges[cell] = {}
+            self.cluster_nodes[cluster].add(cell)
+        self.node_refs[cell] += 1
+
+    def _drop_border(self, a, b):
+        for x, y in self.border_pairs.pop((a, b), []):
+            self.edges[x].pop(y, None)
+            self.edges[y].pop(x, None)
+            for cell, cluster in ((x, a), (y, b)):
+                self.node_refs[cell] -= 1
+                if self.node_refs[cell] == 0:
+                    del self.node_refs[cell]
+                    for other in self.edges.pop(cell):
+                        self.edges[other].pop(cell, None)
+                    self.cluster_nodes[cluster].discard(cell)
+
+    def _build_cluster_links(self, cluster):
+        """Local shortest paths between every pair of nodes in one cluster."""
+        nodes = self.cluster_nodes[cluster]
+        for node in nodes:
+            # forget old intra links, keep the 1-step entrance edges
+            for other in list(self.edges[node]):
+                if other in nodes:
+                    del self.edges[node][other]
+        for node in nodes:
+            parents = self._local_bfs(node, cluster)
+            for other in nodes:
+                if other != node and other in parents:
+                    path = self._walk(parents, other)
+                    path.reverse()
+                    self.edges[node][other] = (len(path) - 1, path)
+
+    def _neighbor_clusters(self, cluster):
+        kr, kc = cluster
+        for nr, nc in ((kr, kc - 1), (kr - 1, kc), (kr, kc + 1), (kr + 1, kc)):
+            if 0 <= nr < self.CLUSTER_ROWS and 0 <= nc < self.CLUSTER_COLS:
+                yield (nr, nc)
+
+    def invalidate(self, cell=None):
+        """
+        A tile changed. Re-derive the entrances on the four borders of its
+        cluster, then the intra-cluster links of it and its neighbours.
+        Without a cell, rebuild everything.
+        """
+        if cell is None:
+            self.build()
+            return
+        cluster = self.cluster_of(cell)
+        touched = [cluster] + list(self._neighbor_clusters(cluster))
+        for other in touched[1:]:
+            a, b = min(cluster, other), max(cluster, other)
+            self._drop_border(a, b)
+            self._build_border(a, b)
+        for k in touched:
+            self._build_cluster_links(k)
+
+    #region queries
+
+    def _local_bfs(self, src, cluster):
+        """BFS from src that never leaves `cluster`; returns parent map."""
+        c0, r0, c1, r1 = self.cluster_bounds(cluster)
+        parents = {src: None}
+        q = deque([src])
+        while q:
+            cur = q.popleft()
+            self.nodes_expanded += 1
+            c, r = cur
+            for nb in ((c+1, r), (c-1, r), (c, r+1), (c, r-1)):
+                if (c0 <= nb[0] < c1 and r0 <= nb[1] < r1
+                        and nb not in parents and self.passable(*nb)):
+                    parents[nb] = cur
+                    q.append(nb)
+        return parents
+
+    @staticmethod
+    def _walk(parents, node):
+        """Cells from node back to the BFS source."""
+        path = []
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        return path
+
+    def _search(self, start, goal):
+        ks, kg = self.cluster_of(start), self.cluster_of(goal)
+        from_start = self._local_bfs(start, ks)
+        from_goal  = self._local_bfs(goal, kg)
+
+        best, best_path = None, None
+        if ks == kg and goal in from_start:
+            best_path = self._walk(from_start, goal)[::-1]
+            best = len(best_path) - 1
+
+        # virtual edges: start -> its cluster's nodes, nodes -> goal
+        start_links = {n: self._walk(from_start, n)[::-1]
+                       for n in self.cluster_nodes[ks] if n in from_start}
+        goal_links  = {n: self._walk(from_goal, n)
+                       for n in self.cluster_nodes[kg] if n in from_goal}
+
+        gc, gr = goal
+        def h(cell):
+            return abs(cell[0] - gc) + abs(cell[1] - gr)
+
+        g, came = {}, {}
+        heap, tie = [], 0
+        for n, cells in start_links.items():
+            g[n] = len(cells) - 1
+            came[n] = None
+            tie += 1
+            heapq.heappush(heap, (g[n] + h(n), tie, n))
+
+        reached = None
+        while heap:
+            f, _, node = heapq.heappop(heap)
+            if f - h(node) > g[node]:
+                continue
+            if best is not None and f >= best:
+                break
+            self.nodes_expanded += 1
+            if node in goal_links:
+                total = g[node] + len(goal_links[node]) - 1
+                if best is None or total < best:
+                    best, reached = total, node
+            for other, (cost, _) in self.edges[node].items():
+                ng = g[node] + cost
+                if ng < g.get(other, ng + 1):
+                    g[other] = ng
+                    came[other] = node
+                    tie += 1
+                    heapq.heappush(heap, (ng + h(other), tie, other))
+
+        if reached is None:
+            return best_path or []
+
+        chain = [reached]
+        while came[chain[-1]] is not None:
+            chain.append(came[chain[-1]])
+        chain.reverse()
+
+        path = list(start_links[chain[0]])
+        for a, b in zip(chain, chain[1:]):
+            path.extend(self.edges[a][b][1][1:])
+        path.extend(goal_links[reached][1:])
+        return path
@@ -0,0 +1,104 @@
+# src/Logic/level_layers.py
+
+from array import array
+from .grid import Grid
+from .adjacency import Adjacency
+from .visibility import VisibilitySet
+from .vision import VisionCones
+from .nearest_walkable import NearestWalkable
+from .map_creation import T_WALL, is_walkable_tile
+
+NO_MARKER = 0
+
+# bytes.translate tables: tile code -> bitmap value
+WALKABLE_TABLE = bytes(1 if is_walkable_tile(v) else 0 for v in range(256))
+SOLID_TABLE    = bytes(1 if v == T_WALL else 0 for v in range(256))
+
+class LevelLayers:
+    """
+    Splits a level into its terrain and what is drawn on top of it.
+
+      - terrain:  the tile-code Grid (walls, floor, key, doors, ...).
+                  Only key pickup and door opening rewrite it, and every
+                  such rewrite must be followed by refresh(cell).
+      - walkable: 1 byte per cell, 1 where guards may walk.
+      - solid:    1 byte per cell, 1 where nothing may pass (walls).
+      - adjacency: CSR neighbour table of the walkable cells.
+      - visibility: precomputed line-of-sight bits between nearby cells.
+      - vision:   cached guard vision cones per (cell, facing).
+      - nearest:  nearest walkable cell for every cell (guard recovery).
+      - overlay:  patrol route markers (0 = none), kept out of the terrain
+                  so guards painting their routes can't overwrite the key,
+                  doors or hidden rooms.
+
+    All flat layers are row-major: index = row * GRID_COLS + col.
+    """
+    def __init__(self, terrain, grid_rows: int, grid_cols: int):
+        self.terrain   = terrain
+        self.GRID_ROWS = grid_rows
+        self.GRID_COLS = grid_cols
+
+        n = grid_rows * grid_cols
+        self.overlay   = array('H', bytes(2 * n))
+        self.adjacency = None
+        self.visibility = None
+        self.vision = None
+        self.nearest = None
+        if isinstance(terrain, Grid):
+            # one C-level pass each over the flat tile bytes
+            self.walkable = bytearray(terrain.data.translate(WALKABLE_TABLE))
+            self.solid    = bytearray(terrain.data.translate(SOLID_TABLE))
+        else:
+            self.walkable = bytearray(n)
+            self.solid    = bytearray(n)
+            for r in range(grid_rows):
+                for c in range(grid_cols):
+                    self.refresh((c, r))
+        self.adjacency = Adjacency(self.walkable, grid_rows, grid_cols, self.solid)
+        self.visibility = VisibilitySet(self.solid, grid_rows, grid_cols)
+        self.vision = VisionCones(self.solid, grid_rows, grid_cols)
+        self.nearest = NearestWalkable(self.walkable, grid_rows, grid_cols)
+
+    def index(self, cell) -> int:
+        c, r = cell
+        return r * self.GRID_COLS + c
+
+    def in_bounds(self, cell) -> bool:
+        c, r = cell
+        return 0 <= c < self.GRID_COLS and 0 <= r < self.GRID_ROWS
+
+    def refresh(self, cell):
+        """Re-derive the bitmaps (and adjacency) for one cell after its terrain changed."""
+        c, r = cell
+        val = self.terrain[r][c]
+        i = r * self.GRID_COLS + c
+        walkable = 1 if is_walkable_tile(val) else 0
+        solid    = 1 if val == T_WALL else 0
+        changed  = walkable != self.walkable[i] or solid != self.solid[i]
+        sight    = solid != self.solid[i]
+        self.walkable[i] = walkable
+        self.solid[i]    = solid
+        if changed and self.adjacency is not None:
+            self.adjacency.patch(cell)
+            self.nearest.patch(cell)
+        if sight and self.visibility is not None:
+            self.visibility.patch(cell)
+            self.vision.invalidate(cell)
+
+    def is_walkable(self, cell) -> bool:
+        return self.in_bounds(cell) and self.walkable[self.index(cell)] == 1
+
+    def passable(self, c: int, r: int) -> bool:
+        """pathfinding.Pathfinder-style predicate (bounds already checked)."""
+        return self.walkable[r * self.GRID_COLS + c] == 1
+
+    def is_solid(self, cell) -> bool:
+        """Walls, and everything outside the map, are solid."""
+        return not self.in_bounds(cell) or self.solid[self.index(cell)] == 1
+
+    def mark(self, cell, marker: int):
+        if self.in_bounds(cell):
+            self.overlay[self.index(cell)] = marker
+
+    def marker_at(self, cell) -> int:
+        return self.overlay[self.index(cell)]
@@ -0,0 +1,214 @@
+# src/Logic/level_pack.py
+"""
+Level packs: prebuilt levels in one file, read through mmap.
+
+    header   MAGIC, FORMAT_VERSION, GENERATOR_VERSION, count,
+             grid_stride, route_stride
+    index    count fixed-size entries: the level spec and seed, grid
+             size, key and door cells, number of routes
+    grids    count slots of grid_stride bytes: the finished tile matrix
+             (key and closed door in place), row-major, one byte a tile
+    routes   count slots of route_stride bytes: for each guard a u32
+             length, then that many (u16 col, u16 row) cells
+
+Every slot has the same size, so level i is found by arithmetic and
+opening a pack reads only the header and index; the OS pages in a
+level's grid and routes when it is loaded.
+
+    python -m Logic.level_pack build levels.pack --sizes 20 40 80 --seeds 50
+
+A pack written by another GENERATOR_VERSION matches no level_key, so
+LogicSetup.generate_game falls back to generating.
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .grid import Grid
+from .logic_setup import LogicSetup, GENERATOR_VERSION
+
+MAGIC          = b'SGLP'
+FORMAT_VERSION = 2
+HEADER = struct.Struct('<4sHHIII12x')        # 32 bytes
+ENTRY  = struct.Struct('<8sHHHqHHHHHHH4x')   # 40 bytes
+U32    = struct.Struct('<I')  # route length: big levels pass 65535 cells
+CELL   = struct.Struct('<HH')
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+#region reading
+
+class PackedLevel:
+    """One level of a LevelPack; the accessors read straight from the map."""
+    def __init__(self, pack, i: int, entry: tuple):
+        (name, self.rows, self.cols, self.enemy_count, self.seed,
+         self.grid_rows, self.grid_cols, kc, kr, dc, dr, self.route_count) = entry
+        self.difficulty = name.rstrip(b'\0').decode()
+        self.key_pos    = (kc, kr)
+        self.door_pos   = (dc, dr)
+        self.pack, self.i = pack, i
+
+    @property
+    def level_key(self) -> tuple:
+        return (self.pack.generator_version, self.difficulty, self.rows,
+                self.cols, self.enemy_count, self.seed)
+
+    def grid(self) -> memoryview:
+        """Read-only view of the tile bytes; no copy is made."""
+        start = self.pack.grids_at + self.i * self.pack.grid_stride
+        return self.pack.view[start:start + self.grid_rows * self.grid_cols]
+
+    def matrix(self) -> Grid:
+        """
+        The level as a Grid. The game rewrites tiles (key pickup, doors),
+        so this is the one copy a load makes: a single memcpy of the grid.
+        """
+        return Grid(self.grid_rows, self.grid_cols, data=bytearray(self.grid()))
+
+    def routes(self) -> list:
+        """Patrol routes, one list of (col, row) per guard."""
+        view = self.pack.view
+        at = self.pack.routes_at + self.i * self.pack.route_stride
+        routes = []
+        for _ in range(self.route_count):
+            n = U32.unpack_from(view, at)[0]
+            at += U32.size
+            routes.append(list(CELL.iter_unpack(view[at:at + n * CELL.size])))
+            at += n * CELL.size
+        return routes
+
+class LevelPack:
+    """
+    A level pack file, mapped read-only. find(level_key) returns the
+    PackedLevel for a LogicSetup's level_key, or None.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mm)
+        if len(self.mm) < HEADER.size:
+            raise ValueError(f"{path}: not a level pack (too short)")
+        (magic, version, self.generator_version, self.count,
+         self.grid_stride, self.route_stride) = HEADER.unpack_from(self.mm)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a level pack")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: level pack format {version}, expected {FORMAT_VERSION}")
+        self.grids_at  = _align(HEADER.size + self.count * ENTRY.size)
+        self.routes_at = _align(self.grids_at + self.count * self.grid_stride)
+
+        self.index = {}  # level_key -> slot
+        self.levels = []
+        for i in range(self.count):
+            level = PackedLevel(self, i, ENTRY.unpack_from(self.mm, HEADER.size + i * ENTRY.size))
+            self.levels.append(level)
+            self.index[level.level_key] = i
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.levels)
+
+    def __contains__(self, level_key):
+        return level_key in self.index
+
+    def find(self, level_key):
+        i = self.index.get(level_key)
+        return None if i is None else self.levels[i]
+
+    def close(self):
+        """Unmap the file; views from PackedLevel.grid() must be gone by then."""
+        self.view.release()
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+#endregion
+
+#region building
+
+def build_level(spec) -> tuple:
+    """Generate one level; returns (spec, grid rows, grid cols, tiles, key, door, routes)."""
+    difficulty, rows, cols, enemy_count, seed = spec
+    if max(rows, cols, enemy_count) > 0xFFFF or 2 * max(rows, cols) + 1 > 0xFFFF:
+        raise ValueError(f"{spec}: too large for a level pack (sizes are stored as u16)")
+    logic = LogicSetup(difficulty, rows, cols, enemy_count, seed=seed)
+    logic.generate_game()
+    return (spec, logic.GRID_ROWS, logic.GRID_COLS, bytes(logic.matrix.data),
+            logic.key_pos, logic.door_pos,
+            [list(en.complete_patrol_route) for en in logic.enemies])
+
+def _route_block(routes) -> bytes:
+    out = bytearray()
+    for route in routes:
+        out += U32.pack(len(route))
+        for c, r in route:
+            out += CELL.pack(c, r)
+    return bytes(out)
+
+def write_pack(path, levels):
+    """Write build_level() results to `path`, in the order given."""
+    levels = list(levels)
+    blocks = [_route_block(routes) for *_, routes in levels]
+    grid_stride  = _align(max((len(tiles) for _, _, _, tiles, *_ in levels), default=0))
+    route_stride = _align(max((len(b) for b in blocks), default=0))
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, GENERATOR_VERSION, len(levels),
+                            grid_stride, route_stride))
+        for spec, grid_rows, grid_cols, tiles, key, door, routes in levels:
+            difficulty, rows, cols, enemy_count, seed = spec
+            f.write(ENTRY.pack(difficulty.encode(), rows, cols, enemy_count, seed,
+                               grid_rows, grid_cols, *key, *door, len(routes)))
+        f.write(bytes(_align(f.tell()) - f.tell()))
+        for _, _, _, tiles, *_ in levels:
+            f.write(tiles.ljust(grid_stride, b'\0'))
+        for block in blocks:
+            f.write(block.ljust(route_stride, b'\0'))
+
+def build_pack(path, specs, workers=None):
+    """Generate every spec across a process pool and write them as a pack."""
+    specs = list(specs)
+    if workers == 1:
+        levels = [build_level(spec) for spec in specs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(build_level, spec) for spec in specs]
+            levels = [future.result() for future in as_completed(futures)]
+    levels.sort(key=lambda level: level[0])  # same specs, same file
+    write_pack(path, levels)
+    return len(levels)
+
+#endregion
+
+def main(argv=None):
+    from .batch_sim import level_specs
+    parser = argparse.ArgumentParser(description="Build a level pack.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build')
+    build.add_argument('pack')
+    build.add_argument('--difficulty', nargs='+', default=['easy', 'hard'])
+    build.add_argument('--sizes', nargs='+', type=int, default=[8, 12, 16])
+    build.add_argument('--enemies', nargs='+', type=int, default=[2, 4])
+    build.add_argument('--seeds', type=int, default=10, help='seeds 0..N-1 per combination')
+    build.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    specs = list(level_specs(args.difficulty, args.sizes, args.enemies, range(args.seeds)))
+    start = time.perf_counter()
+    n = build_pack(args.pack, specs, args.workers)
+    print(f"{n} levels -> {args.pack} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
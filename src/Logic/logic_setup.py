@@ -6,24 +6,95 @@ from .map_creation import (
     T_WALL, T_HIDDEN
 )
 from .patrol_generator import PatrolGenerator
+from .flow_field import FlowField
+from .level_layers import LevelLayers
+from .pathfinding import make_pathfinder
+from .ai_scheduler import AIScheduler
+from .spatial_hash import SpatialHash
+from .controls import NO_INPUT
 from .enemy import Enemy
 from .player import Player
 from collections import deque
+import hashlib
+import random
 
 SIZE_X, SIZE_Y = 1000, 750
 
+# 'auto' pathfinding switches to the clustered engine from this many cells
+HIERARCHICAL_MIN_CELLS = 200 * 200
+
+# below this many chasing guards each one repairs its own DStarLite plan;
+# from here on a single shared flow field is cheaper
+FLOW_FIELD_MIN_CHASERS = 3
+
+# simulation LOD: on levels with at least LOD_MIN_GUARDS guards, patrolling
+# guards further than LOD_NEAR_CELLS (Manhattan, in cells) from the player
+# are only stepped every LOD_FAR_INTERVAL frames, jumping the skipped frames
+# in one go with Enemy.fast_forward. The whole maze is on screen, so the
+# jumps show; below the threshold every guard moves every frame.
+LOD_MIN_GUARDS   = 32
+LOD_NEAR_CELLS   = 12
+LOD_FAR_INTERVAL = 8
+
+# swarm='auto' drives patrols with the NumPy EnemySwarm from this many guards
+SWARM_MIN_GUARDS = 32
+
+# Bump whenever MapCreation, PatrolGenerator or key/door placement changes
+# what a given seed produces: it is part of every level_key, so stale
+# cached or packed levels stop matching instead of being loaded.
+GENERATOR_VERSION = 2
+
+def level_key(difficulty: str, rows: int, cols: int, enemy_count: int, seed: int) -> tuple:
+    """Stable identity of a generated level and everything derived from it."""
+    return (GENERATOR_VERSION, difficulty, rows, cols, enemy_count, seed)
+
+def sub_seed(seed: int, stream: str) -> int:
+    """An independent, stable seed for one generation stage (e.g. 'patrols')."""
+    digest = hashlib.blake2b(f"{seed}/{stream}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') >> 1
+
 class LogicSetup:
     """
     Combines maze generation, player placement, key/door setup and guard patrol routing.
+    The whole level follows from `seed` (drawn at random if not given):
+    the maze from the seed itself, the patrols from sub_seed(seed, 'patrols').
     """
-    def __init__(self, difficulty: str, rows: int, cols: int, enemy_count: int):
-        self.map_gen     = MapCreation(difficulty, rows, cols, enemy_count)
+    def __init__(self, difficulty: str, rows: int, cols: int, enemy_count: int,
+                 pathfinder: str = 'auto', ai_budget_ms: float = 2.0,
+                 swarm='auto', clock=None, seed: int | None = None):
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        self.seed        = seed
+        self.map_gen     = MapCreation(difficulty, rows, cols, enemy_count, seed=seed)
         self.enemy_count = enemy_count
         self.difficulty  = difficulty
+        self.level_key   = level_key(difficulty, rows, cols, enemy_count, seed)
+        # engine name for pathfinding.make_pathfinder, or 'auto'
+        self.pathfinder_engine = pathfinder
+        # per-frame time budget for guard replans; pass a fake clock for
+        # reproducible runs (a clock that never advances services every replan)
+        if clock is None:
+            self.scheduler = AIScheduler(ai_budget_ms)
+        else:
+            self.scheduler = AIScheduler(ai_budget_ms, clock=clock)
+        self.ticks = 0  # sim steps run so far
+        # True / False / 'auto' (NumPy installed and enough guards)
+        self.swarm_mode = swarm
+        self.swarm = None
+
+    def generate_game(self, pack=None):
+        """
+        Build the level and everything on it. With a level_pack.LevelPack
+        that holds our level_key, the maze, key/door and patrol routes are
+        taken from the pack instead of generated.
+        """
+        packed = pack.find(self.level_key) if pack is not None else None
 
-    def generate_game(self):
         #Generate maze and compute grid metrics
-        self.matrix     = self.map_gen.generate_maze()
+        if packed is None:
+            self.matrix = self.map_gen.generate_maze()
+        else:
+            self.matrix = packed.matrix()
         self.GRID_ROWS  = len(self.matrix)
         self.GRID_COLS  = len(self.matrix[0])
         self.PIXEL_ONE_X = SIZE_X / self.GRID_COLS
@@ -40,8 +111,16 @@ class LogicSetup:
             self.PIXEL_ONE_Y
         )
 
-        # Place key and closed door in matrix
-        self.key_pos, self.door_pos = self._place_key_and_door()
+        # Place key and closed door in matrix (a packed matrix has them)
+        if packed is None:
+            self.key_pos, self.door_pos = self._place_key_and_door()
+        else:
+            self.key_pos, self.door_pos = packed.key_pos, packed.door_pos
+
+        # Terrain is final now: derive the walkability/solidity bitmaps once;
+        # patrol markers go to the level's overlay, never into the matrix
+        self.level = LevelLayers(self.matrix, self.GRID_ROWS, self.GRID_COLS)
+        self.player.level = self.level
 
         #Instantiate Enemy objects with proper tile_size
         self.enemies = [
@@ -68,16 +147,54 @@ class LogicSetup:
             enemies=self.enemies,
             difficulty_level=1 if self.difficulty == 'easy' else 3,
             base_marker=T_DOOR_O + 1,
-            palette=[(0, 0, 255, 128), (255, 0, 0, 128), (0, 255, 0, 128)]
+            palette=[(0, 0, 255, 128), (255, 0, 0, 128), (0, 255, 0, 128)],
+            level=self.level,
+            seed=sub_seed(self.seed, 'patrols'),
+            routes=None if packed is None else packed.routes()
+        )
+        # PatrolGenerator.__init__ calls setup_patrols() (or assigns the packed routes)
+
+        # One shared flow field toward the player for every chasing guard,
+        # and one pathfinder for everything else (patrol recovery etc.)
+        self.flow_field = FlowField(self.matrix, self.GRID_ROWS, self.GRID_COLS,
+                                    walkable=self.level.walkable,
+                                    adjacency=self.level.adjacency)
+        self.pathfinder = make_pathfinder(
+            self._choose_pathfinder(), self.matrix, self.GRID_ROWS, self.GRID_COLS,
+            passable=self.level.passable, adjacency=self.level.adjacency
         )
-        # PatrolGenerator.__init__ calls setup_patrols()
+        for en in self.enemies:
+            en.level = self.level
+            en.scheduler = self.scheduler
+            en.flow_field = self.flow_field
+            en.pathfinder = self.pathfinder
+        self.player.on_tile_change = self._on_tile_change
+        self.swarm = self._make_swarm()
+
+        # who stands where, for capture and other proximity queries
+        self.spatial = SpatialHash()
+        for en in self.enemies:
+            self.spatial.insert(en, en.pixel_to_grid(en.get_position()))
 
-    def handle_input(self, keys):
+    def handle_input(self, controls=NO_INPUT):
         """
-        keys is pygame.key.get_pressed(), but Player.move() does its own key check.
-        We just invoke the move() method here.
+        controls is a controls.Controls (Graphics.input.read_controls builds
+        one from the keyboard); the logic itself never reads pygame.
         """
-        self.player.move()
+        self.player.move(controls)
+
+    def step(self, controls=NO_INPUT):
+        """
+        One fixed sim step (see fixed_timestep.FixedTimestep): input, then
+        the world. Returns update()'s won/lost dict.
+        """
+        self.ticks += 1
+        # remember where everyone was, for render interpolation
+        self.player.prev_position = self.player.get_position()
+        for en in self.enemies:
+            en.prev_position = en.get_position()
+        self.handle_input(controls)
+        return self.update()
 
     def update(self):
         # Key pickup
@@ -87,18 +204,36 @@ class LogicSetup:
 
         if not self.player.has_key and self.matrix[row][col] == T_KEY:
             self.player.has_key = True
-            self.matrix[row][col] = T_FLOOR
+            self._set_tile(col, row, T_FLOOR)
 
         #Open door when adjacent
         if self.player.has_key and self.door_pos:
-            dr, dc = self.door_pos
-            if self.player.near_door((dr, dc)):
-                self.matrix[dr][dc] = T_DOOR_O
+            dc, dr = self.door_pos  # door_pos is (col, row); near_door takes (row, col)
+            if self.player.near_door((dr, dc)) and self.matrix[dr][dc] != T_DOOR_O:
+                self._set_tile(dc, dr, T_DOOR_O)
+
+        # Re-root the flow field when enough guards chase to share it;
+        # it only rebuilds if the player changed cell
+        chasers = sum(1 for en in self.enemies if en.state == "alert")
+        if chasers >= FLOW_FIELD_MIN_CHASERS:
+            self.flow_field.set_root((col, row))
+        else:
+            self.flow_field.set_root(None)
 
         # Update all enemies
         player_pos = self.player.get_position()
+        if self.swarm is not None:
+            # far patrollers move in one vectorized pass, the rest as usual
+            for g in self.swarm.step((col, row)):
+                self._update_enemy(self.enemies[g], player_pos, (col, row))
+                self.swarm.sync(g)
+        else:
+            for en in self.enemies:
+                self._update_enemy(en, player_pos, (col, row))
+        # replans the guards asked for, within this frame's budget
+        self.scheduler.run()
         for en in self.enemies:
-            en.update(player_pos)
+            self.spatial.move(en, en.pixel_to_grid(en.get_position()))
 
         self._check_enemy_collision()
         
@@ -108,11 +243,74 @@ class LogicSetup:
             'lost': self.player.game_over
         }
 
+    def _update_enemy(self, en, player_pos, player_cell):
+        """
+        Distance-based LOD, for levels with LOD_MIN_GUARDS or more. The
+        whole map is always on screen, so only the distance to the player
+        decides: a far guard that is just patrolling banks its frames in
+        lod_lag and catches up every LOD_FAR_INTERVAL frames; anything
+        near, chasing or off its route updates normally.
+        """
+        far = False
+        if len(self.enemies) >= LOD_MIN_GUARDS:
+            ec, er = en.pixel_to_grid(en.get_position())
+            far = abs(ec - player_cell[0]) + abs(er - player_cell[1]) > LOD_NEAR_CELLS
+        if far and en.state == "patrol" and en.patrol_phase() is not None:
+            en.lod_lag += 1
+            if en.lod_lag >= LOD_FAR_INTERVAL:
+                en.fast_forward(en.lod_lag)
+                en.lod_lag = 0
+            return
+        if en.lod_lag:
+            # coming back into range: catch up before the normal update
+            en.fast_forward(en.lod_lag)
+            en.lod_lag = 0
+        en.update(player_pos)
+
+    def _make_swarm(self):
+        """EnemySwarm over our guards, or None (NumPy is optional)."""
+        mode = self.swarm_mode
+        if not mode or (mode == 'auto' and len(self.enemies) < SWARM_MIN_GUARDS):
+            return None
+        try:
+            from .enemy_swarm import EnemySwarm
+        except ImportError:
+            if mode == 'auto':
+                return None
+            raise
+        return EnemySwarm(self.enemies, near_cells=LOD_NEAR_CELLS)
+
+    def _choose_pathfinder(self):
+        """
+        'auto': very large levels (developer settings in the hundreds) get
+        the clustered HPA* engine. Otherwise perfect ("hard") mazes are
+        nearly all 1-wide corridors and compress well into a corridor
+        graph; looped ("easy") mazes don't, so they use the BFS-tree cache.
+        """
+        if self.pathfinder_engine != 'auto':
+            return self.pathfinder_engine
+        if self.GRID_ROWS * self.GRID_COLS >= HIERARCHICAL_MIN_CELLS:
+            return 'hierarchical'
+        return 'corridor' if self.difficulty == 'hard' else 'cache'
+
+    def _set_tile(self, col, row, value):
+        self.matrix[row][col] = value
+        self._on_tile_change((col, row))
+
+    def _on_tile_change(self, cell):
+        """A tile was rewritten (by us or by Player.move): drop stale paths."""
+        self.level.refresh(cell)
+        self.flow_field.invalidate()
+        self.pathfinder.invalidate(cell)
+        for en in self.enemies:
+            if en.planner is not None:
+                en.planner.tile_changed(cell)
+
     def _find_start_cell(self):
-        for i in range(1, self.GRID_ROWS + 1):
-            for x in range(self.GRID_COLS):
-                if self.matrix[self.GRID_ROWS - i][x] == T_FLOOR:
-                    return (x, self.GRID_ROWS - i)
+        for r in range(self.GRID_ROWS - 1, -1, -1):
+            cell = self.matrix.find(T_FLOOR, r, r + 1)
+            if cell is not None:
+                return cell
         return (0, 0)
 
     def _place_key_and_door(self):
@@ -165,14 +363,8 @@ class LogicSetup:
         px, py = self.player.get_position()
         pcol = int(px // self.PIXEL_ONE_X)
         prow = int(py // self.PIXEL_ONE_Y)
-        # for each enemy, compare grid‐coords
-        for en in self.enemies:
-            ex, ey = en.get_position()
-            ecol = int(ex // self.PIXEL_ONE_X)
-            erow = int(ey // self.PIXEL_ONE_Y)
-            if ecol == pcol and erow == prow:
-                self.player.game_over = True
-                return
+        if self.spatial.at((pcol, prow)):
+            self.player.game_over = True
     
     def border_tuples(self):
         out = []
@@ -193,5 +385,6 @@ class LogicSetup:
             self.key_pos,
             self.door_pos,
             self.player,
-            self.enemies
+            self.enemies,
+            self.level
         )
@@ -0,0 +1 @@
+Map_creation.py
\ No newline at end of file
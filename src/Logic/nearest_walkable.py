@@ -0,0 +1,119 @@
+# src/Logic/nearest_walkable.py
+
+import heapq
+from array import array
+from collections import deque
+
+class NearestWalkable:
+    """
+    Nearest walkable cell for every cell of the level, from one
+    multi-source BFS seeded with all walkable cells at once.
+
+    dist[i] is the 4-neighbour step count from cell i to the closest
+    walkable cell (0 on walkable cells, -1 if there is none at all) and
+    nearest[i] that cell's flat index. Ties are broken exactly like a BFS
+    started from i that tries neighbours in the order col+1, col-1, row+1,
+    row-1 (Enemy.find_nearest_walkable): take the first neighbour one step
+    closer and inherit its answer.
+
+    patch() keeps the map current when a cell becomes walkable (key
+    pickup, doors opening) by relaxing outward from it; a cell turning
+    unwalkable is rare enough to just rebuild.
+    """
+    def __init__(self, walkable, grid_rows: int, grid_cols: int):
+        self.walkable  = walkable  # flat row-major bitmap, 1 = walkable
+        self.GRID_ROWS = grid_rows
+        self.GRID_COLS = grid_cols
+        self.builds    = 0
+        self.build()
+
+    def _around(self, i):
+        """In-bounds neighbour indices of i, in BFS order."""
+        C = self.GRID_COLS
+        r, c = divmod(i, C)
+        if c + 1 < C:
+            yield i + 1
+        if c > 0:
+            yield i - 1
+        if r + 1 < self.GRID_ROWS:
+            yield i + C
+        if r > 0:
+            yield i - C
+
+    def build(self):
+        self.builds += 1
+        n = self.GRID_ROWS * self.GRID_COLS
+        walkable = self.walkable
+        dist    = array('i', [-1]) * n
+        nearest = array('i', [-1]) * n
+        queue = deque()
+        for i in range(n):
+            if walkable[i]:
+                dist[i] = 0
+                nearest[i] = i
+                queue.append(i)
+        order = []
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for j in self._around(i):
+                if dist[j] < 0:
+                    dist[j] = d
+                    queue.append(j)
+                    order.append(j)
+        self.dist, self.nearest = dist, nearest
+        # BFS order is by distance, so each pick sees its answer final
+        for i in order:
+            nearest[i] = self._pick(i)
+
+    def _pick(self, i):
+        """Answer for non-walkable i: that of its first neighbour one step closer."""
+        d = self.dist[i] - 1
+        for j in self._around(i):
+            if self.dist[j] == d:
+                return self.nearest[j]
+        return -1
+
+    def patch(self, cell):
+        """Walkability of `cell` may have changed: update the affected region."""
+        c, r = cell
+        i = r * self.GRID_COLS + c
+        dist, nearest = self.dist, self.nearest
+        if self.walkable[i]:
+            if dist[i] == 0:
+                return
+        else:
+            if dist[i] != 0:
+                return
+            self.build()
+            return
+
+        # a new source: relax outward in distance order, re-picking every
+        # cell that got closer or whose tie-break could now differ
+        dist[i], nearest[i] = 0, i
+        heap = [(0, i)]
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d != dist[x]:
+                continue
+            for j in self._around(x):
+                if dist[j] < 0 or dist[j] > d + 1:
+                    dist[j] = d + 1
+                    nearest[j] = self._pick(j)
+                    heapq.heappush(heap, (d + 1, j))
+                elif dist[j] == d + 1:
+                    best = self._pick(j)
+                    if best != nearest[j]:
+                        nearest[j] = best
+                        heapq.heappush(heap, (d + 1, j))
+
+    def lookup(self, cell):
+        """Nearest walkable (col, row) to `cell`, or None (none / off the map)."""
+        c, r = cell
+        if not (0 <= c < self.GRID_COLS and 0 <= r < self.GRID_ROWS):
+            return None
+        j = self.nearest[r * self.GRID_COLS + c]
+        if j < 0:
+            return None
+        r, c = divmod(j, self.GRID_COLS)
+        return (c, r)
@@ -0,0 +1,162 @@
+# src/Logic/path_cache.py
+
+from collections import OrderedDict, deque
+from .map_creation import is_walkable_tile
+
+NO_PARENT = -1
+
+class LRUCache:
+    """
+    Small bounded mapping with least-recently-used eviction and
+    hit/miss counters, so callers can size it from real play.
+    """
+    def __init__(self, capacity: int):
+        self.capacity  = max(1, capacity)
+        self.entries   = OrderedDict()
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached value (refreshing its recency) or None."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self) -> dict:
+        return {
+            'size':      len(self.entries),
+            'capacity':  self.capacity,
+            'hits':      self.hits,
+            'misses':    self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class PathCache:
+    """
+    Per-level cache of BFS predecessor trees keyed by goal cell.
+
+    A tree is one full BFS outward from the goal; afterwards the shortest
+    path from *any* start to that goal is a walk along parent pointers.
+    Trees are kept in an LRUCache and must be dropped with invalidate()
+    whenever a tile's walkability changes (key pickup, door opening).
+    Implements the pathfinding.Pathfinder interface as engine 'cache'.
+    """
+    name = 'cache'
+
+    def __init__(self, matrix, grid_rows: int, grid_cols: int,
+                 capacity: int = 64, passable=None, adjacency=None):
+        self.matrix    = matrix
+        self.GRID_ROWS = grid_rows
+        self.GRID_COLS = grid_cols
+        # passable(col, row) -> bool; defaults to guard walkability
+        self.passable  = passable or (lambda c, r: is_walkable_tile(self.matrix[r][c]))
+        self.trees     = LRUCache(capacity)
+        # optional adjacency.Adjacency matching `passable`
+        self.adjacency = adjacency
+
+        # same counters as pathfinding.Pathfinder
+        self.searches       = 0
+        self.nodes_expanded = 0
+
+    @property
+    def hits(self):
+        return self.trees.hits
+
+    @property
+    def misses(self):
+        return self.trees.misses
+
+    def stats(self) -> dict:
+        return self.trees.stats()
+
+    def invalidate(self, cell=None):
+        """Tiles changed: every cached tree may now be wrong."""
+        self.trees.clear()
+
+    def in_bounds(self, cell):
+        c, r = cell
+        return 0 <= c < self.GRID_COLS and 0 <= r < self.GRID_ROWS
+
+    def tree(self, goal):
+        """Parent array for `goal` (index -> index one step closer), cached."""
+        parents = self.trees.get(goal)
+        if parents is None:
+            parents = self._build_tree(goal)
+            self.trees.put(goal, parents)
+        return parents
+
+    def _build_tree(self, goal):
+        R, C = self.GRID_ROWS, self.GRID_COLS
+        passable = self.passable
+        parents = [NO_PARENT] * (R * C)
+        gc, gr = goal
+        start = gr * C + gc
+        parents[start] = start
+        q = deque([start])
+        adj = self.adjacency
+        if adj is not None:
+            offsets, degree, targets = adj.offsets, adj.degree, adj.targets
+            while q:
+                i = q.popleft()
+                self.nodes_expanded += 1
+                k = offsets[i]
+                for j in targets[k:k + degree[i]]:
+                    if parents[j] == NO_PARENT:
+                        parents[j] = i
+                        q.append(j)
+            return parents
+        while q:
+            i = q.popleft()
+            self.nodes_expanded += 1
+            r, c = divmod(i, C)
+            for nc, nr in ((c+1, r), (c-1, r), (c, r+1), (c, r-1)):
+                if 0 <= nc < C and 0 <= nr < R:
+                    j = nr * C + nc
+                    if parents[j] == NO_PARENT and passable(nc, nr):
+                        parents[j] = i
+                        q.append(j)
+        return parents
+
+    def path(self, start, goal):
+        """
+        Cells from start to goal inclusive, or [] if either end is blocked
+        or the goal is unreachable (same contract as Enemy.find_path_between).
+        """
+        if not self.in_bounds(start) or not self.in_bounds(goal):
+            return []
+        if not self.passable(*start) or not self.passable(*goal):
+            return []
+        self.searches += 1
+        C = self.GRID_COLS
+        parents = self.tree(goal)
+        i = start[1] * C + start[0]
+        if parents[i] == NO_PARENT:
+            return []
+        end = goal[1] * C + goal[0]
+        path = [start]
+        while i != end:
+            i = parents[i]
+            r, c = divmod(i, C)
+            path.append((c, r))
+        return path
+
+    find_path = path
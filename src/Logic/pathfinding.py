@@ -0,0 +1,227 @@
+# src/Logic/pathfinding.py
+
+import heapq
+from collections import deque
+from .map_creation import is_walkable_tile
+
+class Pathfinder:
+    """
+    Common interface for every grid search engine.
+
+    find_path(start, goal) returns the cells from start to goal inclusive,
+    [start] when they are equal, or [] if either end is blocked or the goal
+    can't be reached. `passable(col, row)` decides walkability; bounds are
+    checked here so callers never have to. An optional adjacency.Adjacency
+    built from the same walkability replaces the per-step neighbour checks.
+    """
+    name = 'base'
+
+    def __init__(self, grid_rows: int, grid_cols: int, passable, adjacency=None):
+        self.GRID_ROWS = grid_rows
+        self.GRID_COLS = grid_cols
+        self.passable  = passable
+        self.adjacency = adjacency
+
+        # counters for profiling / batch statistics
+        self.searches       = 0
+        self.nodes_expanded = 0
+
+    def in_bounds(self, cell):
+        c, r = cell
+        return 0 <= c < self.GRID_COLS and 0 <= r < self.GRID_ROWS
+
+    def neighbors(self, cell):
+        """Passable 4-neighbours, in the same order Enemy.get_neighbors uses."""
+        if self.adjacency is not None:
+            yield from self.adjacency.cell_neighbors(cell)
+            return
+        c, r = cell
+        for nb in ((c+1, r), (c-1, r), (c, r+1), (c, r-1)):
+            if self.in_bounds(nb) and self.passable(*nb):
+                yield nb
+
+    def invalidate(self, cell=None):
+        """Tile `cell` (or any tile) changed. Stateless engines have nothing to drop."""
+        pass
+
+    def find_path(self, start, goal):
+        if not self.in_bounds(start) or not self.in_bounds(goal):
+            return []
+        if not self.passable(*start) or not self.passable(*goal):
+            return []
+        self.searches += 1
+        if start == goal:
+            return [start]
+        return self._search(start, goal)
+
+    def _search(self, start, goal):
+        raise NotImplementedError
+
+    @staticmethod
+    def _walk_back(came_from, node):
+        path = []
+        while node is not None:
+            path.append(node)
+            node = came_from[node]
+        path.reverse()
+        return path
+
+
+class BFSPathfinder(Pathfinder):
+    """Plain breadth-first search with early exit at the goal."""
+    name = 'bfs'
+
+    def _search(self, start, goal):
+        if self.adjacency is not None:
+            return self._search_flat(start, goal)
+        came_from = {start: None}
+        queue = deque([start])
+        while queue:
+            cur = queue.popleft()
+            self.nodes_expanded += 1
+            if cur == goal:
+                return self._walk_back(came_from, goal)
+            for nb in self.neighbors(cur):
+                if nb not in came_from:
+                    came_from[nb] = cur
+                    queue.append(nb)
+        return []
+
+    def _search_flat(self, start, goal):
+        """Same search over flat cell indices and the CSR table: no tuples per step."""
+        adj = self.adjacency
+        offsets, degree, targets = adj.offsets, adj.degree, adj.targets
+        C = self.GRID_COLS
+        src, dst = start[1] * C + start[0], goal[1] * C + goal[0]
+        came_from = {src: -1}
+        queue = deque([src])
+        while queue:
+            i = queue.popleft()
+            self.nodes_expanded += 1
+            if i == dst:
+                path = []
+                while i != -1:
+                    r, c = divmod(i, C)
+                    path.append((c, r))
+                    i = came_from[i]
+                path.reverse()
+                return path
+            k = offsets[i]
+            for j in targets[k:k + degree[i]]:
+                if j not in came_from:
+                    came_from[j] = i
+                    queue.append(j)
+        return []
+
+
+class AStarPathfinder(Pathfinder):
+    """A* with a Manhattan heuristic: only searches toward the goal."""
+    name = 'astar'
+
+    def _search(self, start, goal):
+        gc, gr = goal
+        def h(cell):
+            return abs(cell[0] - gc) + abs(cell[1] - gr)
+
+        came_from = {start: None}
+        g = {start: 0}
+        tie = 0  # FIFO among equal f keeps paths stable
+        heap = [(h(start), tie, start)]
+        while heap:
+            f, _, cur = heapq.heappop(heap)
+            if f - h(cur) > g[cur]:
+                continue  # stale heap entry
+            self.nodes_expanded += 1
+            if cur == goal:
+                return self._walk_back(came_from, goal)
+            ng = g[cur] + 1
+            for nb in self.neighbors(cur):
+                if ng < g.get(nb, ng + 1):
+                    g[nb] = ng
+                    came_from[nb] = cur
+                    tie += 1
+                    heapq.heappush(heap, (ng + h(nb), tie, nb))
+        return []
+
+
+class BidirectionalPathfinder(Pathfinder):
+    """BFS from both ends at once, always growing the smaller frontier."""
+    name = 'bidirectional'
+
+    def _search(self, start, goal):
+        fwd = {start: None}   # cell -> predecessor toward start
+        bwd = {goal: None}    # cell -> successor toward goal
+        fwd_depth, bwd_depth = {start: 0}, {goal: 0}
+        fwd_frontier, bwd_frontier = [start], [goal]
+        while fwd_frontier and bwd_frontier:
+            if len(fwd_frontier) <= len(bwd_frontier):
+                fwd_frontier, meet = self._expand(fwd_frontier, fwd, fwd_depth, bwd_depth)
+            else:
+                bwd_frontier, meet = self._expand(bwd_frontier, bwd, bwd_depth, fwd_depth)
+            if meet is not None:
+                path = self._walk_back(fwd, meet)
+                node = bwd[meet]
+                while node is not None:
+                    path.append(node)
+                    node = bwd[node]
+                return path
+        return []
+
+    def _expand(self, frontier, seen, depth, other_depth):
+        """
+        Expand one full BFS layer. If the two searches touch, return the
+        meeting cell with the shortest combined length (the first touch in
+        a layer is not always the best one).
+        """
+        nxt, meet, best = [], None, None
+        for cur in frontier:
+            self.nodes_expanded += 1
+            d = depth[cur] + 1
+            for nb in self.neighbors(cur):
+                if nb in seen:
+                    continue
+                seen[nb] = cur
+                depth[nb] = d
+                nxt.append(nb)
+                if nb in other_depth:
+                    total = d + other_depth[nb]
+                    if best is None or total < best:
+                        meet, best = nb, total
+        return nxt, meet
+
+
+def make_pathfinder(engine: str, matrix, grid_rows: int, grid_cols: int, passable=None,
+                    adjacency=None):
+    """
+    Build the engine called `engine` over `matrix`.
+    'cache' is the per-level BFS-tree cache from path_cache.py,
+    'corridor' the compressed maze graph from corridor_graph.py and
+    'hierarchical' the clustered HPA* engine from hierarchical.py.
+    `adjacency` must describe the same walkability as `passable`; the
+    grid-level engines search it directly.
+    """
+    if passable is None:
+        passable = lambda c, r: is_walkable_tile(matrix[r][c])
+    if engine == 'cache':
+        from .path_cache import PathCache
+        return PathCache(matrix, grid_rows, grid_cols, passable=passable,
+                         adjacency=adjacency)
+    if engine == 'corridor':
+        from .corridor_graph import CorridorGraph
+        return CorridorGraph(grid_rows, grid_cols, passable)
+    if engine == 'hierarchical':
+        from .hierarchical import HierarchicalPathfinder
+        return HierarchicalPathfinder(grid_rows, grid_cols, passable)
+    try:
+        cls = ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"unknown pathfinder engine {engine!r}; "
+                         f"expected one of {ENGINE_NAMES}")
+    return cls(grid_rows, grid_cols, passable, adjacency)
+
+
+ENGINES = {
+    cls.name: cls
+    for cls in (BFSPathfinder, AStarPathfinder, BidirectionalPathfinder)
+}
+ENGINE_NAMES = sorted(ENGINES) + ['cache', 'corridor', 'hierarchical']
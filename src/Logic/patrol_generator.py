@@ -2,6 +2,9 @@
 
 import random
 from collections import deque
+from .path_cache import PathCache
+from .pathfinding import BFSPathfinder
+from .grid import Grid
 
 class PatrolGenerator:
     """
@@ -10,11 +13,15 @@ class PatrolGenerator:
       - patrol area bounding box
       - list of Enemy objects
       - difficulty, base_marker, palette
-    Then calls .setup_patrols() to do it all at once.
+      - optionally the level's LevelLayers, whose neighbour table is then
+        used instead of scanning the matrix
+      - a seed for its private random.Random (None: a fresh one)
+    Then calls .setup_patrols() to do it all at once, or, given `routes`
+    made earlier (e.g. from a level pack), just assigns those.
     """
 
     def __init__(self,
-                 matrix: list[list[int]],
+                 matrix: Grid,
                  grid_cols: int,
                  grid_rows: int,
                  tile_size: tuple[float, float],
@@ -24,7 +31,10 @@ class PatrolGenerator:
                  base_marker: int,
                  palette: list[tuple[int,int,int,int]],
                  wall_code: int = 0,
-                 floor_codes: tuple[int,...] = (1,2)
+                 floor_codes: tuple[int,...] = (1,2),
+                 level=None,
+                 seed: int | None = None,
+                 routes: list | None = None
                 ):
         # store all inputs
         self.matrix            = matrix
@@ -38,9 +48,18 @@ class PatrolGenerator:
         self.palette           = palette
         self.WALL              = wall_code
         self.FLOORS            = set(floor_codes)
+        self.level             = level
+        self.rng               = random.Random(seed)
+
+        # BFS trees over the whole patrol region, built in generate_routes
+        self.path_cache        = None
+        self._cached_region    = None
 
         # do all the work now
-        self.setup_patrols()
+        if routes is None:
+            self.setup_patrols()
+        else:
+            self.assign_routes(routes)
 
     def setup_patrols(self):
         """Extract region, compute routes, assign to each Enemy."""
@@ -48,10 +67,12 @@ class PatrolGenerator:
         routes = self.generate_routes(region,
                                        len(self.enemies),
                                        self.difficulty_level)
+        self.assign_routes(routes)
 
-        # assign each enemy its route, start‐pos, marker & color
+    def assign_routes(self, routes):
+        """Give each enemy its route, start‐pos, marker & color."""
         for i, (enemy, route) in enumerate(zip(self.enemies, routes)):
-            enemy.complete_patrol_route = route
+            enemy.set_patrol_route(route)
             if route:
                 c, r = route[0]
                 enemy.position = (c*self.PIXEL_ONE_X + self.PIXEL_ONE_X/2,
@@ -68,30 +89,48 @@ class PatrolGenerator:
         c1 = int(x1 // self.PIXEL_ONE_X)
         r1 = int(y1 // self.PIXEL_ONE_Y)
 
+        c0, r0 = max(c0, 0), max(r0, 0)
+        c1, r1 = min(c1, self.GRID_COLS), min(r1, self.GRID_ROWS)
+
         region = set()
+        # floor_codes only: doors, the key and hidden rooms are walkable
+        # but never part of a patrol
+        if isinstance(self.matrix, Grid):
+            data, floors = self.matrix.data, self.FLOORS
+            for r in range(r0, r1):
+                base = r * self.GRID_COLS
+                for c in range(c0, c1):
+                    if data[base + c] in floors:
+                        region.add((c, r))
+            return region
         for r in range(r0, r1):
             for c in range(c0, c1):
-                if (0 <= c < self.GRID_COLS and 0 <= r < self.GRID_ROWS
-                    and self.matrix[r][c] in self.FLOORS):
+                if self.matrix[r][c] in self.FLOORS:
                     region.add((c, r))
         return region
 
     #main patrol logic
 
     def get_cell_neighbors(self, cell):
+        """In-bounds 4-neighbours; only the walkable ones when we have a level."""
+        if self.level is not None:
+            if self.level.is_walkable(cell):
+                yield from self.level.adjacency.cell_neighbors(cell)
+            return
         c, r = cell
         for nc, nr in ((c+1,r),(c-1,r),(c,r+1),(c,r-1)):
-            yield (nc, nr)
+            if 0 <= nc < self.GRID_COLS and 0 <= nr < self.GRID_ROWS:
+                yield (nc, nr)
 
     def choose_starts(self, region, n):
         if not region or n<=0: return []
         region_list = list(region)
-        chosen = [random.choice(region_list)]
+        chosen = [self.rng.choice(region_list)]
         threshold = max(len(region_list)**0.5, 1)
         while len(chosen)<n and region_list:
-            cand = random.choice(region_list)
+            cand = self.rng.choice(region_list)
             if all(abs(cand[0]-o[0]) + abs(cand[1]-o[1]) >= threshold for o in chosen)\
-               or random.random()<0.3:
+               or self.rng.random()<0.3:
                 chosen.append(cand)
             region_list.remove(cand)
         return chosen
@@ -110,15 +149,25 @@ class PatrolGenerator:
         return parts
 
     def dfs_euler(self, start, region):
-        visited, route = set(), []
-        def dfs(c):
-            visited.add(c)
-            route.append(c)
-            for nb in self.get_cell_neighbors(c):
+        """
+        Walk a DFS tree of the region, stepping back through each cell on
+        the way out. Runs on an explicit stack: on an 80x80 maze one
+        guard's region is thousands of cells deep.
+        """
+        visited, route = {start}, [start]
+        stack = [(start, self.get_cell_neighbors(start))]
+        while stack:
+            c, neighbors = stack[-1]
+            for nb in neighbors:
                 if nb in region and nb not in visited:
-                    dfs(nb)
-                    route.append(c)
-        dfs(start)
+                    visited.add(nb)
+                    route.append(nb)
+                    stack.append((nb, self.get_cell_neighbors(nb)))
+                    break
+            else:
+                stack.pop()
+                if stack:
+                    route.append(stack[-1][0])  # back out to the parent
         return route
 
     def optimize_route(self, route):
@@ -135,19 +184,11 @@ class PatrolGenerator:
         return out
 
     def find_bfs_path(self, start, goal, region):
-        q = deque([start]); came={start:None}
-        while q:
-            cur = q.popleft()
-            if cur==goal:
-                path=[]
-                while cur is not None:
-                    path.append(cur)
-                    cur=came[cur]
-                return path[::-1]
-            for nb in self.get_cell_neighbors(cur):
-                if nb in region and nb not in came:
-                    came[nb]=cur; q.append(nb)
-        return []
+        if region is self._cached_region:
+            return self.path_cache.find_path(start, goal)
+        engine = BFSPathfinder(self.GRID_ROWS, self.GRID_COLS,
+                               lambda c, r: (c, r) in region)
+        return engine.find_path(start, goal)
 
     def get_deadends_together(self, routes, region):
         for i, rt in enumerate(routes):
@@ -168,6 +209,9 @@ class PatrolGenerator:
         return routes
 
     def generate_routes(self, region, guard_count, diff_lvl):
+        self.path_cache = PathCache(self.matrix, self.GRID_ROWS, self.GRID_COLS,
+                                    passable=lambda c, r: (c, r) in region)
+        self._cached_region = region
         starts = self.choose_starts(region, guard_count)
         parts  = self.partition(region, starts)
         routes = []
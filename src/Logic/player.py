@@ -0,0 +1 @@
+Player.py
\ No newline at end of file
@@ -0,0 +1,96 @@
+# src/Logic/pregenerate.py
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .logic_setup import LogicSetup
+
+class LevelPregenerator:
+    """
+    Builds the next level on a worker thread while the menus are up.
+
+    start(spec...) begins generating a LogicSetup (maze, key/door,
+    patrol routes and the rest of generate_game) in the background;
+    take(spec...) hands it over, waiting if it isn't done yet, or
+    generates inline if the spec asked for isn't the one started. Level
+    generation has no shared state (each level has its own seeded RNGs),
+    so this is safe in a thread.
+
+    There is one worker. If the spec changes while it is still building
+    the old one, the new build waits for it to finish rather than being
+    queued behind it, so take() never waits for a level nobody wants.
+
+    Arguments are those of LogicSetup; pack= goes to generate_game.
+    """
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pregenerate')
+        self.lock     = threading.RLock()
+        self.pending  = None  # (spec, future); future is None until the worker is free
+        self.waiting  = None  # (spec, args, kwargs) to submit once it is
+        self.running  = None  # the last future submitted
+        self.hits     = 0     # handed over from the background
+        self.misses   = 0     # generated inline by take()
+
+    @staticmethod
+    def _spec(args, kwargs):
+        return (args, tuple(sorted(kwargs.items())))
+
+    @staticmethod
+    def _build(args, kwargs):
+        kwargs = dict(kwargs)
+        pack = kwargs.pop('pack', None)
+        logic = LogicSetup(*args, **kwargs)
+        logic.generate_game(pack=pack)
+        return logic
+
+    def _submit(self, spec, args, kwargs):
+        future = self.executor.submit(self._build, args, kwargs)
+        self.pending = (spec, future)
+        self.running = future
+        future.add_done_callback(self._worker_free)
+
+    def _worker_free(self, future):
+        """A build finished: start the level asked for meanwhile, if any."""
+        with self.lock:
+            if self.running is future and self.waiting is not None:
+                spec, args, kwargs = self.waiting
+                self.waiting = None
+                self._submit(spec, args, kwargs)
+
+    def start(self, *args, **kwargs):
+        """Pregenerate this level, dropping any other one still pending."""
+        spec = self._spec(args, kwargs)
+        with self.lock:
+            if self.pending is not None and self.pending[0] == spec:
+                return
+            self.waiting = None
+            running = self.running
+            if running is not None and not running.done() and not running.cancel():
+                # the worker is busy on a stale level: start this one when it's free
+                self.pending = (spec, None)
+                self.waiting = (spec, args, kwargs)
+                return
+            self._submit(spec, args, kwargs)
+
+    def ready(self) -> bool:
+        pending = self.pending
+        return pending is not None and pending[1] is not None and pending[1].done()
+
+    def take(self, *args, **kwargs) -> LogicSetup:
+        """The generated level for this spec, from the background if we have it."""
+        spec = self._spec(args, kwargs)
+        with self.lock:
+            pending, self.pending = self.pending, None
+            self.waiting = None
+        if pending is not None and pending[0] == spec and pending[1] is not None:
+            self.hits += 1
+            return pending[1].result()
+        if pending is not None and pending[1] is not None:
+            pending[1].cancel()
+        self.misses += 1
+        return self._build(args, kwargs)
+
+    def shutdown(self):
+        with self.lock:
+            self.pending = None
+            self.waiting = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,239 @@
+# src/Logic/replay.py
+"""
+Binary replays: the level spec and seed, then one input byte per sim step.
+
+    header   MAGIC, VERSION, rows, cols, enemy_count, seed, step_hz,
+             checksum_every, difficulty (length-prefixed UTF-8)
+    records  one byte per step: bits 0-3 up/down/left/right held,
+             bit 4 the player paused just before this step; after every
+             checksum_every-th step, a 4-byte state_checksum() of the
+             LogicSetup as it was after that step
+
+The sim is deterministic given the seed and the inputs (fixed timestep,
+frozen AI-scheduler clock), so that is all a replay has to hold: about
+60 bytes per second of play. A file cut short by a crash still plays up
+to its last whole record.
+
+    python -m Logic.replay game.rpl    # re-simulate headless, flat out
+"""
+
+import argparse
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+
+from .controls import Controls
+from .logic_setup import LogicSetup
+
+MAGIC   = b'SGRP'
+VERSION = 1
+HEADER  = struct.Struct('<4sBxHHHqHH')
+CRC     = struct.Struct('<I')
+
+UP, DOWN, LEFT, RIGHT, PAUSE = 1, 2, 4, 8, 16
+
+def frozen_clock():
+    """AIScheduler clock for recorded games: every queued replan is serviced."""
+    return 0.0
+
+# LogicSetup options for recorded games: the frozen clock, and the
+# per-Enemy patrol path whatever the guard count (the NumPy swarm only
+# matches it to float precision, and the checksums compare exact doubles)
+RECORD_OPTIONS = {'clock': frozen_clock, 'swarm': False}
+
+def make_logic(difficulty, rows, cols, enemy_count, seed) -> LogicSetup:
+    """The level a replay (or a recording) of this spec plays on."""
+    logic = LogicSetup(difficulty, rows, cols, enemy_count, seed=seed, **RECORD_OPTIONS)
+    logic.generate_game()
+    return logic
+
+def encode(controls, paused=False) -> int:
+    return ((UP if controls.up else 0) | (DOWN if controls.down else 0)
+            | (LEFT if controls.left else 0) | (RIGHT if controls.right else 0)
+            | (PAUSE if paused else 0))
+
+def decode(byte: int):
+    """(Controls, paused) from a record byte."""
+    return (Controls(bool(byte & UP), bool(byte & DOWN),
+                     bool(byte & LEFT), bool(byte & RIGHT)), bool(byte & PAUSE))
+
+def state_checksum(logic) -> int:
+    """CRC32 of the tiles, the player and every guard: cheap, and any divergence shows."""
+    player = logic.player
+    crc = zlib.crc32(logic.matrix.data)
+    crc = zlib.crc32(struct.pack('<Iddbb', logic.ticks, player.pos_X, player.pos_Y,
+                                 player.has_key, player.game_over), crc)
+    for en in logic.enemies:
+        x, y = en.get_position()
+        crc = zlib.crc32(struct.pack('<ddi', x, y, en.patrol_index), crc)
+        crc = zlib.crc32(f"{en.state}:{en.direction}".encode(), crc)
+    return crc
+
+#region recording
+
+class ReplayWriter:
+    """
+    Records a game as it is played. record() only appends to an in-memory
+    buffer; full chunks go to a writer thread, so the frame never waits
+    on the disk. close() (or leaving the `with` block) writes the rest.
+    """
+    def __init__(self, path, difficulty: str, rows: int, cols: int,
+                 enemy_count: int, seed: int, step_hz: int = 60,
+                 checksum_every: int = 60, chunk: int = 4096):
+        self.checksum_every = checksum_every
+        self.chunk = chunk
+        self.ticks = 0
+        name = difficulty.encode()
+        self.buf = bytearray(HEADER.pack(MAGIC, VERSION, rows, cols, enemy_count,
+                                         seed, step_hz, checksum_every))
+        self.buf.append(len(name))
+        self.buf += name
+        self.file = open(path, 'wb')
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._drain, name='replay-writer', daemon=True)
+        self.thread.start()
+
+    def _drain(self):
+        while True:
+            data = self.queue.get()
+            if data is None:
+                break
+            self.file.write(data)
+        self.file.close()
+
+    def record(self, controls, logic, paused: bool = False):
+        """Log one sim step; call right after logic.step(controls)."""
+        self.buf.append(encode(controls, paused))
+        self.ticks += 1
+        if self.checksum_every and self.ticks % self.checksum_every == 0:
+            self.buf += CRC.pack(state_checksum(logic))
+        if len(self.buf) >= self.chunk:
+            self.queue.put(bytes(self.buf))
+            self.buf.clear()
+
+    def close(self):
+        if self.thread.is_alive():
+            if self.buf:
+                self.queue.put(bytes(self.buf))
+                self.buf.clear()
+            self.queue.put(None)
+            self.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+#endregion
+
+#region playback
+
+class ReplayReader:
+    """A replay file: the header fields as attributes, then steps()."""
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < HEADER.size + 1:
+            raise ValueError(f"{path}: not a replay (too short)")
+        (magic, version, self.rows, self.cols, self.enemy_count, self.seed,
+         self.step_hz, self.checksum_every) = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a replay")
+        if version != VERSION:
+            raise ValueError(f"{path}: replay version {version}, expected {VERSION}")
+        n = data[HEADER.size]
+        start = HEADER.size + 1
+        self.difficulty = data[start:start + n].decode()
+        self.data = memoryview(data)[start + n:]
+
+    def make_logic(self) -> LogicSetup:
+        return make_logic(self.difficulty, self.rows, self.cols, self.enemy_count, self.seed)
+
+    def steps(self):
+        """Yield (controls, paused, checksum or None) per recorded step."""
+        data, every = self.data, self.checksum_every
+        i, tick = 0, 0
+        while i < len(data):
+            byte = data[i]
+            i += 1
+            tick += 1
+            checksum = None
+            if every and tick % every == 0:
+                if i + CRC.size > len(data):
+                    return  # cut off mid-record
+                checksum = CRC.unpack_from(data, i)[0]
+                i += CRC.size
+            controls, paused = decode(byte)
+            yield controls, paused, checksum
+
+class Divergence(Exception):
+    """The re-simulated state no longer matches the recorded checksums."""
+    def __init__(self, tick, expected, actual):
+        super().__init__(f"replay diverged at tick {tick}: "
+                         f"checksum {actual:08x}, recorded {expected:08x}")
+        self.tick, self.expected, self.actual = tick, expected, actual
+
+class Playback:
+    """
+    Feeds a replay's inputs to a fresh LogicSetup one step at a time,
+    checking the recorded checksums as it goes. Headless callers just
+    run(); the game loop calls step() at its own pace and draws.
+    """
+    def __init__(self, reader: ReplayReader):
+        self.reader = reader
+        self.logic  = reader.make_logic()
+        self.result = {'won': False, 'lost': False}
+        self.checked = 0  # checksums verified so far
+        self.pauses  = 0
+        self._steps  = reader.steps()
+        self.done    = False
+
+    def step(self) -> dict:
+        """Play one recorded step; raises Divergence on a checksum mismatch."""
+        try:
+            controls, paused, checksum = next(self._steps)
+        except StopIteration:
+            self.done = True
+            return self.result
+        self.pauses += paused
+        self.result = self.logic.step(controls)
+        if checksum is not None:
+            actual = state_checksum(self.logic)
+            if actual != checksum:
+                raise Divergence(self.logic.ticks, checksum, actual)
+            self.checked += 1
+        return self.result
+
+    def run(self) -> dict:
+        """Play the whole replay as fast as possible."""
+        while not self.done:
+            self.step()
+        return self.result
+
+#endregion
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-simulate a replay headless and verify it.")
+    parser.add_argument('replay')
+    args = parser.parse_args(argv)
+
+    playback = Playback(ReplayReader(args.replay))
+    start = time.perf_counter()
+    try:
+        result = playback.run()
+    except Divergence as err:
+        print(err, file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    logic = playback.logic
+    outcome = 'won' if result['won'] else 'lost' if result['lost'] else 'unfinished'
+    print(f"{logic.ticks} ticks, {outcome}, {playback.checked} checksums ok, "
+          f"{logic.ticks / (elapsed or 1e-9):.0f} ticks/s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# src/Logic/spatial_hash.py
+
+class SpatialHash:
+    """
+    Uniform-grid spatial hash of entities keyed by the grid cell they
+    stand on (col, row).
+
+    move() is called whenever an entity may have moved and only touches
+    the buckets when its cell actually changed, so keeping the hash up to
+    date costs one dict lookup per entity per frame.
+
+        at(cell)         who occupies cell            O(1)
+        within(cell, k)  who is within k cells        O(k^2), k is small
+                         (Manhattan, like the guards' own distance tests)
+
+    Entities are hashed by identity, so any object works.
+    """
+    def __init__(self):
+        self.buckets = {}  # cell -> list of entities
+        self.where   = {}  # entity -> cell
+
+    def __len__(self):
+        return len(self.where)
+
+    def __contains__(self, entity):
+        return entity in self.where
+
+    def cell_of(self, entity):
+        return self.where.get(entity)
+
+    def insert(self, entity, cell):
+        if entity in self.where:
+            self.move(entity, cell)
+            return
+        self.where[entity] = cell
+        self.buckets.setdefault(cell, []).append(entity)
+
+    def remove(self, entity):
+        cell = self.where.pop(entity, None)
+        if cell is None:
+            return
+        bucket = self.buckets[cell]
+        bucket.remove(entity)
+        if not bucket:
+            del self.buckets[cell]
+
+    def move(self, entity, cell):
+        """Update entity's cell; a no-op unless it changed cell."""
+        old = self.where.get(entity)
+        if old == cell:
+            return
+        if old is not None:
+            bucket = self.buckets[old]
+            bucket.remove(entity)
+            if not bucket:
+                del self.buckets[old]
+        self.where[entity] = cell
+        self.buckets.setdefault(cell, []).append(entity)
+
+    def at(self, cell):
+        """Entities on `cell` (a fresh list)."""
+        return list(self.buckets.get(cell, ()))
+
+    def within(self, cell, k: int):
+        """Entities at Manhattan distance <= k from `cell`."""
+        buckets = self.buckets
+        c0, r0 = cell
+        if len(buckets) <= (2 * k + 1) * (k + 1):
+            # fewer occupied cells than cells in the diamond: scan those
+            return [e for (c, r), bucket in buckets.items()
+                    if abs(c - c0) + abs(r - r0) <= k for e in bucket]
+        found = []
+        for dr in range(-k, k + 1):
+            span = k - abs(dr)
+            for dc in range(-span, span + 1):
+                bucket = buckets.get((c0 + dc, r0 + dr))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def pairs_within(self, k: int = 0):
+        """
+        Every unordered pair of entities within k cells of each other
+        (k=0: sharing a cell), e.g. for separating guards.
+        """
+        seen = set()
+        for cell, bucket in self.buckets.items():
+            for a in bucket:
+                for b in self.within(cell, k):
+                    if a is not b:
+                        key = (id(a), id(b)) if id(a) < id(b) else (id(b), id(a))
+                        if key not in seen:
+                            seen.add(key)
+                            yield (a, b)
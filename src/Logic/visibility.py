@@ -0,0 +1,123 @@
+# src/Logic/visibility.py
+
+import time
+
+def bresenham(x0, y0, x1, y1):
+    """
+    Bresenham's algorithm: all (col,row) from (x0,y0) to (x1,y1) inclusive.
+    The cells only depend on the offset between the ends, which is what
+    lets VisibilitySet precompute one line per offset.
+    """
+    cells = []
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    x, y = x0, y0
+    sx = 1 if x1 > x0 else -1
+    sy = 1 if y1 > y0 else -1
+    if dx > dy:
+        err = dx / 2
+        while x != x1:
+            cells.append((x, y))
+            err -= dy
+            if err < 0:
+                y += sy
+                err += dx
+            x += sx
+    else:
+        err = dy / 2
+        while y != y1:
+            cells.append((x, y))
+            err -= dx
+            if err < 0:
+                x += sx
+                err += dy
+            y += sy
+    cells.append((x1, y1))
+    return cells
+
+
+class VisibilitySet:
+    """
+    Precomputed line-of-sight (a potentially-visible set) for every cell
+    pair within `radius` columns and rows of each other.
+
+    For each offset (dx, dy) in that window there is one packed bitset
+    over all cells: bit `src` says whether the Bresenham line from src to
+    src + (dx, dy) crosses no solid cell. It is built with whole-grid
+    big-int shifts and ANDs, one per cell on the offset's line, instead
+    of walking lines cell by cell, so building it takes milliseconds.
+    A query is then a single bit test.
+
+    The grid is padded by `radius` solid cells on every side so shifted
+    lines never wrap into the next row.
+    """
+    def __init__(self, solid, grid_rows: int, grid_cols: int, radius: int = 5):
+        self.solid     = solid  # flat row-major bitmap, 1 = blocks sight
+        self.GRID_ROWS = grid_rows
+        self.GRID_COLS = grid_cols
+        self.radius    = radius
+        self.width     = grid_cols + 2 * radius   # padded row stride
+        self.window    = 2 * radius + 1
+
+        # relative padded-index deltas along each offset's line
+        self.lines = {}
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                self.lines[(dx, dy)] = [
+                    ry * self.width + rx for rx, ry in bresenham(0, 0, dx, dy)
+                ]
+
+        self.bits = []  # offset slot -> bytes, little-endian bitset
+        self.builds = 0
+        self.build_time = 0.0
+        self.build()
+
+    def _slot(self, dx, dy):
+        return (dy + self.radius) * self.window + (dx + self.radius)
+
+    def _open_bits(self) -> int:
+        """Padded grid as one int, bit i set where padded cell i is see-through."""
+        r, C = self.radius, self.GRID_COLS
+        pad_row = b'0' * self.width
+        rows = [pad_row] * r
+        opened = bytes.maketrans(b'\x00\x01', b'10')
+        for row in range(self.GRID_ROWS):
+            cells = bytes(self.solid[row * C:(row + 1) * C]).translate(opened)
+            rows.append(b'0' * r + cells + b'0' * r)
+        rows.extend([pad_row] * r)
+        # int() reads most significant digit first, so reverse for bit i = cell i
+        return int(b''.join(rows)[::-1] or b'0', 2)
+
+    def build(self):
+        start = time.perf_counter()
+        self.builds += 1
+        opened = self._open_bits()
+        n = self.width * (self.GRID_ROWS + 2 * self.radius)
+        nbytes = (n + 7) // 8
+        bits = [None] * (self.window * self.window)
+        for (dx, dy), deltas in self.lines.items():
+            acc = -1  # all ones
+            for d in deltas:
+                acc &= (opened >> d) if d >= 0 else (opened << -d)
+            acc &= (1 << n) - 1
+            bits[self._slot(dx, dy)] = acc.to_bytes(nbytes, 'little')
+        self.bits = bits
+        self.build_time = time.perf_counter() - start
+
+    def patch(self, cell=None):
+        """A cell's solidity changed; the whole-grid build is cheap enough to redo."""
+        self.build()
+
+    def visible(self, src, dst):
+        """
+        True/False if the line from src to dst is clear/blocked, or None
+        when dst is outside the precomputed window (caller walks the line).
+        """
+        dx, dy = dst[0] - src[0], dst[1] - src[1]
+        r = self.radius
+        if dx < -r or dx > r or dy < -r or dy > r:
+            return None
+        if not (0 <= src[0] < self.GRID_COLS and 0 <= src[1] < self.GRID_ROWS):
+            return None
+        i = (src[1] + r) * self.width + src[0] + r
+        return (self.bits[self._slot(dx, dy)][i >> 3] >> (i & 7)) & 1 == 1
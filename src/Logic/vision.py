@@ -0,0 +1,121 @@
+# src/Logic/vision.py
+
+import math
+from .path_cache import LRUCache
+
+# (xx, xy, yx, yy) transforms mapping octant 0 onto the other seven
+OCTANTS = (
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1),
+)
+
+# Enemy.direction -> unit facing vector (rows grow downward)
+FACINGS = {
+    'up':    (0, -1),
+    'down':  (0, 1),
+    'left':  (-1, 0),
+    'right': (1, 0),
+}
+
+def shadowcast(origin, radius: int, blocks):
+    """
+    Field of view by recursive shadowcasting: every cell within `radius`
+    (Euclidean) of origin that has an unblocked line to it, including the
+    blocking cells themselves. `blocks(col, row)` must be True outside the
+    map; those cells may show up in the result too.
+    """
+    seen = {origin}
+    for octant in OCTANTS:
+        _cast(origin, 1, 1.0, 0.0, radius, octant, blocks, seen)
+    return seen
+
+def _cast(origin, row, start, end, radius, octant, blocks, seen):
+    """Scan one octant row by row, recursing under each blocker."""
+    if start < end:
+        return
+    ox, oy = origin
+    xx, xy, yx, yy = octant
+    r2 = radius * radius
+    new_start = start
+    for j in range(row, radius + 1):
+        dx, dy = -j - 1, -j
+        blocked = False
+        while dx <= 0:
+            dx += 1
+            x, y = ox + dx * xx + dy * xy, oy + dx * yx + dy * yy
+            l_slope = (dx - 0.5) / (dy + 0.5)
+            r_slope = (dx + 0.5) / (dy - 0.5)
+            if start < r_slope:
+                continue
+            if end > l_slope:
+                break
+            wall = blocks(x, y)
+            if dx * dx + dy * dy <= r2:
+                seen.add((x, y))
+            if blocked:
+                if wall:
+                    new_start = r_slope
+                else:
+                    blocked = False
+                    start = new_start
+            elif wall and j < radius:
+                blocked = True
+                _cast(origin, j + 1, start, l_slope, radius, octant, blocks, seen)
+                new_start = r_slope
+        if blocked:
+            break
+
+
+class VisionCones:
+    """
+    Guard vision cones: the shadowcast field of view from a cell, cut down
+    to the cells within `half_angle` degrees of the facing direction.
+
+    Cones are memoized per (cell, facing) in a bounded LRUCache shared by
+    every guard on the level, so a guard standing still or looping its
+    patrol route never recomputes one. Clear with invalidate() when a
+    tile's solidity changes.
+    """
+    def __init__(self, solid, grid_rows: int, grid_cols: int,
+                 radius: int = 4, half_angle: float = 45.0, capacity: int = 512):
+        self.solid      = solid  # flat row-major bitmap, 1 = blocks sight
+        self.GRID_ROWS  = grid_rows
+        self.GRID_COLS  = grid_cols
+        self.radius     = radius
+        self.cos_half   = math.cos(math.radians(half_angle))
+        self.cache      = LRUCache(capacity)
+
+        # profiling counter: cones actually shadowcast
+        self.computed   = 0
+
+    def blocks(self, c, r):
+        if not (0 <= c < self.GRID_COLS and 0 <= r < self.GRID_ROWS):
+            return True
+        return self.solid[r * self.GRID_COLS + c] == 1
+
+    def invalidate(self, cell=None):
+        self.cache.clear()
+
+    def cone(self, cell, facing: str) -> frozenset:
+        """Cells a guard on `cell` looking `facing` can see (including its own)."""
+        key = (cell, facing)
+        cells = self.cache.get(key)
+        if cells is None:
+            cells = self._compute(cell, facing)
+            self.cache.put(key, cells)
+        return cells
+
+    def _compute(self, cell, facing):
+        self.computed += 1
+        fx, fy = FACINGS[facing]
+        cx, cy = cell
+        limit = self.cos_half - 1e-9
+        out = []
+        for x, y in shadowcast(cell, self.radius, self.blocks):
+            dx, dy = x - cx, y - cy
+            if dx == 0 and dy == 0:
+                out.append((x, y))
+            elif dx * fx + dy * fy >= limit * math.hypot(dx, dy):
+                if 0 <= x < self.GRID_COLS and 0 <= y < self.GRID_ROWS:
+                    out.append((x, y))
+        return frozenset(out)
@@ -1,17 +1,51 @@
+import argparse
+import os
+import time
 import pygame
 from Graphics.main_graphics  import MainGraphics
-from Logic.logic_setup      import LogicSetup
+from Logic.fixed_timestep   import FixedTimestep
+from Logic.pregenerate      import LevelPregenerator
+from Logic.replay           import ReplayWriter, ReplayReader, Playback, RECORD_OPTIONS
 from Graphics.post_game_menu import PostGameMenu
 from Graphics.pre_game_tip  import PreGameTip
 from Graphics.pause         import Pause
+from Graphics.input         import read_controls
 
-def main():
+SIM_HZ = 60  # fixed simulation steps per second
+
+def watch_replay(path):
+    """Play a recorded game back on screen at normal speed."""
+    pygame.init()
+    screen = pygame.display.set_mode((1000, 750))
+    clock  = pygame.time.Clock()
+    gfx    = MainGraphics()
+
+    playback = Playback(ReplayReader(path))
+    bt, mat, grid_size, tile_size, key_pos, door_pos, player, enemies, level = \
+        playback.logic.get_graphics_attributes()
+    gfx.draw_map_in_game(bt, mat, grid_size, tile_size, player, enemies, level=level)
+
+    timestep = FixedTimestep(playback.reader.step_hz)
+    while not playback.done:
+        if any(e.type == pygame.QUIT for e in pygame.event.get()):
+            break
+        for _ in range(timestep.advance()):
+            playback.step()  # raises replay.Divergence if the sim drifted
+        gfx.map_renderer.draw_map(alpha=timestep.alpha)
+        clock.tick(60)
+    pygame.quit()
+
+def main(record_dir=None):
     pygame.init()
     screen = pygame.display.set_mode((1000, 750))
     clock  = pygame.time.Clock()
 
     gfx       = MainGraphics()
     post_menu = PostGameMenu(screen, clock)
+    pregen    = LevelPregenerator()
+    # a recorded level must replay identically: same seed, and the same
+    # options (frozen scheduler clock, no swarm) replay.make_logic uses
+    options   = dict(RECORD_OPTIONS) if record_dir else {}
     app_running = True
 
     while app_running:
@@ -21,25 +55,31 @@ def main():
 
         in_game = True
         while in_game and app_running:
-            logic = LogicSetup(
-                gfx.maze_difficulty,
-                gfx.rows,
-                gfx.cols,
-                gfx.enemy_count
-            )
+            spec = (gfx.maze_difficulty, gfx.rows, gfx.cols, gfx.enemy_count)
+            # usually already built while the post-game menu was up;
+            # otherwise it generates behind the tip
+            pregen.start(*spec, **options)
 
             # show the one-second “Press SPACE to pause” tip
             PreGameTip(screen).show()
 
-            logic.generate_game()
-            bt, mat, grid_size, tile_size, key_pos, door_pos, player, enemies = \
+            logic = pregen.take(*spec, **options)
+            recorder = None
+            if record_dir:
+                name = time.strftime('%Y%m%d-%H%M%S') + f'-{logic.seed}.rpl'
+                recorder = ReplayWriter(os.path.join(record_dir, name), gfx.maze_difficulty,
+                                        gfx.rows, gfx.cols, gfx.enemy_count, logic.seed,
+                                        step_hz=SIM_HZ)
+            bt, mat, grid_size, tile_size, key_pos, door_pos, player, enemies, level = \
                 logic.get_graphics_attributes()
 
             # initialize the map_renderer for this level
-            gfx.draw_map_in_game(bt, mat, grid_size, tile_size, player, enemies)
+            gfx.draw_map_in_game(bt, mat, grid_size, tile_size, player, enemies, level=level)
 
             # ─── PLAY LOOP ───────────────────────────────────────────────
             result = {'won': False, 'lost': False}
+            timestep = FixedTimestep(SIM_HZ)
+            paused = False
             while True:
                 # 1) Poll events
                 for e in pygame.event.get():
@@ -50,6 +90,8 @@ def main():
                         # Pause overlay (leaves the last frame on screen)
                         try:
                             Pause(screen).draw_pause()
+                            timestep.reset()  # don't catch up on the pause
+                            paused = True
                         except KeyboardInterrupt:
                             # Player pressed Q in the pause → back to main menu
                             in_game = False
@@ -58,24 +100,39 @@ def main():
                 if not app_running or not in_game:
                     break
 
-                # 2) Handle input & update logic
-                logic.handle_input(pygame.key.get_pressed())
-                result = logic.update()
+                # 2) Run the fixed sim steps this frame's time is worth
+                controls = read_controls()
+                for _ in range(timestep.advance()):
+                    result = logic.step(controls)
+                    if recorder:
+                        recorder.record(controls, logic, paused)
+                        paused = False
+                    if result['won'] or result['lost']:
+                        break
 
-                # 3) Draw the current game frame
-                gfx.map_renderer.draw_map()
+                # 3) Draw the current game frame, between the last two steps
+                gfx.map_renderer.draw_map(alpha=timestep.alpha)
 
-                # 4) Cap to 60fps
+                # 4) Cap drawing to 60fps (the sim runs on its own clock)
                 clock.tick(60)
 
                 # 5) Check for end-of-level
                 if result['won'] or result['lost']:
                     break
 
+            if recorder:
+                recorder.close()
             if not app_running:
                 break
 
             # ─── POST-GAME MENU ─────────────────────────────────────────
+            # build the likely next level while the menu is up: one size
+            # bigger after a win, the same settings again after a loss
+            if result['won']:
+                pregen.start(gfx.maze_difficulty, gfx.rows + 1, gfx.cols + 1,
+                             gfx.enemy_count, **options)
+            else:
+                pregen.start(*spec, **options)
             choice = post_menu.show(won=result['won'])
             if choice == 'next':
                 # bump up difficulty/size for next run
@@ -87,7 +144,17 @@ def main():
             # for 'new' or 'menu' we just fall through and re-show PRE-GAME
             in_game = False
 
+    pregen.shutdown()
     pygame.quit()
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--record', metavar='DIR', help='save a replay of every level played')
+    parser.add_argument('--replay', metavar='FILE', help='watch a recorded replay')
+    args = parser.parse_args()
+    if args.replay:
+        watch_replay(args.replay)
+    else:
+        if args.record:
+            os.makedirs(args.record, exist_ok=True)
+        main(record_dir=args.record)
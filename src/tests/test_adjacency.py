@@ -0,0 +1,67 @@
+# tests/test_adjacency.py
+import random
+import pytest
+from Logic.adjacency import Adjacency
+from Logic.grid import Grid
+from Logic.level_layers import LevelLayers
+from Logic.map_creation import MapCreation
+from Logic.path_cache import PathCache
+from Logic.pathfinding import BFSPathfinder
+
+@pytest.fixture
+def layers():
+    # key (4) at (1,1) splits the corridor; walls are 0
+    terrain = Grid.from_rows([[1, 1, 1, 0],
+                              [0, 4, 0, 0],
+                              [1, 1, 1, 1]])
+    return LevelLayers(terrain, 3, 4)
+
+def neighbors_of(adj, cell):
+    return list(adj.cell_neighbors(cell))
+
+def test_rows_hold_walkable_neighbours_in_search_order(layers):
+    adj = layers.adjacency
+    assert neighbors_of(adj, (1, 0)) == [(2, 0), (0, 0)]
+    assert neighbors_of(adj, (1, 2)) == [(2, 2), (0, 2)]
+    assert neighbors_of(adj, (1, 1)) == []   # the key isn't walkable
+    assert adj.degree[0 * 4 + 3] == 0        # nor is a wall
+
+def test_refresh_patches_in_place(layers):
+    adj = layers.adjacency
+    layers.terrain[1][1] = 1  # key picked up
+    layers.refresh((1, 1))
+    assert adj.builds == 1
+    assert neighbors_of(adj, (1, 1)) == [(1, 2), (1, 0)]
+    assert (1, 1) in neighbors_of(adj, (1, 0))
+    assert (1, 1) in neighbors_of(adj, (1, 2))
+
+def test_removing_a_wall_falls_back_to_rebuild(layers):
+    layers.terrain[1][0] = 1
+    layers.refresh((0, 1))
+    assert layers.adjacency.builds == 2
+    assert (0, 1) in neighbors_of(layers.adjacency, (0, 0))
+
+def random_level(seed, difficulty):
+    grid = MapCreation(difficulty, 8, 8, 0, seed=seed).generate_maze()
+    return LevelLayers(grid, len(grid), len(grid[0]))
+
+@pytest.mark.parametrize("seed, difficulty", [(1, "hard"), (2, "easy")])
+def test_flat_searches_match_tuple_searches(seed, difficulty):
+    level = random_level(seed, difficulty)
+    R, C = level.GRID_ROWS, level.GRID_COLS
+    plain = BFSPathfinder(R, C, level.passable)
+    flat  = BFSPathfinder(R, C, level.passable, level.adjacency)
+    cache = PathCache(level.terrain, R, C, passable=level.passable,
+                      adjacency=level.adjacency)
+    cells = [(c, r) for r in range(R) for c in range(C) if level.passable(c, r)]
+    rng = random.Random(seed)
+    for _ in range(30):
+        a, b = rng.choice(cells), rng.choice(cells)
+        expected = plain.find_path(a, b)
+        assert flat.find_path(a, b) == expected
+        assert len(cache.find_path(a, b)) == len(expected)
+
+def test_exact_rows_without_solidity():
+    adj = Adjacency(bytearray([1, 1, 0, 1]), 2, 2)
+    assert list(adj.neighbors(0)) == [1]
+    assert len(adj.targets) == 4  # 0<->1 and 1<->3, no spare slots
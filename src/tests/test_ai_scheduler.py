@@ -0,0 +1,82 @@
+# tests/test_ai_scheduler.py
+import pytest
+from Logic.ai_scheduler import AIScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class FakeGuard:
+    def __init__(self, name, log, clock, cost_ms=1.0):
+        self.name, self.log, self.clock, self.cost_ms = name, log, clock, cost_ms
+
+    def replan(self):
+        self.log.append(self.name)
+        self.clock.now += self.cost_ms / 1000.0
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_priority_order_and_budget(clock):
+    log = []
+    sched = AIScheduler(budget_ms=2.0, clock=clock)
+    far   = FakeGuard("far", log, clock)
+    near  = FakeGuard("near", log, clock)
+    idle  = FakeGuard("idle", log, clock)
+    sched.request(idle, (True, 1))   # patrolling
+    sched.request(far,  (False, 5))
+    sched.request(near, (False, 2))
+    assert sched.queue_depth == 3
+
+    sched.run()  # 2 ms budget, 1 ms per replan
+    assert log == ["near", "far"]
+    assert sched.queue_depth == 1
+    sched.run()
+    assert log == ["near", "far", "idle"]
+    stats = sched.stats()
+    assert stats['serviced'] == 3 and stats['deferred'] == 1
+    assert stats['overruns'] == 0 and stats['max_depth'] == 3
+
+def test_duplicate_requests_keep_one_entry(clock):
+    log = []
+    sched = AIScheduler(clock=clock)
+    g = FakeGuard("g", log, clock)
+    for _ in range(3):
+        sched.request(g, (0, 0))
+    sched.run()
+    assert log == ["g"]
+
+def test_slow_replan_still_runs_and_counts_overrun(clock):
+    log = []
+    sched = AIScheduler(budget_ms=1.0, clock=clock)
+    sched.request(FakeGuard("slow", log, clock, cost_ms=5.0))
+    sched.request(FakeGuard("next", log, clock))
+    sched.run()
+    assert log == ["slow"]          # at least one per frame
+    assert sched.overruns == 1
+    assert sched.last_ms == pytest.approx(5.0)
+
+def test_cancel_drops_request(clock):
+    log = []
+    sched = AIScheduler(clock=clock)
+    g = FakeGuard("g", log, clock)
+    sched.request(g)
+    sched.cancel(g)
+    sched.run()
+    assert log == [] and sched.queue_depth == 0
+
+def test_rerequest_after_cancel_uses_the_new_priority(clock):
+    log = []
+    sched = AIScheduler(clock=clock)
+    g, h = FakeGuard("g", log, clock), FakeGuard("h", log, clock)
+    sched.request(g, (0,))
+    sched.cancel(g)
+    sched.request(h, (1,))
+    sched.request(g, (2,))  # now behind h
+    assert sched.queue_depth == 2
+    sched.run()
+    assert log == ["h", "g"] and sched.queue_depth == 0
\ No newline at end of file
@@ -0,0 +1,55 @@
+# tests/test_autopilot.py
+from types import SimpleNamespace
+import pytest
+from Logic.autopilot import Autopilot
+from Logic.enemy import Enemy
+from Logic.logic_setup import LogicSetup
+from Logic.player import Player
+from Logic.batch_sim import POLICIES
+
+def open_logic(size=7, enemies=()):
+    """Just what Autopilot reads from a LogicSetup, on an open room."""
+    matrix = [[1] * size for _ in range(size)]
+    player = Player(0, 0, matrix, 40, 40)
+    return SimpleNamespace(matrix=matrix, GRID_ROWS=size, GRID_COLS=size,
+                           PIXEL_ONE_X=40, PIXEL_ONE_Y=40, player=player,
+                           enemies=list(enemies), key_pos=(6, 0), door_pos=(6, 6))
+
+def test_plan_is_a_shortest_path_in_an_open_room():
+    path = Autopilot(open_logic()).plan((0, 0), (6, 0))
+    assert path[0] == (0, 0) and path[-1] == (6, 0) and len(path) == 7
+
+def test_plan_goes_around_a_guard():
+    guard = Enemy(position=(0, 0), patrol_route=[], matrix=[[1] * 7 for _ in range(7)],
+                  grid_rows=7, grid_cols=7, tile_size=(40, 40))
+    guard.position = guard.grid_to_pixel((3, 0))
+    path = Autopilot(open_logic(enemies=[guard])).plan((0, 0), (6, 0))
+    assert path[-1] == (6, 0)
+    assert all(abs(c - 3) + r > 2 for c, r in path)
+
+def test_plan_prefers_unpatrolled_corridors():
+    ap = Autopilot(open_logic())
+    ap.patrolled = {(c, 0) for c in range(1, 6)}
+    path = ap.plan((0, 0), (6, 0))
+    assert not set(path) & ap.patrolled
+
+def test_steers_toward_the_next_cell():
+    logic = open_logic()
+    logic.player.pos_X, logic.player.pos_Y = 5, 5  # centred in (0, 0)
+    controls = Autopilot(logic)()
+    assert controls.right and not (controls.left or controls.up)
+
+@pytest.mark.parametrize("difficulty,size,seed", [
+    ('easy', 8, 1), ('hard', 8, 2), ('hard', 12, 9), ('easy', 12, 4),
+])
+def test_wins_levels_without_guards(difficulty, size, seed):
+    logic = LogicSetup(difficulty, size, size, 0, clock=lambda: 0.0, seed=seed)
+    logic.generate_game()
+    ap = Autopilot(logic)
+    result = {'won': False}
+    while logic.ticks < 5000 and not result['won']:
+        result = logic.step(ap(logic))
+    assert result['won'] and logic.player.has_key
+
+def test_is_a_batch_policy():
+    assert POLICIES['autopilot'] is Autopilot
@@ -0,0 +1,52 @@
+# tests/test_batch_sim.py
+from Logic.batch_sim import (
+    play_game, run_batch, level_specs, Summary, RandomWalkPolicy, main,
+)
+
+SPEC = ('hard', 6, 6, 2, 3)
+
+def test_play_game_result_row():
+    row = play_game(SPEC, 'random', max_ticks=300)
+    assert (row['difficulty'], row['rows'], row['enemy_count'], row['seed']) == ('hard', 6, 2, 3)
+    assert row['won'] + row['captured'] + row['timeout'] == 1
+    assert 0 < row['ticks'] <= 300
+    assert row['searches'] >= 0 and row['flow_builds'] >= 0
+
+def test_games_are_reproducible():
+    assert {k: v for k, v in play_game(SPEC, max_ticks=300).items() if not k.endswith('_ms')} == \
+           {k: v for k, v in play_game(SPEC, max_ticks=300).items() if not k.endswith('_ms')}
+
+def test_level_specs_cover_the_product():
+    specs = list(level_specs(['easy', 'hard'], [6, 8], [1], range(3)))
+    assert len(specs) == 12
+    assert ('easy', 8, 8, 1, 2) in specs
+
+def test_random_walk_holds_direction():
+    policy = RandomWalkPolicy(None, seed=1, min_hold=4, max_hold=4)
+    moves = [policy(None) for _ in range(8)]
+    assert moves[0] == moves[3] and moves[4] == moves[7]
+
+def test_summary_aggregates_by_difficulty():
+    summary = Summary()
+    for row in run_batch(list(level_specs(['easy', 'hard'], [6], [1], range(2))),
+                         'idle', max_ticks=50, workers=1):
+        summary.add(row)
+    report = summary.report()
+    assert report['all']['games'] == 4
+    assert report['easy']['games'] == report['hard']['games'] == 2
+    assert report['all']['win_rate'] == 0.0
+
+def test_process_pool_matches_inline():
+    specs = list(level_specs(['hard'], [6], [2], range(3)))
+    strip = lambda rows: sorted(
+        tuple((k, v) for k, v in r.items() if not k.endswith('_ms')) for r in rows)
+    assert strip(run_batch(specs, max_ticks=200, workers=2)) == \
+           strip(run_batch(specs, max_ticks=200, workers=1))
+
+def test_cli_streams_jsonl(tmp_path, capsys):
+    out = tmp_path / "games.jsonl"
+    report = main(['--difficulty', 'hard', '--sizes', '6', '--enemies', '1',
+                   '--seeds', '2', '--max-ticks', '50', '--workers', '1',
+                   '--jsonl', str(out)])
+    assert report['all']['games'] == 2
+    assert len(out.read_text().splitlines()) == 2
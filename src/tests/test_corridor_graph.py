@@ -0,0 +1,80 @@
+# tests/test_corridor_graph.py
+import random
+import pytest
+from Logic.corridor_graph import CorridorGraph
+from Logic.pathfinding import BFSPathfinder
+from Logic.map_creation import MapCreation, is_walkable_tile
+
+def graph_for(matrix):
+    passable = lambda c, r: is_walkable_tile(matrix[r][c])
+    return CorridorGraph(len(matrix), len(matrix[0]), passable)
+
+def bfs_for(matrix):
+    passable = lambda c, r: is_walkable_tile(matrix[r][c])
+    return BFSPathfinder(len(matrix), len(matrix[0]), passable)
+
+def floors(matrix):
+    return [(c, r) for r, row in enumerate(matrix)
+            for c, v in enumerate(row) if is_walkable_tile(v)]
+
+def test_corridor_folds_into_single_edge():
+    # an L-shaped corridor: two dead ends, everything else folded
+    m = [[1, 1, 1, 1],
+         [0, 0, 0, 1],
+         [0, 0, 0, 1]]
+    g = graph_for(m)
+    g.build()
+    assert sorted(g.nodes) == [(0,0), (3,2)]
+    assert len(g.edges) == 1
+    u, v, interior = g.edges[0]
+    assert len(interior) == 4
+
+def test_loop_without_junctions_is_still_searchable():
+    m = [[1, 1, 1],
+         [1, 0, 1],
+         [1, 1, 1]]
+    g = graph_for(m)
+    path = g.find_path((0,0), (2,2))
+    assert len(path) == 5
+    assert path[0] == (0,0) and path[-1] == (2,2)
+
+def test_same_corridor_shortcut():
+    m = [[1, 1, 1, 1, 1]]
+    assert graph_for(m).find_path((1,0), (3,0)) == [(1,0), (2,0), (3,0)]
+    assert graph_for(m).find_path((3,0), (1,0)) == [(3,0), (2,0), (1,0)]
+
+@pytest.mark.parametrize("difficulty,seed", [("hard", 1), ("hard", 2), ("easy", 3), ("easy", 4)])
+def test_matches_bfs_lengths_on_generated_mazes(difficulty, seed):
+    m = MapCreation(difficulty, 8, 9, 0, seed=seed).generate_maze()
+    g, bfs = graph_for(m), bfs_for(m)
+    cells = floors(m)
+    rng = random.Random(seed)
+    for _ in range(60):
+        a, b = rng.choice(cells), rng.choice(cells)
+        path = g.find_path(a, b)
+        assert len(path) == len(bfs.find_path(a, b))
+        assert path[0] == a and path[-1] == b
+        for (c0, r0), (c1, r1) in zip(path, path[1:]):
+            assert abs(c0-c1) + abs(r0-r1) == 1
+            assert is_walkable_tile(m[r1][c1])
+
+def test_searches_far_fewer_nodes_on_perfect_maze():
+    m = MapCreation("hard", 30, 30, 0, seed=9).generate_maze()
+    g, bfs = graph_for(m), bfs_for(m)
+    cells = floors(m)
+    rng = random.Random(0)
+    for _ in range(50):
+        a, b = rng.choice(cells), rng.choice(cells)
+        g.find_path(a, b)
+        bfs.find_path(a, b)
+    assert g.nodes_expanded * 5 < bfs.nodes_expanded
+
+def test_invalidate_rebuilds_after_door_opens():
+    m = [[1, 5, 1],
+         [0, 0, 0]]
+    g = graph_for(m)
+    assert len(g.find_path((0,0), (2,0))) == 3
+    m[0][1] = 0
+    g.invalidate()
+    assert g.find_path((0,0), (2,0)) == []
+    assert g.builds == 2
@@ -0,0 +1,73 @@
+# tests/test_dstar_lite.py
+import pytest
+from Logic.dstar_lite import DStarLite
+from Logic.pathfinding import BFSPathfinder
+
+def planner_for(matrix):
+    passable = lambda c, r: matrix[r][c] != 0
+    return DStarLite(len(matrix), len(matrix[0]), passable)
+
+def bfs_len(matrix, a, b):
+    passable = lambda c, r: matrix[r][c] != 0
+    return len(BFSPathfinder(len(matrix), len(matrix[0]), passable).find_path(a, b))
+
+@pytest.fixture
+def room():
+    # 5×5 room with a wall stub in the middle
+    m = [[1]*5 for _ in range(5)]
+    m[1][2] = m[2][2] = m[3][2] = 0
+    return m
+
+def test_initial_plan_is_shortest(room):
+    d = planner_for(room)
+    d.set_goal((4, 2))
+    path = d.path((0, 2))
+    assert path[0] == (0, 2) and path[-1] == (4, 2)
+    assert len(path) == bfs_len(room, (0, 2), (4, 2))
+
+def test_goal_step_repairs_instead_of_replanning(room):
+    d = planner_for(room)
+    d.set_goal((4, 2))
+    d.next_step((0, 2))
+    first = d.expansions
+
+    # the player steps one cell: only a small repair is needed
+    assert d.set_goal((4, 3))
+    step = d.next_step((0, 2))
+    assert d.expansions - first < first
+    assert bfs_len(room, step, (4, 3)) == bfs_len(room, (0, 2), (4, 3)) - 1
+
+def test_same_goal_is_not_a_replan(room):
+    d = planner_for(room)
+    assert d.set_goal((4, 2))
+    assert not d.set_goal((4, 2))
+    assert d.replans == 1
+
+def test_following_the_plan_costs_nothing(room):
+    d = planner_for(room)
+    d.set_goal((4, 2))
+    cell = (0, 2)
+    cell = d.next_step(cell)
+    settled = d.expansions
+    while cell != (4, 2):
+        cell = d.next_step(cell)
+    assert d.expansions == settled
+
+def test_tile_change_reroutes(room):
+    d = planner_for(room)
+    d.set_goal((4, 2))
+    assert len(d.path((0, 2))) == bfs_len(room, (0, 2), (4, 2)) == 9
+    # close the gap at the top: only the bottom detour is left
+    room[0][2] = 0
+    d.tile_changed((0, 2))
+    path = d.path((0, 2))
+    assert len(path) == bfs_len(room, (0, 2), (4, 2))
+    assert (2, 0) not in path
+
+def test_unreachable_goal(room):
+    room[0][2] = room[4][2] = 0
+    d = planner_for(room)
+    d.set_goal((4, 2))
+    assert d.next_step((0, 2)) is None
+    # and an unwalkable start never plans
+    assert d.next_step((2, 2)) is None
@@ -532,4 +532,195 @@ def test_can_see_player(enemy, enemy_cell, player_cell, blocked, expected):
     player_pos = enemy.grid_to_pixel(player_cell)
     result = enemy.can_see_player(player_pos)
     # Assert
-    assert result is expected
\ No newline at end of file
+    assert result is expected
+
+#move_alert with a shared flow field
+def test_move_alert_reads_flow_field(enemy):
+    from Logic.flow_field import FlowField
+    enemy.flow_field = FlowField(enemy.matrix, 3, 3)
+    enemy.position = enemy.grid_to_pixel((0, 0))
+    player_pos = enemy.grid_to_pixel((2, 0))
+    enemy.flow_field.set_root((2, 0))
+    enemy.alert_speed = 10  # exactly one tile per call
+
+    enemy.move_alert(player_pos)
+    assert enemy.position == enemy.grid_to_pixel((1, 0))
+    enemy.move_alert(player_pos)
+    assert enemy.position == enemy.grid_to_pixel((2, 0))
+
+#set_patrol_route / compiled step table
+def test_set_patrol_route_compiles_legs(enemy):
+    enemy.set_patrol_route([(0,0), (2,0), (2,2)])
+    # leg 1: (0,0) -> (2,0)
+    assert enemy.patrol_steps[(1, (0,0))] == (1,0)
+    assert enemy.patrol_steps[(1, (1,0))] == (2,0)
+    # leg 0 wraps around from the last waypoint back to the first
+    assert enemy.patrol_steps[(0, (2,2))] in {(1,2), (2,1)}
+    assert enemy.patrol_steps[(0, (0,0))] == (0,0)
+
+def test_compiled_patrol_does_not_search(enemy, monkeypatch):
+    enemy.set_patrol_route([(0,0), (2,0)])
+    enemy.position = enemy.grid_to_pixel((0,0))
+    enemy.patrol_speed = 100  # snap to each cell
+    def no_bfs(*args):
+        raise AssertionError("patrol movement should be a table lookup")
+    monkeypatch.setattr(enemy, 'find_path_between', no_bfs)
+
+    visited = []
+    for _ in range(4):
+        enemy.move_patrol_area()
+        visited.append(enemy.pixel_to_grid(enemy.position))
+    # waypoint 0 reached in place, then two steps to (2,0), then back
+    assert visited == [(0,0), (1,0), (2,0), (1,0)]
+    # the index only advances on reaching a waypoint, not on every cell
+    assert enemy.patrol_index == 0
+
+def test_compiled_patrol_recovers_off_route(enemy):
+    enemy.set_patrol_route([(0,0), (2,0)])
+    enemy.patrol_index = 1
+    # pushed off the route: (1,2) is not on any leg
+    enemy.position = enemy.grid_to_pixel((1,2))
+    enemy.patrol_speed = 100
+    enemy.move_patrol_area()
+    assert enemy.pixel_to_grid(enemy.position) in {(2,2), (1,1), (0,2)}
+    assert enemy.patrol_index == 1
+
+@pytest.fixture
+def level_enemy():
+    from Logic.grid import Grid
+    from Logic.level_layers import LevelLayers
+    terrain = Grid(7, 7, fill=1)
+    en = Enemy(position=(35, 35), patrol_route=[], matrix=terrain,
+               grid_rows=7, grid_cols=7, tile_size=(10, 10))
+    en.level = LevelLayers(terrain, 7, 7)
+    return en
+
+def test_spots_player_in_vision_cone(level_enemy):
+    level_enemy.direction = 'right'
+    assert level_enemy.spots_player((6, 3), 3)       # straight ahead
+    assert not level_enemy.spots_player((0, 3), 3)   # behind
+    assert level_enemy.spots_player((2, 3), 1)       # adjacent, any side
+
+def test_update_goes_alert_on_sight(level_enemy):
+    level_enemy.direction = 'down'
+    level_enemy.update(level_enemy.grid_to_pixel((3, 6)))
+    assert level_enemy.state == "alert"
+
+def test_scheduled_replan_is_deferred(enemy):
+    from Logic.ai_scheduler import AIScheduler
+    enemy.scheduler = AIScheduler()
+    enemy.state = "alert"
+    enemy.position = enemy.grid_to_pixel((0, 0))
+    enemy.move_alert(enemy.grid_to_pixel((2, 0)))
+    # nothing planned yet: the request waits in the queue
+    assert enemy.path == [] and enemy.scheduler.queue_depth == 1
+    enemy.scheduler.run()
+    assert enemy.path == [(1, 0)]
+
+def test_end_chase_cancels_queued_replan(enemy):
+    from Logic.ai_scheduler import AIScheduler
+    enemy.scheduler = AIScheduler()
+    enemy.state = "alert"
+    enemy.move_alert(enemy.grid_to_pixel((2, 0)))
+    enemy.end_chase()
+    assert enemy.state == "patrol" and enemy.scheduler.queue_depth == 0
+
+def test_hidden_player_keeps_patrol_centre_to_centre(enemy):
+    # wall at (0,1): the leg to (1,1) turns the corner at (1,0)
+    enemy.matrix[1][0] = 0
+    enemy.matrix[2][0] = 3  # the player hides here every frame
+    enemy.set_patrol_route([(0,0), (1,1)])
+    enemy.position = enemy.grid_to_pixel((0,0))
+    hidden = enemy.grid_to_pixel((0,2))
+
+    positions = []
+    for _ in range(12):
+        enemy.update(hidden)
+        positions.append(enemy.position)
+        if enemy.pixel_to_grid(enemy.position) == (1,0) and enemy.position[0] < 15:
+            # over the next tile, still heading for its centre
+            assert enemy.patrol_next == (1,0)
+    assert enemy.grid_to_pixel((1,0)) in positions
+    assert enemy.state == "patrol"
+
+#------------fast_forward (simulation LOD)
+LOOP = [(1, 1), (5, 1), (5, 4), (1, 4)]
+
+def patroller(speed=3):
+    matrix = [[1] * 7 for _ in range(7)]
+    en = Enemy(position=(15, 15), patrol_route=[], matrix=matrix,
+               grid_rows=7, grid_cols=7, tile_size=(10, 10), move_speed=speed)
+    en.set_patrol_route(LOOP)
+    en.patrol_index = 1  # standing on waypoint 0, heading for waypoint 1
+    return en
+
+@pytest.mark.parametrize("speed", [3, 2.5, 10])
+@pytest.mark.parametrize("warmup,ticks", [(0, 1), (0, 4), (0, 17), (5, 9), (7, 263), (40, 1000)])
+def test_fast_forward_matches_stepping(speed, warmup, ticks):
+    stepped, jumped = patroller(speed), patroller(speed)
+    for _ in range(warmup):
+        stepped.move_patrol_area()
+        jumped.move_patrol_area()
+    for _ in range(ticks):
+        stepped.move_patrol_area()
+    assert jumped.fast_forward(ticks)
+    assert jumped.position == pytest.approx(stepped.position)
+    assert jumped.patrol_index == stepped.patrol_index
+    assert jumped.direction == stepped.direction
+    assert (jumped.frame_timer, jumped.current_frame) == (stepped.frame_timer, stepped.current_frame)
+    # and stepping on from the jumped state stays in lockstep
+    for _ in range(13):
+        stepped.move_patrol_area()
+        jumped.move_patrol_area()
+    assert jumped.position == pytest.approx(stepped.position)
+
+def test_fast_forward_whole_laps_return_home():
+    en = patroller()
+    _, prefix, _ = en._loop_ticks()
+    assert en.fast_forward(3 * prefix[-1])
+    assert en.position == en.grid_to_pixel((1, 1))
+
+def test_fast_forward_refuses_off_route():
+    en = patroller()
+    en.position = (33, 27)  # shoved off the route
+    assert en.patrol_phase() is None
+    assert not en.fast_forward(10)
+    assert en.position == (33, 27)
+
+def test_fast_forward_from_unadvanced_waypoint():
+    stepped, jumped = patroller(), patroller()
+    for en in (stepped, jumped):
+        en.patrol_index = 0  # centred on waypoint 0 before the advancing snap
+    for _ in range(30):
+        stepped.move_patrol_area()
+    assert jumped.fast_forward(30)
+    assert jumped.position == pytest.approx(stepped.position)
+    assert jumped.patrol_index == stepped.patrol_index
+
+
+# repeated waypoints give zero-length segments (optimize_route can
+# turn A,B,A into A,A)
+REPEATS = [(1, 1), (5, 1), (5, 1), (5, 4), (1, 4), (1, 4), (1, 1)]
+
+@pytest.mark.parametrize("speed", [3, 10])
+def test_fast_forward_facing_across_repeated_waypoints(speed):
+    _, prefix, _ = patroller(speed)._loop_ticks()
+    for warmup in range(0, prefix[-1] + 2, 5):
+        for ticks in (1, 2, 3, 5, 8, 13, 21):
+            stepped, jumped = patroller(speed), patroller(speed)
+            for en in (stepped, jumped):
+                en.set_patrol_route(REPEATS)
+                en.patrol_index = 1
+                for _ in range(warmup):
+                    en.move_patrol_area()
+            for _ in range(ticks):
+                stepped.move_patrol_area()
+            assert jumped.fast_forward(ticks)
+            assert jumped.position == pytest.approx(stepped.position)
+            assert jumped.direction == stepped.direction, (warmup, ticks)
+
+
+def test_find_nearest_walkable_uses_level_map(level_enemy):
+    level_enemy.level.walkable[3 * 7 + 3] = 0
+    level_enemy.level.nearest.build()
+    assert level_enemy.find_nearest_walkable() == (4, 3)
\ No newline at end of file
@@ -0,0 +1,76 @@
+# tests/test_enemy_swarm.py
+import pytest
+from Logic.enemy import Enemy
+
+np = pytest.importorskip("numpy")
+from Logic.enemy_swarm import EnemySwarm
+
+LOOPS = [
+    [(1, 1), (5, 1), (5, 4), (1, 4)],
+    [(6, 6), (2, 6)],
+    [(3, 2), (3, 5), (6, 5)],
+    # repeated waypoints: zero-length segments
+    [(1, 1), (5, 1), (5, 1), (5, 4), (1, 4), (1, 4)],
+]
+
+def guard(route, speed):
+    matrix = [[1] * 8 for _ in range(8)]
+    en = Enemy(position=(0, 0), patrol_route=[], matrix=matrix,
+               grid_rows=8, grid_cols=8, tile_size=(10, 10), move_speed=speed)
+    en.set_patrol_route(route)
+    en.position = en.grid_to_pixel(route[0])
+    en.patrol_index = 1 % len(route)
+    return en
+
+@pytest.fixture
+def pairs():
+    """(reference guards, swarm guards) with identical starting state."""
+    specs = [(LOOPS[0], 3), (LOOPS[1], 1.5), (LOOPS[2], 10), (LOOPS[0], 2.5),
+             (LOOPS[3], 3), (LOOPS[3], 10)]
+    return [guard(*s) for s in specs], [guard(*s) for s in specs]
+
+FAR = (10 ** 6, 10 ** 6)
+
+@pytest.mark.parametrize("ticks", [1, 5, 37, 400])
+def test_step_matches_move_patrol_area(pairs, ticks):
+    reference, driven = pairs
+    swarm = EnemySwarm(driven)
+    for _ in range(ticks):
+        for en in reference:
+            en.move_patrol_area()
+        assert swarm.step(FAR) == []
+        assert [en.direction for en in driven] == [en.direction for en in reference]
+    for ref, en in zip(reference, driven):
+        assert en.position == pytest.approx(ref.position)
+        assert en.patrol_index == ref.patrol_index
+        assert en.patrol_next == ref.patrol_next
+        assert en.direction == ref.direction
+        assert (en.frame_timer, en.current_frame) == (ref.frame_timer, ref.current_frame)
+
+def test_near_guards_are_handed_back(pairs):
+    _, driven = pairs
+    swarm = EnemySwarm(driven, near_cells=2)
+    before = [en.position for en in driven]
+    left = swarm.step((1, 1))   # right on top of guards 0, 3, 4 and 5
+    assert left == [0, 3, 4, 5]
+    assert driven[0].position == before[0]
+    assert driven[1].position != before[1]
+
+def test_sync_picks_up_outside_moves(pairs):
+    reference, driven = pairs
+    swarm = EnemySwarm(driven)
+    for _ in range(4):
+        driven[0].move_patrol_area()
+        reference[0].move_patrol_area()
+    swarm.sync(0)
+    for _ in range(20):
+        reference[0].move_patrol_area()
+        swarm.step(FAR)
+    assert driven[0].position == pytest.approx(reference[0].position)
+
+def test_off_route_guard_is_not_driven(pairs):
+    _, driven = pairs
+    driven[1].position = (33, 27)
+    swarm = EnemySwarm(driven)
+    assert 1 in swarm.step(FAR)
+    assert driven[1].position == (33, 27)
@@ -0,0 +1,75 @@
+# tests/test_fixed_timestep.py
+import pytest
+from Logic.fixed_timestep import FixedTimestep, lerp_position
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def timestep(clock):
+    return FixedTimestep(step_hz=10, clock=clock)
+
+def test_first_frame_runs_nothing(timestep):
+    assert timestep.advance() == 0
+    assert timestep.alpha == 0.0
+
+@pytest.mark.parametrize("frame_time,steps,alpha", [
+    (0.1, 1, 0.0),
+    (0.25, 2, 0.5),
+    (0.05, 0, 0.5),
+])
+def test_steps_and_alpha(timestep, clock, frame_time, steps, alpha):
+    timestep.advance()
+    clock.now += frame_time
+    assert timestep.advance() == steps
+    assert timestep.alpha == pytest.approx(alpha)
+
+def test_leftover_time_carries_over(timestep, clock):
+    timestep.advance()
+    total = 0
+    for _ in range(7):
+        clock.now += 0.03
+        total += timestep.advance()
+    assert total == 2  # 0.21 s at 10 Hz
+    assert timestep.steps == 2
+
+def test_long_hitch_is_clamped(timestep, clock):
+    timestep.advance()
+    clock.now += 10.0
+    assert timestep.advance() == timestep.max_steps
+    assert timestep.accumulator == 0.0
+
+def test_reset_forgets_elapsed_time(timestep, clock):
+    timestep.advance()
+    clock.now += 0.3
+    timestep.reset()
+    assert timestep.advance() == 0
+
+def test_fast_forward_ignores_clock(clock):
+    ts = FixedTimestep(step_hz=10, clock=clock, steps_per_frame=16)
+    assert ts.advance() == 16 and ts.advance() == 16
+    assert ts.alpha == 1.0 and ts.steps == 32
+
+class Dot:
+    def __init__(self, pos, prev):
+        self.pos, self.prev_position = pos, prev
+
+    def get_position(self):
+        return self.pos
+
+@pytest.mark.parametrize("prev,alpha,expected", [
+    ((0, 0), 0.0, (0, 0)),
+    ((0, 0), 0.25, (2.5, 5.0)),
+    ((0, 0), 1.0, (10, 20)),
+    (None, 0.5, (10, 20)),
+])
+def test_lerp_position(prev, alpha, expected):
+    assert lerp_position(Dot((10, 20), prev), alpha) == pytest.approx(expected)
@@ -0,0 +1,72 @@
+# tests/test_flow_field.py
+import pytest
+from Logic.flow_field import FlowField, UNREACHED
+
+@pytest.fixture
+def corridor():
+    # 3×4: a U-shaped corridor around a wall block
+    return [[1, 1, 1, 1],
+            [1, 0, 0, 1],
+            [1, 1, 0, 1]]
+
+def make_field(matrix):
+    return FlowField(matrix, len(matrix), len(matrix[0]))
+
+def test_distance_follows_corridor(corridor):
+    field = make_field(corridor)
+    field.set_root((0, 2))
+    assert field.distance((0, 2)) == 0
+    assert field.distance((0, 0)) == 2
+    assert field.distance((3, 2)) == 7
+    # walls are never reached
+    assert field.distance((1, 1)) == UNREACHED
+
+def test_next_step_walks_down_the_gradient(corridor):
+    field = make_field(corridor)
+    field.set_root((0, 2))
+    cell, steps = (3, 2), [(3, 2)]
+    while cell != (0, 2):
+        cell = field.next_step(cell)
+        steps.append(cell)
+    assert steps == [(3,2),(3,1),(3,0),(2,0),(1,0),(0,0),(0,1),(0,2)]
+
+def test_next_step_at_root_and_unreachable(corridor):
+    field = make_field(corridor)
+    field.set_root((0, 2))
+    assert field.next_step((0, 2)) == (0, 2)
+    assert field.next_step((1, 1)) is None
+    # out of bounds cells are simply unreachable
+    assert field.next_step((9, 9)) is None
+
+def test_unwalkable_root_reaches_nothing(corridor):
+    field = make_field(corridor)
+    field.set_root((1, 1))  # a wall
+    assert field.next_step((0, 0)) is None
+
+def test_rebuild_only_on_cell_change(corridor):
+    field = make_field(corridor)
+    field.set_root((0, 2))
+    field.next_step((3, 2))
+    field.next_step((0, 0))
+    assert field.builds == 1
+
+    # same cell again: no rebuild
+    field.set_root((0, 2))
+    field.next_step((3, 2))
+    assert field.builds == 1
+
+    # new cell: exactly one rebuild
+    field.set_root((0, 1))
+    field.next_step((3, 2))
+    field.next_step((3, 1))
+    assert field.builds == 2
+
+def test_invalidate_picks_up_tile_changes(corridor):
+    field = make_field(corridor)
+    field.set_root((0, 2))
+    assert field.distance((2, 2)) == UNREACHED
+    corridor[2][2] = 1
+    # stale until invalidated
+    assert field.distance((2, 2)) == UNREACHED
+    field.invalidate()
+    assert field.distance((2, 2)) == 2
@@ -0,0 +1,64 @@
+# tests/test_grid.py
+import pickle
+import pytest
+from Logic.grid import Grid
+
+@pytest.fixture
+def grid():
+    return Grid.from_rows([[0, 1, 2],
+                           [3, 4, 5]])
+
+def test_list_of_lists_indexing(grid):
+    assert len(grid) == 2 and len(grid[0]) == 3
+    assert grid[1][2] == 5
+    grid[1][2] = 6
+    assert grid.data[5] == 6
+    assert grid == [[0, 1, 2], [3, 4, 6]]
+
+def test_fill_and_size():
+    g = Grid(500, 500, fill=1)
+    assert len(g.data) == 250_000
+    assert g.count(1) == 250_000
+
+@pytest.mark.parametrize("cell, expected", [
+    ((0, 0), 0), ((2, 1), 5), ((3, 0), None), ((0, -1), None),
+])
+def test_get_is_bounds_aware(grid, cell, expected):
+    assert grid.get(*cell) == expected
+
+def test_set_out_of_bounds_raises(grid):
+    with pytest.raises(IndexError):
+        grid.set(3, 0, 1)
+
+def test_row_and_column_slices(grid):
+    assert bytes(grid.row(0)) == bytes([0, 1, 2])
+    assert bytes(grid.row(1, 1)) == bytes([4, 5])
+    assert bytes(grid.rows_block(0, 2)) == bytes(range(6))
+    assert grid.column(1) == bytes([1, 4])
+    grid.set_column(0, [9, 8])
+    assert grid.column(0) == bytes([9, 8])
+
+def test_find(grid):
+    assert grid.find(4) == (1, 1)
+    assert grid.find(4, 0, 1) is None
+    grid[0][0] = 4
+    assert list(grid.find_all(4)) == [(0, 0), (1, 1)]
+
+def test_copy_and_pickle_are_independent(grid):
+    for other in (grid.copy(), pickle.loads(pickle.dumps(grid))):
+        assert other == grid
+        other[0][0] = 7
+        assert grid[0][0] == 0
+
+def test_rejects_ragged_rows_and_big_values():
+    with pytest.raises(ValueError):
+        Grid.from_rows([[1, 2], [1]])
+    with pytest.raises(ValueError):
+        Grid(1, 1)[0][0] = 256
+
+def test_numpy_view_is_zero_copy(grid):
+    np = pytest.importorskip("numpy")
+    view = grid.numpy()
+    assert view.shape == (2, 3)
+    view[0, 1] = 9
+    assert grid[0][1] == 9
@@ -0,0 +1,69 @@
+# tests/test_hierarchical.py
+import random
+import pytest
+from Logic.hierarchical import HierarchicalPathfinder
+from Logic.pathfinding import BFSPathfinder
+from Logic.map_creation import MapCreation, is_walkable_tile
+
+def engines_for(matrix, cluster_size):
+    passable = lambda c, r: is_walkable_tile(matrix[r][c])
+    R, C = len(matrix), len(matrix[0])
+    return (HierarchicalPathfinder(R, C, passable, cluster_size=cluster_size),
+            BFSPathfinder(R, C, passable))
+
+@pytest.fixture
+def maze():
+    return MapCreation("easy", 12, 12, 0, seed=21).generate_maze()
+
+def floors(matrix):
+    return [(c, r) for r, row in enumerate(matrix)
+            for c, v in enumerate(row) if is_walkable_tile(v)]
+
+def test_entrance_in_middle_of_border_run():
+    # 2 clusters of 3x3 side by side, open border rows 0..2
+    m = [[1]*6 for _ in range(3)]
+    h, _ = engines_for(m, 3)
+    assert h.border_pairs[((0,0), (0,1))] == [((2,1), (3,1))]
+    assert h.edges[(2,1)][(3,1)] == (1, [(2,1), (3,1)])
+
+def test_walls_split_border_into_several_entrances():
+    m = [[1, 1, 1, 1],
+         [1, 1, 0, 0],
+         [1, 1, 1, 1],
+         [1, 1, 1, 1]]
+    h, _ = engines_for(m, 2)
+    # rows 0 and 2..3 cross the vertical border between clusters (0,0)|(0,1)
+    assert len(h.border_pairs[((0,0), (0,1))]) == 1
+    assert len(h.border_pairs[((1,0), (1,1))]) == 1
+
+@pytest.mark.parametrize("cluster_size", [3, 5, 8])
+def test_paths_valid_and_complete(maze, cluster_size):
+    h, bfs = engines_for(maze, cluster_size)
+    cells = floors(maze)
+    rng = random.Random(cluster_size)
+    for _ in range(80):
+        a, b = rng.choice(cells), rng.choice(cells)
+        path, exact = h.find_path(a, b), bfs.find_path(a, b)
+        assert bool(path) == bool(exact)
+        assert path[0] == a and path[-1] == b
+        assert len(path) >= len(exact)
+        for (c0, r0), (c1, r1) in zip(path, path[1:]):
+            assert abs(c0-c1) + abs(r0-r1) == 1
+            assert is_walkable_tile(maze[r1][c1])
+
+def test_tile_change_patch_matches_full_rebuild(maze):
+    h, _ = engines_for(maze, 4)
+    cells = floors(maze)
+    for cell in random.Random(5).sample(cells, 6):
+        c, r = cell
+        maze[r][c] = 0
+        h.invalidate(cell)
+        fresh, _ = engines_for(maze, 4)
+        assert h.edges == fresh.edges
+        assert h.border_pairs == fresh.border_pairs
+
+def test_unreachable_goal():
+    m = [[1, 0, 1],
+         [1, 0, 1]]
+    h, _ = engines_for(m, 2)
+    assert h.find_path((0,0), (2,1)) == []
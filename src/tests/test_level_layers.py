@@ -0,0 +1,48 @@
+# tests/test_level_layers.py
+import pytest
+from Logic.level_layers import LevelLayers, NO_MARKER
+
+@pytest.fixture
+def layers():
+    # 3×4 with a key (4), closed door (5) and hidden room (3)
+    terrain = [[1, 0, 4, 1],
+               [1, 0, 0, 5],
+               [3, 1, 1, 1]]
+    return LevelLayers(terrain, 3, 4)
+
+@pytest.mark.parametrize("cell, walkable, solid", [
+    ((0, 0), True,  False),   # floor
+    ((1, 0), False, True),    # wall
+    ((2, 0), False, False),   # key
+    ((3, 1), True,  False),   # closed door
+    ((0, 2), False, False),   # hidden room
+])
+def test_bitmaps_classify_terrain(layers, cell, walkable, solid):
+    assert layers.is_walkable(cell) is walkable
+    assert layers.is_solid(cell) is solid
+
+def test_out_of_bounds_is_solid_not_walkable(layers):
+    assert layers.is_solid((4, 0)) and layers.is_solid((0, -1))
+    assert not layers.is_walkable((4, 0))
+
+def test_markers_never_touch_terrain(layers):
+    layers.mark((2, 0), 7)
+    layers.mark((9, 9), 7)  # ignored
+    assert layers.marker_at((2, 0)) == 7
+    assert layers.marker_at((0, 0)) == NO_MARKER
+    assert layers.terrain[0][2] == 4
+    assert not layers.is_walkable((2, 0))
+
+def test_refresh_after_terrain_change(layers):
+    layers.terrain[0][2] = 1  # key picked up
+    assert not layers.is_walkable((2, 0))
+    layers.refresh((2, 0))
+    assert layers.is_walkable((2, 0))
+    assert layers.passable(2, 0)
+
+def test_refresh_updates_nearest_walkable(layers):
+    assert layers.nearest.lookup((2, 0)) == (3, 0)
+    layers.terrain[0][2] = 1  # key picked up
+    layers.refresh((2, 0))
+    assert layers.nearest.lookup((2, 0)) == (2, 0)
+    assert layers.nearest.lookup((1, 0)) == (2, 0)
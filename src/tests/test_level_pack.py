@@ -0,0 +1,85 @@
+# tests/test_level_pack.py
+import pytest
+from Logic.logic_setup import LogicSetup
+from Logic.level_pack import LevelPack, build_pack, build_level, write_pack, HEADER
+
+SPECS = [('easy', 6, 6, 2, 0), ('hard', 7, 5, 3, 1), ('hard', 9, 9, 0, 2)]
+
+@pytest.fixture
+def pack(tmp_path):
+    path = tmp_path / 'levels.pack'
+    build_pack(path, SPECS, workers=1)
+    with LevelPack(path) as pack:
+        yield pack
+
+def generated(spec, pack=None):
+    difficulty, rows, cols, enemy_count, seed = spec
+    logic = LogicSetup(difficulty, rows, cols, enemy_count, seed=seed)
+    logic.generate_game(pack=pack)
+    return logic
+
+def test_pack_indexes_every_level(pack):
+    assert len(pack) == len(SPECS)
+    for spec in SPECS:
+        assert generated(spec).level_key in pack
+
+@pytest.mark.parametrize("spec", SPECS)
+def test_packed_level_matches_generated(pack, spec):
+    fresh, loaded = generated(spec), generated(spec, pack)
+    assert loaded.matrix == fresh.matrix
+    assert (loaded.key_pos, loaded.door_pos) == (fresh.key_pos, fresh.door_pos)
+    assert [en.complete_patrol_route for en in loaded.enemies] == \
+           [en.complete_patrol_route for en in fresh.enemies]
+    assert [en.position for en in loaded.enemies] == [en.position for en in fresh.enemies]
+
+def test_grid_is_a_view_of_the_file(pack):
+    level = pack.find(generated(SPECS[0]).level_key)
+    grid = level.grid()
+    assert grid.obj is pack.mm and grid.readonly
+    del grid
+
+def test_loaded_matrix_is_private(pack):
+    spec = SPECS[1]
+    loaded = generated(spec, pack)
+    kc, kr = loaded.key_pos
+    loaded.matrix[kr][kc] = 1  # picking up the key
+    assert generated(spec, pack).matrix[kr][kc] != 1
+
+def test_missing_level_is_generated(pack):
+    logic = generated(('easy', 6, 6, 2, 99), pack)
+    assert logic.level_key not in pack
+    assert len(logic.matrix) == 13
+
+def test_other_generator_version_never_matches(tmp_path):
+    path = tmp_path / 'old.pack'
+    write_pack(path, [build_level(SPECS[0])])
+    data = bytearray(path.read_bytes())
+    data[6] += 1  # generator version
+    path.write_bytes(data)
+    with LevelPack(path) as pack:
+        assert generated(SPECS[0]).level_key not in pack
+
+def test_process_pool_builds_the_same_file(tmp_path):
+    build_pack(tmp_path / 'a.pack', SPECS, workers=1)
+    build_pack(tmp_path / 'b.pack', reversed(SPECS), workers=2)
+    assert (tmp_path / 'a.pack').read_bytes() == (tmp_path / 'b.pack').read_bytes()
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'junk.pack'
+    path.write_bytes(bytes(HEADER.size))
+    with pytest.raises(ValueError):
+        LevelPack(path)
+
+def test_routes_longer_than_u16(tmp_path):
+    # a 130x130 hard level already has a 65812-cell route
+    route = [(c % 3, c // 3 % 3) for c in range(70000)]
+    level = (('hard', 1, 1, 1, 0), 3, 3, bytes(9), (1, 1), (1, 1), [route])
+    path = tmp_path / 'long.pack'
+    write_pack(path, [level])
+    with LevelPack(path) as pack:
+        (packed,) = pack
+        assert packed.routes() == [route]
+
+def test_build_level_rejects_oversized_specs():
+    with pytest.raises(ValueError, match="too large"):
+        build_level(('hard', 40000, 40000, 1, 0))
\ No newline at end of file
@@ -0,0 +1,257 @@
+# tests/test_logic_setup.py
+import random
+import pytest
+from Logic.logic_setup import LogicSetup
+
+@pytest.fixture
+def logic():
+    ls = LogicSetup("hard", 6, 6, 3, seed=7)
+    ls.generate_game()
+    return ls
+
+def player_cell(ls):
+    px, py = ls.player.get_position()
+    return (int(px // ls.PIXEL_ONE_X), int(py // ls.PIXEL_ONE_Y))
+
+def test_enemies_share_one_flow_field(logic):
+    assert all(en.flow_field is logic.flow_field for en in logic.enemies)
+
+def chase_with_all(ls):
+    for en in ls.enemies:
+        en.state = "alert"
+
+def test_flow_field_follows_player_cell(logic):
+    chase_with_all(logic)
+    logic.update()
+    assert logic.flow_field.root == player_cell(logic)
+
+def test_flow_field_not_rebuilt_while_player_stays(logic):
+    for _ in range(5):
+        chase_with_all(logic)
+        logic.update()
+        logic.flow_field.next_step(logic.flow_field.root)
+    assert logic.flow_field.builds == 1
+
+def test_few_chasers_use_their_own_planner(logic):
+    import Logic.logic_setup as logic_setup
+    logic.enemies[0].state = "alert"
+    assert logic_setup.FLOW_FIELD_MIN_CHASERS > 1
+    logic.update()
+    assert logic.flow_field.root is None
+
+def test_player_tile_change_invalidates_path_cache():
+    logic = LogicSetup("hard", 6, 6, 3, pathfinder='cache', seed=7)
+    logic.generate_game()
+    cache = logic.pathfinder
+    a, b = logic.enemies[0].complete_patrol_route[:2]
+    cache.path(a, b)
+    assert len(cache.trees) == 1
+    kx, ky = logic.key_pos
+    logic.player.set_tile(kx, ky, 1)
+    assert len(cache.trees) == 0
+    assert logic.flow_field.dirty
+
+@pytest.mark.parametrize("engine", ['bfs', 'astar', 'bidirectional', 'cache', 'corridor', 'hierarchical'])
+def test_selected_engine_shared_by_enemies(engine):
+    ls = LogicSetup("easy", 5, 5, 2, pathfinder=engine, seed=1)
+    ls.generate_game()
+    assert ls.pathfinder.name == engine
+    assert all(en.pathfinder is ls.pathfinder for en in ls.enemies)
+    for _ in range(10):
+        ls.update()
+
+@pytest.mark.parametrize("difficulty,expected", [("hard", "corridor"), ("easy", "cache")])
+def test_auto_pathfinder_by_difficulty(difficulty, expected):
+    ls = LogicSetup(difficulty, 4, 4, 1, seed=2)
+    ls.generate_game()
+    assert ls.pathfinder.name == expected
+
+def test_auto_pathfinder_hierarchical_for_large_levels(monkeypatch):
+    import Logic.logic_setup as logic_setup
+    monkeypatch.setattr(logic_setup, 'HIERARCHICAL_MIN_CELLS', 10 * 10)
+    ls = LogicSetup("hard", 6, 6, 1, seed=2)
+    ls.generate_game()
+    assert ls.pathfinder.name == 'hierarchical'
+
+def test_patrol_markers_stay_out_of_the_terrain(logic):
+    before = logic.matrix.copy()
+    for en in logic.enemies:
+        en.update(logic.player.get_position())
+    assert logic.matrix == before
+    marked = [en.route_marker for en in logic.enemies]
+    assert any(m in marked for m in logic.level.overlay)
+
+def test_tile_change_refreshes_bitmaps(logic):
+    kc, kr = logic.key_pos
+    assert not logic.level.is_walkable((kc, kr))
+    logic._set_tile(kc, kr, 1)
+    assert logic.level.is_walkable((kc, kr))
+
+def test_level_uses_flat_grid(logic):
+    from Logic.grid import Grid
+    assert isinstance(logic.matrix, Grid)
+    assert len(logic.matrix.data) == logic.GRID_ROWS * logic.GRID_COLS
+    c, r = logic.player_start_cell
+    assert logic.matrix[r][c] == 1
+    # nothing below the start row has floor
+    assert all(logic.matrix.find(1, row, row + 1) is None
+               for row in range(r + 1, logic.GRID_ROWS))
+
+def test_guards_share_the_frame_scheduler(logic):
+    assert all(en.scheduler is logic.scheduler for en in logic.enemies)
+    logic.update()
+    assert logic.scheduler.frames == 1
+    assert logic.scheduler.queue_depth == 0 or logic.scheduler.deferred > 0
+
+def test_far_patrollers_tick_at_reduced_rate(logic, monkeypatch):
+    import Logic.logic_setup as logic_setup
+    monkeypatch.setattr(logic_setup, "LOD_MIN_GUARDS", 0)
+    monkeypatch.setattr(logic_setup, "LOD_NEAR_CELLS", -1)  # everyone is far
+    calls = {'update': 0, 'fast_forward': []}
+    for en in logic.enemies:
+        monkeypatch.setattr(en, "update", lambda pos: calls.__setitem__('update', calls['update'] + 1))
+        real = en.fast_forward
+        def ff(ticks, real=real):
+            calls['fast_forward'].append(ticks)
+            return real(ticks)
+        monkeypatch.setattr(en, "fast_forward", ff)
+    lod = [en for en in logic.enemies if en.patrol_phase() is not None]
+    assert lod
+    for _ in range(logic_setup.LOD_FAR_INTERVAL):
+        logic.update()
+    assert calls['fast_forward'] == [logic_setup.LOD_FAR_INTERVAL] * len(lod)
+    assert calls['update'] == (len(logic.enemies) - len(lod)) * logic_setup.LOD_FAR_INTERVAL
+
+def test_guard_catches_up_when_back_in_range(logic, monkeypatch):
+    import Logic.logic_setup as logic_setup
+    en = next(en for en in logic.enemies if en.patrol_phase() is not None)
+    en.lod_lag = 5
+    monkeypatch.setattr(logic_setup, "LOD_NEAR_CELLS", 10 ** 6)  # everyone is near
+    seen = []
+    monkeypatch.setattr(en, "fast_forward", lambda ticks: seen.append(ticks))
+    logic.update()
+    assert seen == [5] and en.lod_lag == 0
+
+def test_swarm_drives_far_patrollers(monkeypatch):
+    pytest.importorskip("numpy")
+    import Logic.logic_setup as logic_setup
+    ls = LogicSetup("hard", 6, 6, 3, swarm=True, seed=7)
+    ls.generate_game()
+    assert ls.swarm is not None and ls.swarm.enemies == ls.enemies
+    monkeypatch.setattr(logic_setup, "LOD_NEAR_CELLS", -1)
+    ls.swarm.near_cells = -1
+    driven = [en for en in ls.enemies if en.patrol_phase() is not None]
+    before = [en.position for en in driven]
+    for _ in range(3):  # a tick or two may go to snapping onto a waypoint
+        ls.update()
+    assert [en.position for en in driven] != before
+    assert all(en.lod_lag == 0 for en in ls.enemies)
+
+def test_swarm_auto_needs_enough_guards(logic):
+    assert logic.swarm is None
+
+def test_spatial_hash_tracks_guards(logic):
+    for _ in range(5):
+        logic.update()
+    for en in logic.enemies:
+        assert logic.spatial.cell_of(en) == en.pixel_to_grid(en.get_position())
+
+def test_capture_uses_spatial_hash(logic):
+    en = logic.enemies[0]
+    logic.player.pos_X, logic.player.pos_Y = en.get_position()
+    logic._check_enemy_collision()
+    assert logic.player.game_over
+
+def test_step_records_previous_positions(logic, monkeypatch):
+    monkeypatch.setattr(logic, "handle_input", lambda keys: None)
+    before = [en.get_position() for en in logic.enemies]
+    logic.step(None)
+    assert logic.ticks == 1
+    assert [en.prev_position for en in logic.enemies] == before
+    assert logic.player.prev_position == logic.player.get_position()
+
+def test_runs_are_reproducible(monkeypatch):
+    def run():
+        ls = LogicSetup("hard", 6, 6, 3, clock=lambda: 0.0, seed=11)
+        ls.generate_game()
+        monkeypatch.setattr(ls, "handle_input", lambda keys: None)
+        for _ in range(200):
+            ls.step(None)
+        return [en.get_position() for en in ls.enemies]
+    assert run() == run()
+
+def test_core_runs_without_pygame():
+    import subprocess, sys
+    from pathlib import Path
+    code = ("import sys\n"
+            "from Logic.logic_setup import LogicSetup\n"
+            "ls = LogicSetup('hard', 6, 6, 3, seed=3)\n"
+            "ls.generate_game()\n"
+            "for _ in range(50): ls.step()\n"
+            "assert 'pygame' not in sys.modules\n")
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   cwd=Path(__file__).resolve().parents[1])
+
+def test_door_opens_next_to_player_with_key():
+    from Logic.map_creation import T_DOOR_O
+    logic = LogicSetup("hard", 6, 6, 0, seed=1)
+    logic.generate_game()
+    c, r = logic.door_pos  # (col, row), and not on the diagonal
+    assert c != r
+    # stand on the floor cell next to the door
+    nc, nr = next((c + dc, r + dr) for dc, dr in ((0, 1), (0, -1), (1, 0), (-1, 0))
+                  if 0 <= c + dc < logic.GRID_COLS and 0 <= r + dr < logic.GRID_ROWS
+                  and logic.matrix[r + dr][c + dc] == 1)
+    before = logic.matrix.copy()
+    logic.player.has_key = True
+    logic.player.pos_X = nc * logic.PIXEL_ONE_X + 1
+    logic.player.pos_Y = nr * logic.PIXEL_ONE_Y + 1
+    logic.update()
+    assert logic.matrix[r][c] == T_DOOR_O
+    # only the door changed: the transposed cell (c, r) -> (r, c) is untouched
+    assert logic.matrix[c][r] == before[c][r]
+
+def test_seed_decides_the_whole_level():
+    def level(seed):
+        ls = LogicSetup("easy", 7, 7, 3, seed=seed)
+        ls.generate_game()
+        return (ls.matrix, ls.key_pos, ls.door_pos,
+                [en.complete_patrol_route for en in ls.enemies])
+    random.seed(5)
+    a = level(8)
+    random.seed(6)  # the module RNG plays no part
+    assert level(8) == a
+    assert level(9) != a
+    random.seed()
+
+def test_level_key_names_seed_and_generator_version():
+    from Logic.logic_setup import GENERATOR_VERSION
+    ls = LogicSetup("hard", 6, 6, 2, seed=4)
+    assert ls.level_key == (GENERATOR_VERSION, "hard", 6, 6, 2, 4)
+    assert LogicSetup("hard", 6, 6, 2).seed != LogicSetup("hard", 6, 6, 2).seed
+
+def test_levels_generate_concurrently_in_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    def level(seed):
+        ls = LogicSetup("hard", 12, 12, 3, seed=seed)
+        ls.generate_game()
+        return bytes(ls.matrix.data), [en.complete_patrol_route for en in ls.enemies]
+    seeds = [1, 2, 1, 2]
+    with ThreadPoolExecutor(3) as pool:
+        threaded = list(pool.map(level, seeds))
+    assert threaded == [level(s) for s in seeds]
+
+def test_small_levels_move_every_guard_every_tick(monkeypatch):
+    import Logic.logic_setup as logic_setup
+    ls = LogicSetup("easy", 15, 15, 6, seed=3)
+    ls.generate_game()
+    assert len(ls.enemies) < logic_setup.LOD_MIN_GUARDS
+    monkeypatch.setattr(ls, "handle_input", lambda controls: None)
+    for _ in range(3 * logic_setup.LOD_FAR_INTERVAL):
+        ls.step()
+        for en in ls.enemies:
+            if en.state == "patrol" and en.patrol_phase() is not None:
+                assert en.lod_lag == 0
+                x0, y0 = en.prev_position
+                x1, y1 = en.get_position()
+                assert abs(x1 - x0) + abs(y1 - y0) <= 2 * en.patrol_speed
\ No newline at end of file
@@ -145,3 +145,19 @@ def test_distribute_hidden_rooms_marks_dead_ends(limit, expected_total):
                         nbrs += 1
                 assert nbrs == 1, f"Cell {(r,c)} was marked hidden but had {nbrs} floor neighbours"
 
+def test_same_seed_same_maze():
+    a = MapCreation("easy", 9, 9, 0, seed=5).generate_maze()
+    random.seed(1)  # the global RNG plays no part
+    assert MapCreation("easy", 9, 9, 0, seed=5).generate_maze() == a
+    assert MapCreation("easy", 9, 9, 0, seed=6).generate_maze() != a
+
+def test_unseeded_maze_records_its_seed():
+    mc = MapCreation("hard", 5, 5, 0)
+    again = MapCreation("hard", 5, 5, 0, seed=mc.seed)
+    assert mc.generate_maze() == again.generate_maze()
+
+def test_carve_is_not_recursive():
+    """A 100x100 DFS is far deeper than Python's recursion limit."""
+    maze = MapCreation("hard", 100, 100, 0, seed=3).create_maze_map()
+    assert (len(maze), len(maze[0])) == (201, 201)
+    assert maze.count(T_FLOOR) > 100 * 100
\ No newline at end of file
@@ -0,0 +1,63 @@
+# tests/test_nearest_walkable.py
+import random
+from collections import deque
+import pytest
+from Logic.nearest_walkable import NearestWalkable
+
+def bfs_nearest(walkable, R, C, cell):
+    """Reference: Enemy.find_nearest_walkable's BFS on a flat bitmap."""
+    def ok(c, r):
+        return walkable[r * C + c] == 1
+    if ok(*cell):
+        return cell
+    queue, seen = deque([cell]), {cell}
+    while queue:
+        c, r = queue.popleft()
+        for nb in ((c + 1, r), (c - 1, r), (c, r + 1), (c, r - 1)):
+            if 0 <= nb[0] < C and 0 <= nb[1] < R and nb not in seen:
+                seen.add(nb)
+                if ok(*nb):
+                    return nb
+                queue.append(nb)
+    return None
+
+def random_bitmap(R, C, density, seed):
+    rng = random.Random(seed)
+    return bytearray(1 if rng.random() < density else 0 for _ in range(R * C))
+
+def assert_matches_bfs(nw, walkable, R, C):
+    for r in range(R):
+        for c in range(C):
+            assert nw.lookup((c, r)) == bfs_nearest(walkable, R, C, (c, r)), (c, r)
+
+@pytest.mark.parametrize("density,seed", [(0.05, 1), (0.2, 2), (0.5, 3), (0.9, 4)])
+def test_lookup_matches_per_cell_bfs(density, seed):
+    R, C = 13, 17
+    walkable = random_bitmap(R, C, density, seed)
+    assert_matches_bfs(NearestWalkable(walkable, R, C), walkable, R, C)
+
+def test_no_walkable_cells():
+    nw = NearestWalkable(bytearray(12), 3, 4)
+    assert nw.lookup((1, 1)) is None
+    assert nw.lookup((-1, 0)) is None
+
+@pytest.mark.parametrize("seed", range(5))
+def test_patch_new_walkable_cell_matches_rebuild(seed):
+    R, C = 11, 14
+    walkable = random_bitmap(R, C, 0.1, seed)
+    nw = NearestWalkable(walkable, R, C)
+    rng = random.Random(seed)
+    for _ in range(10):
+        i = rng.randrange(R * C)
+        walkable[i] = 1
+        nw.patch((i % C, i // C))
+    assert nw.builds == 1
+    assert_matches_bfs(nw, walkable, R, C)
+
+def test_patch_cell_turning_unwalkable_rebuilds():
+    walkable = bytearray([1, 1, 0, 0])
+    nw = NearestWalkable(walkable, 1, 4)
+    walkable[1] = 0
+    nw.patch((1, 0))
+    assert nw.builds == 2
+    assert nw.lookup((3, 0)) == (0, 0)
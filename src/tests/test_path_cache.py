@@ -0,0 +1,75 @@
+# tests/test_path_cache.py
+import pytest
+from Logic.path_cache import LRUCache, PathCache
+
+@pytest.fixture
+def open_3x3():
+    return [[1]*3 for _ in range(3)]
+
+def make_cache(matrix, capacity=4):
+    return PathCache(matrix, len(matrix), len(matrix[0]), capacity=capacity)
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(2)
+    lru.put('a', 1)
+    lru.put('b', 2)
+    assert lru.get('a') == 1      # 'a' is now most recent
+    lru.put('c', 3)               # evicts 'b'
+    assert lru.get('b') is None
+    assert lru.get('c') == 3
+    assert lru.stats() == {'size': 2, 'capacity': 2,
+                           'hits': 2, 'misses': 1, 'evictions': 1}
+
+@pytest.mark.parametrize("start,goal,expected", [
+    ((0,0), (0,0), [(0,0)]),
+    ((0,0), (2,0), [(0,0),(1,0),(2,0)]),
+    ((0,0), (0,2), [(0,0),(0,1),(0,2)]),
+])
+def test_path_trivial(open_3x3, start, goal, expected):
+    assert make_cache(open_3x3).path(start, goal) == expected
+
+def test_path_is_shortest_and_connected(open_3x3):
+    path = make_cache(open_3x3).path((0,0), (2,2))
+    assert path[0] == (0,0) and path[-1] == (2,2)
+    assert len(path) == 5
+    for (c0, r0), (c1, r1) in zip(path, path[1:]):
+        assert abs(c0-c1) + abs(r0-r1) == 1
+
+def test_path_blocked_or_unreachable(open_3x3):
+    open_3x3[0][0] = 0
+    cache = make_cache(open_3x3)
+    assert cache.path((0,0), (2,2)) == []
+    assert cache.path((2,2), (0,0)) == []
+    for r in range(3):
+        open_3x3[r][1] = 0
+    cache.invalidate()
+    assert cache.path((0,2), (2,2)) == []
+    assert cache.path((0,2), (5,5)) == []
+
+def test_trees_are_reused_per_goal(open_3x3):
+    cache = make_cache(open_3x3)
+    cache.path((0,0), (2,2))
+    cache.path((1,0), (2,2))
+    cache.path((0,2), (2,2))
+    assert (cache.hits, cache.misses) == (2, 1)
+
+def test_capacity_bounds_number_of_trees(open_3x3):
+    cache = make_cache(open_3x3, capacity=2)
+    for goal in [(0,0), (1,1), (2,2)]:
+        cache.path((0,1), goal)
+    assert cache.stats()['size'] == 2
+    assert cache.stats()['evictions'] == 1
+
+def test_invalidate_drops_stale_trees(open_3x3):
+    cache = make_cache(open_3x3)
+    assert len(cache.path((0,0), (2,0))) == 3
+    open_3x3[0][1] = 0
+    cache.invalidate()
+    assert len(cache.path((0,0), (2,0))) == 5
+
+def test_custom_passable_region():
+    region = {(0,0), (1,0), (1,1)}
+    cache = PathCache([[1]*2 for _ in range(2)], 2, 2,
+                      passable=lambda c, r: (c, r) in region)
+    assert cache.path((0,0), (1,1)) == [(0,0), (1,0), (1,1)]
+    assert cache.path((0,0), (0,1)) == []
@@ -0,0 +1,78 @@
+# tests/test_pathfinding.py
+import random
+import pytest
+from Logic.pathfinding import (
+    make_pathfinder, BFSPathfinder, AStarPathfinder, BidirectionalPathfinder
+)
+from Logic.map_creation import MapCreation
+
+ENGINE_NAMES = ['bfs', 'astar', 'bidirectional', 'cache', 'corridor', 'hierarchical']
+# engines guaranteed to return shortest paths ('hierarchical' is near-optimal)
+EXACT_ENGINES = ['bfs', 'astar', 'bidirectional', 'cache', 'corridor']
+
+def engine_for(name, matrix):
+    return make_pathfinder(name, matrix, len(matrix), len(matrix[0]))
+
+def assert_valid(matrix, path, start, goal):
+    assert path[0] == start and path[-1] == goal
+    for (c0, r0), (c1, r1) in zip(path, path[1:]):
+        assert abs(c0-c1) + abs(r0-r1) == 1
+        assert matrix[r1][c1] != 0
+
+@pytest.fixture
+def maze():
+    return MapCreation("easy", 10, 10, 0, seed=3).generate_maze()
+
+@pytest.mark.parametrize("name", ENGINE_NAMES)
+def test_trivial_cases(name):
+    m = [[1, 1, 1],
+         [0, 0, 1],
+         [1, 1, 1]]
+    engine = engine_for(name, m)
+    assert engine.find_path((0,0), (0,0)) == [(0,0)]
+    assert engine.find_path((0,0), (0,1)) == []      # goal is a wall
+    assert engine.find_path((0,0), (5,5)) == []      # out of bounds
+    path = engine.find_path((0,0), (0,2))
+    assert len(path) == 7
+    assert_valid(m, path, (0,0), (0,2))
+
+@pytest.mark.parametrize("name", ENGINE_NAMES)
+def test_unreachable(name):
+    m = [[1, 0, 1],
+         [1, 0, 1]]
+    assert engine_for(name, m).find_path((0,0), (2,1)) == []
+
+@pytest.mark.parametrize("name", EXACT_ENGINES)
+def test_engines_agree_on_length(maze, name):
+    """Every engine must return a shortest path (same length as BFS)."""
+    floors = [(c, r) for r, row in enumerate(maze) for c, v in enumerate(row) if v == 1]
+    rng = random.Random(11)
+    bfs, engine = engine_for('bfs', maze), engine_for(name, maze)
+    for _ in range(40):
+        a, b = rng.choice(floors), rng.choice(floors)
+        expected = bfs.find_path(a, b)
+        path = engine.find_path(a, b)
+        assert len(path) == len(expected)
+        assert_valid(maze, path, a, b)
+
+def test_astar_expands_fewer_nodes_for_near_goals():
+    m = [[1]*60 for _ in range(60)]
+    bfs, astar = engine_for('bfs', m), engine_for('astar', m)
+    bfs.find_path((30,30), (33,30))
+    astar.find_path((30,30), (33,30))
+    assert astar.nodes_expanded < bfs.nodes_expanded
+
+def test_bfs_keeps_enemy_neighbour_order():
+    m = [[1]*3 for _ in range(3)]
+    assert engine_for('bfs', m).find_path((0,0), (2,2)) == [
+        (0,0), (1,0), (2,0), (2,1), (2,2)
+    ]
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        make_pathfinder('dijkstra', [[1]], 1, 1)
+
+def test_engine_registry_names():
+    assert BFSPathfinder.name == 'bfs'
+    assert AStarPathfinder.name == 'astar'
+    assert BidirectionalPathfinder.name == 'bidirectional'
@@ -191,6 +191,28 @@ def test_extract_with_out_of_bounds(out_of_bounds_generator):
     region = out_of_bounds_generator._extract_region()
     assert region == expected
 
+def test_level_region_is_floor_only():
+    # doors, the key and hidden rooms are walkable, but not patrolled
+    from Logic.grid import Grid
+    from Logic.level_layers import LevelLayers
+    terrain = Grid(1, 6)
+    for c, code in enumerate((1, 2, 3, 4, 5, 6)):
+        terrain[0][c] = code
+    gen = PatrolGenerator(
+        matrix=terrain,
+        grid_cols=6,
+        grid_rows=1,
+        tile_size=(10, 10),
+        patrolling_area=(0, 0, 60, 10),
+        enemies=[],
+        difficulty_level=1,
+        base_marker=7,
+        palette=[(0,0,0,0)],
+        level=LevelLayers(terrain, 1, 6),
+        routes=[]
+    )
+    assert gen.extract_region() == {(0, 0), (1, 0)}
+
 #choose_starts
 
 
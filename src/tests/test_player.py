@@ -1,6 +1,6 @@
 import pytest
-import pygame
 from Logic.player import Player
+from Logic.controls import Controls
 from Logic.map_creation import T_WALL, T_FLOOR, T_KEY, T_DOOR_C, T_DOOR_O, T_HIDDEN
 
 @pytest.fixture
@@ -103,25 +103,20 @@ def roomy_player():
                   matrix=matrix,
                   PIXEL_ONE_X=10, PIXEL_ONE_Y=10)
 
-# Utility to simulate a single key press
-def simulate_key(monkeypatch, key):
-    def get_pressed():
-        keys = [False] * 512
-        keys[key] = True
-        return keys
-    monkeypatch.setattr(pygame.key, 'get_pressed', get_pressed)
+# Controls holding a single direction
+def held(direction):
+    return Controls(**{direction: True})
 
 @pytest.mark.parametrize("key, attr, sign", [
-    (pygame.K_w, 'pos_Y', -1),  # up: decrease Y
-    (pygame.K_s, 'pos_Y',  1),  # down: increase Y
-    (pygame.K_a, 'pos_X', -1),  # left: decrease X
-    (pygame.K_d, 'pos_X',  1),  # right: increase X
+    ('up',    'pos_Y', -1),  # up: decrease Y
+    ('down',  'pos_Y',  1),  # down: increase Y
+    ('left',  'pos_X', -1),  # left: decrease X
+    ('right', 'pos_X',  1),  # right: increase X
 ])
-def test_move_directions(monkeypatch, roomy_player, key, attr, sign):
+def test_move_directions(roomy_player, key, attr, sign):
     """Test movement in all four directions via parametrize."""
     initial = getattr(roomy_player, attr)
-    simulate_key(monkeypatch, key)
-    roomy_player.move()
+    roomy_player.move(held(key))
     updated = getattr(roomy_player, attr)
     if sign < 0:
         assert updated < initial, f"Expected {attr} < {initial}, got {updated}"
@@ -129,7 +124,7 @@ def test_move_directions(monkeypatch, roomy_player, key, attr, sign):
         assert updated > initial, f"Expected {attr} > {initial}, got {updated}"
 
 
-def test_key_pickup(monkeypatch, roomy_player):
+def test_key_pickup(roomy_player):
     """Moving onto a key tile should set has_key and clear the tile."""
     # Increase speed so single move crosses into the next cell
     roomy_player.speed = roomy_player.PIXEL_ONE_X
@@ -137,23 +132,21 @@ def test_key_pickup(monkeypatch, roomy_player):
     col, row = roomy_player.pixel_to_grid((50,50))
     roomy_player.matrix[row][col+1] = T_KEY
 
-    simulate_key(monkeypatch, pygame.K_d)
-    roomy_player.move()
+    roomy_player.move(held('right'))
     assert roomy_player.has_key, "Player did not pick up the key after moving onto it"
     # original key cell becomes floor
     assert roomy_player.matrix[row][col+1] == T_FLOOR
 
-def test_closed_door_block(monkeypatch, roomy_player):
+def test_closed_door_block(roomy_player):
     """Moving onto a closed door without a key should rollback to start."""
     col, row = roomy_player.pixel_to_grid((50,50))
     roomy_player.matrix[row][col-1] = T_DOOR_C
     initial = (roomy_player.pos_X, roomy_player.pos_Y)
-    simulate_key(monkeypatch, pygame.K_a)
-    roomy_player.move()
+    roomy_player.move(held('left'))
     assert (roomy_player.pos_X, roomy_player.pos_Y) == initial
 
 
-def test_open_door_win(monkeypatch, roomy_player):
+def test_open_door_win(roomy_player):
     """Moving onto an open door should set win=True."""
     # Make sure one move crosses into the door cell:
     roomy_player.speed = roomy_player.PIXEL_ONE_X
@@ -161,6 +154,20 @@ def test_open_door_win(monkeypatch, roomy_player):
     col, row = roomy_player.pixel_to_grid((50,50))
     roomy_player.matrix[row+1][col] = T_DOOR_O
 
-    simulate_key(monkeypatch, pygame.K_s)
-    roomy_player.move()
+    roomy_player.move(held('down'))
     assert roomy_player.win, "Player did not win after moving onto an open door"
+
+def test_key_pickup_reports_tile_change(roomy_player):
+    """Player.move must tell the level which tile it rewrote."""
+    changed = []
+    roomy_player.on_tile_change = changed.append
+    roomy_player.speed = roomy_player.PIXEL_ONE_X
+    col, row = roomy_player.pixel_to_grid((50,50))
+    roomy_player.matrix[row][col+1] = T_KEY
+
+    roomy_player.move(held('right'))
+    assert changed == [(col+1, row)]
+
+def test_no_input_no_movement(roomy_player):
+    roomy_player.move()
+    assert (roomy_player.pos_X, roomy_player.pos_Y) == (50, 50)
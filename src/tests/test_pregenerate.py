@@ -0,0 +1,93 @@
+# tests/test_pregenerate.py
+import threading
+import time
+import pytest
+from Logic.pregenerate import LevelPregenerator
+
+@pytest.fixture
+def pregen():
+    pg = LevelPregenerator()
+    yield pg
+    pg.shutdown()
+
+def test_take_hands_over_the_pregenerated_level(pregen):
+    pregen.start("hard", 6, 6, 2, seed=4)
+    logic = pregen.take("hard", 6, 6, 2, seed=4)
+    assert (pregen.hits, pregen.misses) == (1, 0)
+    assert logic.seed == 4 and len(logic.enemies) == 2
+    assert logic.player is not None  # generate_game has run
+
+def test_generated_on_a_worker_thread(pregen, monkeypatch):
+    threads = []
+    build = LevelPregenerator._build
+    def spy(args, kwargs):
+        threads.append(threading.current_thread())
+        return build(args, kwargs)
+    monkeypatch.setattr(LevelPregenerator, "_build", staticmethod(spy))
+    pregen.start("easy", 5, 5, 1)
+    pregen.take("easy", 5, 5, 1)
+    assert threads and threads[0] is not threading.main_thread()
+
+def test_other_spec_is_generated_inline(pregen):
+    pregen.start("hard", 6, 6, 2, seed=4)
+    logic = pregen.take("hard", 7, 7, 2, seed=4)
+    assert (pregen.hits, pregen.misses) == (0, 1)
+    assert len(logic.matrix) == 15
+    assert pregen.pending is None
+
+def test_restarting_the_same_spec_keeps_the_job(pregen):
+    pregen.start("hard", 6, 6, 1, seed=2)
+    job = pregen.pending
+    pregen.start("hard", 6, 6, 1, seed=2)
+    assert pregen.pending is job
+
+def test_matches_inline_generation(pregen):
+    from Logic.logic_setup import LogicSetup
+    pregen.start("easy", 8, 8, 3, seed=12)
+    bg = pregen.take("easy", 8, 8, 3, seed=12)
+    fg = LogicSetup("easy", 8, 8, 3, seed=12)
+    fg.generate_game()
+    assert bg.matrix == fg.matrix
+    assert [en.complete_patrol_route for en in bg.enemies] == \
+           [en.complete_patrol_route for en in fg.enemies]
+
+def test_errors_surface_on_take(pregen):
+    pregen.start("hard", 6, 6, 1, pathfinder='no-such-engine')
+    with pytest.raises(ValueError, match="unknown pathfinder engine 'no-such-engine'"):
+        pregen.take("hard", 6, 6, 1, pathfinder='no-such-engine')
+
+def slow_build(monkeypatch, rows):
+    """Make builds of `rows` block until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+    build = LevelPregenerator._build
+    def slow(args, kwargs):
+        if args[1] == rows:
+            started.set()
+            release.wait(5)
+        return build(args, kwargs)
+    monkeypatch.setattr(LevelPregenerator, "_build", staticmethod(slow))
+    return started, release
+
+def test_changed_spec_does_not_wait_for_a_stale_build(pregen, monkeypatch):
+    started, release = slow_build(monkeypatch, 6)
+    pregen.start("hard", 6, 6, 1, seed=1)
+    assert started.wait(5)
+    pregen.start("hard", 7, 7, 1, seed=1)
+    assert pregen.pending[1] is None  # not queued behind the running build
+    logic = pregen.take("hard", 7, 7, 1, seed=1)
+    assert not release.is_set()  # taken while the stale build still ran
+    assert (pregen.hits, pregen.misses) == (0, 1) and len(logic.matrix) == 15
+    release.set()
+
+def test_changed_spec_starts_once_the_worker_is_free(pregen, monkeypatch):
+    started, release = slow_build(monkeypatch, 6)
+    pregen.start("hard", 6, 6, 1, seed=1)
+    assert started.wait(5)
+    pregen.start("hard", 7, 7, 1, seed=1)
+    release.set()
+    deadline = time.monotonic() + 5
+    while pregen.pending[1] is None and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert pregen.pending[1] is not None
+    logic = pregen.take("hard", 7, 7, 1, seed=1)
+    assert (pregen.hits, pregen.misses) == (1, 0) and len(logic.matrix) == 15
\ No newline at end of file
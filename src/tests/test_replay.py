@@ -0,0 +1,88 @@
+# tests/test_replay.py
+import pytest
+from Logic.controls import Controls, NO_INPUT
+from Logic.autopilot import Autopilot
+from Logic.logic_setup import SWARM_MIN_GUARDS
+from Logic.replay import (
+    ReplayWriter, ReplayReader, Playback, Divergence,
+    make_logic, encode, decode, state_checksum, HEADER,
+)
+
+SPEC = ('hard', 6, 6, 2)
+SEED = 3
+
+def record(path, ticks=300, checksum_every=10, chunk=64, spec=SPEC):
+    """Play spec with the autopilot and record it; returns the final checksum."""
+    logic = make_logic(*spec, SEED)
+    bot = Autopilot(logic, SEED)
+    with ReplayWriter(path, *spec, SEED, checksum_every=checksum_every, chunk=chunk) as rec:
+        for tick in range(ticks):
+            controls = bot(logic)
+            result = logic.step(controls)
+            rec.record(controls, logic, paused=(tick == 5))
+            if result['won'] or result['lost']:
+                break
+    return logic.ticks, state_checksum(logic)
+
+def test_encode_decode_roundtrip():
+    for controls in (NO_INPUT, Controls(up=True, left=True), Controls(True, True, True, True)):
+        for paused in (False, True):
+            assert decode(encode(controls, paused)) == (controls, paused)
+
+def test_one_byte_per_step(tmp_path):
+    path = tmp_path / 'game.rpl'
+    ticks, _ = record(path, checksum_every=10)
+    reader = ReplayReader(path)
+    assert (reader.difficulty, reader.rows, reader.cols, reader.enemy_count, reader.seed) == \
+           (*SPEC, SEED)
+    assert len(reader.data) == ticks + 4 * (ticks // 10)
+
+def test_playback_reproduces_the_game(tmp_path):
+    path = tmp_path / 'game.rpl'
+    ticks, final = record(path)
+    playback = Playback(ReplayReader(path))
+    playback.run()
+    assert playback.logic.ticks == ticks
+    assert playback.checked == ticks // 10
+    assert playback.pauses == 1
+    assert state_checksum(playback.logic) == final
+
+def test_swarm_sized_levels_replay_on_the_per_guard_path(tmp_path):
+    # enough guards for swarm='auto' to pick the NumPy swarm; recordings
+    # must not depend on whether NumPy is installed
+    spec = ('easy', 12, 12, SWARM_MIN_GUARDS)
+    assert make_logic(*spec, SEED).swarm is None
+    path = tmp_path / 'game.rpl'
+    ticks, final = record(path, ticks=60, spec=spec)
+    playback = Playback(ReplayReader(path))
+    playback.run()
+    assert playback.logic.swarm is None
+    assert playback.checked == ticks // 10
+    assert state_checksum(playback.logic) == final
+
+def test_divergence_is_detected(tmp_path):
+    path = tmp_path / 'game.rpl'
+    record(path)
+    data = bytearray(path.read_bytes())
+    start = HEADER.size + 1 + len(SPEC[0])
+    data[start] ^= 0x0F  # flip the first step's inputs
+    path.write_bytes(data)
+    with pytest.raises(Divergence) as err:
+        Playback(ReplayReader(path)).run()
+    assert err.value.tick == 10
+
+def test_truncated_replay_plays_what_it_has(tmp_path):
+    path = tmp_path / 'game.rpl'
+    ticks, _ = record(path, ticks=100)
+    data = path.read_bytes()
+    path.write_bytes(data[:-2])
+    playback = Playback(ReplayReader(path))
+    playback.run()
+    # the cut lands in the last checksum (drop that step) or in plain steps
+    assert playback.logic.ticks == (ticks - 1 if ticks % 10 == 0 else ticks - 2)
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'junk.rpl'
+    path.write_bytes(b'not a replay at all, honestly')
+    with pytest.raises(ValueError):
+        ReplayReader(path)
\ No newline at end of file
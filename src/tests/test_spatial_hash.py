@@ -0,0 +1,66 @@
+# tests/test_spatial_hash.py
+import pytest
+from Logic.spatial_hash import SpatialHash
+
+class Thing:
+    def __init__(self, name):
+        self.name = name
+
+@pytest.fixture
+def grid():
+    sh = SpatialHash()
+    things = {n: Thing(n) for n in "abcd"}
+    sh.insert(things['a'], (0, 0))
+    sh.insert(things['b'], (0, 0))
+    sh.insert(things['c'], (2, 1))
+    sh.insert(things['d'], (9, 9))
+    return sh, things
+
+def names(found):
+    return sorted(t.name for t in found)
+
+def test_at(grid):
+    sh, _ = grid
+    assert names(sh.at((0, 0))) == ['a', 'b']
+    assert sh.at((5, 5)) == []
+
+@pytest.mark.parametrize("cell,k,expected", [
+    ((0, 0), 0, ['a', 'b']),
+    ((0, 0), 2, ['a', 'b']),
+    ((0, 0), 3, ['a', 'b', 'c']),
+    ((2, 1), 1, ['c']),
+    ((9, 9), 20, ['a', 'b', 'c', 'd']),
+])
+def test_within_is_manhattan(grid, cell, k, expected):
+    sh, _ = grid
+    assert names(sh.within(cell, k)) == expected
+
+def test_within_dense_path_agrees():
+    sh = SpatialHash()
+    things = [Thing(i) for i in range(400)]
+    for i, t in enumerate(things):
+        sh.insert(t, (i % 20, i // 20))
+    found = sh.within((10, 10), 2)
+    assert sorted(t.name for t in found) == sorted(
+        i for i in range(400) if abs(i % 20 - 10) + abs(i // 20 - 10) <= 2)
+
+def test_move_relocates_and_drops_empty_buckets(grid):
+    sh, t = grid
+    sh.move(t['c'], (3, 1))
+    assert sh.cell_of(t['c']) == (3, 1)
+    assert (2, 1) not in sh.buckets
+    assert sh.at((3, 1)) == [t['c']]
+    sh.move(t['c'], (3, 1))  # same cell: nothing changes
+    assert sh.at((3, 1)) == [t['c']]
+
+def test_remove(grid):
+    sh, t = grid
+    sh.remove(t['a'])
+    sh.remove(t['a'])
+    assert t['a'] not in sh and len(sh) == 3
+    assert sh.at((0, 0)) == [t['b']]
+
+def test_pairs_within(grid):
+    sh, t = grid
+    assert [names(p) for p in sh.pairs_within(0)] == [['a', 'b']]
+    assert sorted(names(p) for p in sh.pairs_within(3)) == [['a', 'b'], ['a', 'c'], ['b', 'c']]
@@ -0,0 +1,47 @@
+# tests/test_visibility.py
+import random
+import pytest
+from Logic.visibility import VisibilitySet, bresenham
+
+def random_solid(rows, cols, seed, density=0.3):
+    rng = random.Random(seed)
+    return bytearray(1 if rng.random() < density else 0 for _ in range(rows * cols))
+
+def walk_line(solid, cols, src, dst):
+    return all(not solid[r * cols + c] for c, r in bresenham(*src, *dst))
+
+def test_bresenham_includes_both_ends():
+    assert bresenham(0, 0, 3, 1) == [(0, 0), (1, 0), (2, 1), (3, 1)]
+    assert bresenham(2, 2, 2, 2) == [(2, 2)]
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_matches_walking_the_line(seed):
+    rows, cols = 12, 15
+    solid = random_solid(rows, cols, seed)
+    pvs = VisibilitySet(solid, rows, cols, radius=4)
+    for sr in range(rows):
+        for sc in range(cols):
+            for dr in range(max(0, sr - 4), min(rows, sr + 5)):
+                for dc in range(max(0, sc - 4), min(cols, sc + 5)):
+                    assert pvs.visible((sc, sr), (dc, dr)) == \
+                        walk_line(solid, cols, (sc, sr), (dc, dr))
+
+def test_outside_window_is_left_to_the_caller():
+    pvs = VisibilitySet(bytearray(100), 10, 10, radius=3)
+    assert pvs.visible((0, 0), (4, 0)) is None
+    assert pvs.visible((0, 0), (3, 3)) is True
+
+def test_patch_after_solidity_change():
+    solid = bytearray(9)
+    pvs = VisibilitySet(solid, 3, 3, radius=2)
+    assert pvs.visible((0, 1), (2, 1))
+    solid[1 * 3 + 1] = 1
+    pvs.patch((1, 1))
+    assert not pvs.visible((0, 1), (2, 1))
+    assert pvs.builds == 2
+
+def test_build_100x100_is_fast():
+    pvs = VisibilitySet(random_solid(100, 100, 7), 100, 100)
+    assert pvs.build_time < 1.0
+    src, dst = (50, 50), (53, 48)
+    assert pvs.visible(src, dst) == walk_line(pvs.solid, 100, src, dst)
@@ -0,0 +1,51 @@
+# tests/test_vision.py
+import pytest
+from Logic.vision import VisionCones, shadowcast
+
+def open_cones(size=11, **kw):
+    return VisionCones(bytearray(size * size), size, size, **kw)
+
+def test_shadowcast_open_room_is_a_disc():
+    cones = open_cones()
+    seen = shadowcast((5, 5), 4, cones.blocks)
+    disc = {(x, y) for x in range(11) for y in range(11)
+            if (x - 5) ** 2 + (y - 5) ** 2 <= 16}
+    assert seen == disc
+
+def test_wall_casts_a_shadow():
+    cones = open_cones()
+    cones.solid[5 * 11 + 6] = 1  # wall right in front, at (6,5)
+    cone = cones.cone((5, 5), 'right')
+    assert (6, 5) in cone              # the wall itself is seen
+    assert (7, 5) not in cone and (8, 5) not in cone
+    assert (7, 4) in cone              # but not what's beside it
+
+@pytest.mark.parametrize("facing, ahead, behind", [
+    ('right', (8, 5), (2, 5)),
+    ('left',  (2, 5), (8, 5)),
+    ('up',    (5, 2), (5, 8)),
+    ('down',  (5, 8), (5, 2)),
+])
+def test_cone_follows_facing(facing, ahead, behind):
+    cone = open_cones().cone((5, 5), facing)
+    assert (5, 5) in cone
+    assert ahead in cone
+    assert behind not in cone
+    # radius 4 keeps the whole cone inside the 5-step chase range
+    assert all(abs(x - 5) + abs(y - 5) <= 5 for x, y in cone)
+
+def test_cones_are_memoized_and_bounded():
+    cones = open_cones(capacity=2)
+    first = cones.cone((5, 5), 'up')
+    assert cones.cone((5, 5), 'up') is first
+    assert cones.computed == 1
+    cones.cone((4, 5), 'up')
+    cones.cone((3, 5), 'up')
+    assert len(cones.cache) == 2
+    cones.invalidate()
+    cones.cone((5, 5), 'up')
+    assert cones.computed == 4
+
+def test_cone_stays_on_the_map():
+    cone = open_cones(5).cone((0, 0), 'left')
+    assert cone == {(0, 0)}